@@ -78,6 +78,36 @@ def validate_jira_config(config: Dict) -> List[str]:
         elif len(key) < 2 or len(key) > 10:
             errors.append("jira.defaultProjectKey must be 2-10 characters")
 
+    # Validate createmetaTtl
+    if 'createmetaTtl' in jira:
+        ttl = jira['createmetaTtl']
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool):
+            errors.append("jira.createmetaTtl must be a number")
+        elif ttl < 0:
+            errors.append("jira.createmetaTtl must not be negative")
+
+    # Validate http
+    if 'http' in jira:
+        http = jira['http']
+        if not isinstance(http, dict):
+            errors.append("jira.http must be an object")
+        else:
+            for int_field, minimum in (('poolSize', 1), ('maxRetries', 0)):
+                if int_field in http:
+                    value = http[int_field]
+                    if not isinstance(value, int) or isinstance(value, bool):
+                        errors.append(f"jira.http.{int_field} must be an integer")
+                    elif value < minimum:
+                        errors.append(f"jira.http.{int_field} must be at least {minimum}")
+            for number_field in ('connectTimeout', 'readTimeout', 'backoffBase', 'backoffMax',
+                                 'requestsPerSecond', 'maxRequestsPerSecond'):
+                if number_field in http:
+                    value = http[number_field]
+                    if not isinstance(value, (int, float)) or isinstance(value, bool):
+                        errors.append(f"jira.http.{number_field} must be a number")
+                    elif value <= 0:
+                        errors.append(f"jira.http.{number_field} must be greater than 0")
+
     return errors
 
 
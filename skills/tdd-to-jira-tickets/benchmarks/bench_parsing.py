@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the parsing and conversion hot paths.
+
+Times each function on synthetic plans of 10, 100, 1k and 10k tickets
+(see plan_generator.py) and records the best wall time over a few runs
+plus the peak traced allocation of a separate run:
+- parse_markdown_tickets  - the whole plan
+- markdown_to_adf         - every ticket's description
+- parse_inline_formatting - every line of every description
+- extract_dependencies    - the plan's Blocks graph against a full mapping
+- update_markdown_with_jira_keys - writing a Jira key into every ticket
+
+Results are compared with baseline.json next to this file; anything
+slower or bigger than the baseline by more than the tolerance is
+reported as a regression and the exit status is 1. Machines differ, so
+re-record the baseline (--update-baseline) on the machine you compare on.
+
+Usage:
+    python benchmarks/bench_parsing.py [--sizes 10 100 1000 10000] [--repeat 3]
+        [--only NAME] [--baseline PATH] [--update-baseline] [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import create_jira_tickets_and_links as tool  # noqa: E402
+from plan_generator import generate_plan  # noqa: E402
+
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+DEFAULT_TOLERANCE = 0.25
+# Differences below these are noise whatever the ratio
+MIN_SECONDS_DELTA = 0.002
+MIN_BYTES_DELTA = 64 * 1024
+
+# A case prepares its input outside the timed region: setup() → (function, args)
+Case = Callable[[str, List[tool.Ticket], str], Tuple[Callable, tuple]]
+
+
+def _adf_all(descriptions: List[str]):
+    for description in descriptions:
+        tool.markdown_to_adf(description)
+
+
+def _inline_all(lines: List[str]):
+    for line in lines:
+        tool.parse_inline_formatting(line)
+
+
+def _update_quietly(path: str, mapping: Dict[str, str]):
+    with contextlib.redirect_stdout(io.StringIO()):
+        tool.update_markdown_with_jira_keys(path, mapping)
+
+
+def case_parse(content: str, tickets: List[tool.Ticket], workdir: str):
+    return tool.parse_markdown_tickets, (content,)
+
+
+def case_adf(content: str, tickets: List[tool.Ticket], workdir: str):
+    return _adf_all, ([ticket.description for ticket in tickets],)
+
+
+def case_inline(content: str, tickets: List[tool.Ticket], workdir: str):
+    lines = [line for ticket in tickets for line in ticket.description.split('\n') if line.strip()]
+    return _inline_all, (lines,)
+
+
+def case_dependencies(content: str, tickets: List[tool.Ticket], workdir: str):
+    mapping = {ticket.key: f"PX-{10000 + i}" for i, ticket in enumerate(tickets)}
+    return tool.extract_dependencies, (tickets, mapping)
+
+
+def case_update_markdown(content: str, tickets: List[tool.Ticket], workdir: str):
+    path = os.path.join(workdir, 'plan.md')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    mapping = {ticket.key: f"PX-{10000 + i}" for i, ticket in enumerate(tickets)}
+    return _update_quietly, (path, mapping)
+
+
+CASES: Dict[str, Case] = {
+    'parse_markdown_tickets': case_parse,
+    'markdown_to_adf': case_adf,
+    'parse_inline_formatting': case_inline,
+    'extract_dependencies': case_dependencies,
+    'update_markdown_with_jira_keys': case_update_markdown,
+}
+
+
+def measure(case: Case, content: str, tickets: List[tool.Ticket], repeat: int) -> Dict[str, float]:
+    """Best wall time over ``repeat`` runs, then peak traced memory of one more run."""
+    with tempfile.TemporaryDirectory() as workdir:
+        best = float('inf')
+        for _ in range(repeat):
+            function, args = case(content, tickets, workdir)
+            gc.collect()
+            start = time.perf_counter()
+            function(*args)
+            best = min(best, time.perf_counter() - start)
+
+        function, args = case(content, tickets, workdir)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {'seconds': round(best, 6), 'peak_bytes': peak}
+
+
+def run(sizes: List[int], names: List[str], repeat: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Run every case at every size; returns case → size → measurement."""
+    results = {name: {} for name in names}
+    for size in sizes:
+        content = generate_plan(size)
+        tickets = tool.parse_markdown_tickets(content)
+        # Fewer repeats on big plans keep a full run to a couple of minutes
+        runs = max(1, repeat if size < 10000 else repeat // 2)
+        for name in names:
+            result = measure(CASES[name], content, tickets, runs)
+            results[name][str(size)] = result
+            print(f"  {name:<32} {size:>6} tickets  {result['seconds'] * 1000:>10.2f} ms  "
+                  f"{result['peak_bytes'] / 1024 / 1024:>8.2f} MB peak")
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Describe every measurement that is worse than the baseline by more than ``tolerance``."""
+    regressions = []
+    for name, sizes in results.items():
+        for size, result in sizes.items():
+            before = baseline.get('results', {}).get(name, {}).get(size)
+            if before is None:
+                continue
+            for metric, floor, unit, scale in (('seconds', MIN_SECONDS_DELTA, 'ms', 1000),
+                                               ('peak_bytes', MIN_BYTES_DELTA, 'MB', 1 / 1024 / 1024)):
+                old, new = before[metric], result[metric]
+                if new > old * (1 + tolerance) and new - old > floor:
+                    regressions.append(f"{name} @ {size}: {metric} {old * scale:.2f} → {new * scale:.2f} {unit} "
+                                       f"(+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the plan parsing and conversion hot paths.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), metavar='N',
+                        help="Plan sizes in tickets (default: 10 100 1000 10000)")
+    parser.add_argument('--repeat', type=int, default=3, metavar='N',
+                        help="Timed runs per case; the best is kept (default: 3)")
+    parser.add_argument('--only', action='append', choices=sorted(CASES), metavar='NAME',
+                        help=f"Run only this case; repeatable ({', '.join(CASES)})")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline JSON to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Write these results to the baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, metavar='FRACTION',
+                        help="Allowed slowdown or growth before a result counts as a regression (default: 0.25)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    names = args.only or list(CASES)
+
+    print(f"Benchmarking {len(names)} cases at {', '.join(map(str, args.sizes))} tickets")
+    results = run(args.sizes, names, args.repeat)
+
+    baseline = None
+    if args.baseline.exists():
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        merged = baseline.get('results', {}) if baseline else {}
+        for name, sizes in results.items():
+            merged.setdefault(name, {}).update(sizes)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'environment': environment(),
+                'results': merged,
+            }, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\n✓ Baseline written to {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"\n⚠ No baseline at {args.baseline}; record one with --update-baseline")
+        return
+    if baseline.get('environment') != environment():
+        print(f"\n⚠ Baseline was recorded on {baseline.get('environment')}; timings may not be comparable")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"\n✓ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Startup time and import regression check.
+
+The paths that never talk to Jira should start quickly, so the script
+imports configuration, requests (through jira_client), mistletoe and the
+profiling modules only in the phases that use them. For each scenario
+this benchmark runs a fresh interpreter that imports the script and
+parses the scenario's arguments, and fails when:
+- any module in HEAVY_MODULES was imported by then
+- the configuration was loaded by then
+- the import plus argument parsing took longer than --import-budget
+
+It also times the whole command end to end (best of --repeat runs) and
+fails when --help, or --check on a 100-ticket plan, takes longer than
+--budget. --check reads only the plan's headings and metadata lines, so
+it never imports mistletoe. The --dry-run time is reported for
+information only: it parses the whole plan, which means importing
+mistletoe (about a quarter of a second on its own). The bare
+interpreter's startup is printed alongside as the floor nothing here can
+go below.
+
+The import check is deterministic, so tests/test_startup.py runs it on
+every pytest run too; this benchmark adds the timings.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 10] [--budget 0.1] [--import-budget 0.05]
+        [--only NAME]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR))
+
+from plan_generator import generate_plan  # noqa: E402
+
+
+SCRIPT = SKILL_DIR / 'create_jira_tickets_and_links.py'
+DEFAULT_REPEAT = 10
+DEFAULT_BUDGET = 0.1
+DEFAULT_IMPORT_BUDGET = 0.05
+
+# Modules that must not be imported before a phase needs them
+HEAVY_MODULES = ('requests', 'urllib3', 'mistletoe', 'jira_client', 'jira_meta', 'parse_cache',
+                 'concurrent.futures', 'cProfile', 'pstats', 'tracemalloc')
+
+# Scenario → script arguments; {plan} is replaced by a generated plan's path
+SCENARIOS = {
+    'help': ['--help'],
+    'check': ['{plan}', '--check'],
+    'dry-run': ['{plan}', '--dry-run', '--no-cache'],
+}
+# Scenarios whose end-to-end time is held to --budget
+BUDGETED = ('help', 'check')
+
+# Run in a fresh interpreter: import the script, parse argv, report what was loaded
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import create_jira_tickets_and_links as tool
+try:
+    tool.parse_args(sys.argv[3:])
+except SystemExit:
+    pass
+seconds = time.perf_counter() - start
+heavy = json.loads(sys.argv[2])
+print(json.dumps({
+    'seconds': seconds,
+    'loaded': [name for name in heavy if name in sys.modules],
+    'config_loaded': tool._config is not None,
+}))
+"""
+
+
+def scenario_args(name: str, plan: str) -> List[str]:
+    return [arg.format(plan=plan) for arg in SCENARIOS[name]]
+
+
+def best_of(command: List[str], repeat: int, env: Dict[str, str], cwd: str) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def probe(args: List[str], repeat: int, env: Dict[str, str], cwd: str) -> Dict:
+    """Import and argument parsing in a fresh interpreter, best of ``repeat``."""
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, '-c', PROBE, str(SKILL_DIR), json.dumps(HEAVY_MODULES), *args],
+            cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if completed.returncode:
+            raise RuntimeError(f"probe failed:\n{completed.stderr}")
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check the script's startup time and lazy imports.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, metavar='N',
+                        help=f"Runs per measurement; the best is kept (default: {DEFAULT_REPEAT})")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, metavar='SECONDS',
+                        help=f"Allowed end-to-end time for --help and --check (default: {DEFAULT_BUDGET})")
+    parser.add_argument('--import-budget', type=float, default=DEFAULT_IMPORT_BUDGET, metavar='SECONDS',
+                        help=f"Allowed import plus argument parsing time (default: {DEFAULT_IMPORT_BUDGET})")
+    parser.add_argument('--only', action='append', choices=list(SCENARIOS), metavar='NAME',
+                        help=f"Run only this scenario; repeatable ({', '.join(SCENARIOS)})")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    names = args.only or list(SCENARIOS)
+    failures = []
+
+    with tempfile.TemporaryDirectory() as home:
+        plan = os.path.join(home, 'plan.md')
+        with open(plan, 'w', encoding='utf-8') as f:
+            f.write(generate_plan(100))
+        # An empty HOME keeps user config out, and unset credentials keep Jira out
+        env = {key: value for key, value in os.environ.items() if not key.startswith('JIRA_')}
+        env['HOME'] = home
+
+        interpreter = best_of([sys.executable, '-c', 'pass'], args.repeat, env, home)
+        print(f"Interpreter startup: {interpreter * 1000:.1f} ms")
+        print(f"  {'scenario':<10} {'import+args':>12} {'end to end':>11}  loaded early")
+
+        for name in names:
+            script_args = scenario_args(name, plan)
+            result = probe(script_args, args.repeat, env, home)
+            total = best_of([sys.executable, str(SCRIPT), *script_args], args.repeat, env, home)
+            loaded = result['loaded'] + (['config'] if result['config_loaded'] else [])
+            print(f"  {name:<10} {result['seconds'] * 1000:>9.1f} ms {total * 1000:>8.1f} ms  "
+                  f"{', '.join(loaded) or '-'}")
+
+            if loaded:
+                failures.append(f"{name}: imported {', '.join(loaded)} before it was needed")
+            if result['seconds'] > args.import_budget:
+                failures.append(f"{name}: import and argument parsing took {result['seconds'] * 1000:.1f} ms "
+                                f"(budget {args.import_budget * 1000:.0f} ms)")
+            if name in BUDGETED and total > args.budget:
+                failures.append(f"{name}: took {total * 1000:.1f} ms end to end (budget {args.budget * 1000:.0f} ms)")
+
+    if failures:
+        print(f"\n❌ {len(failures)} startup regressions:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\n✓ Startup within budget, nothing heavy imported early")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput of a full run against a simulated tenant.
+
+Starts fake_jira.FakeJiraServer in this process, then runs the complete
+create_jira_tickets_and_links.py flow on a generated plan once per
+execution strategy. Each run gets a fresh fake tenant, plan copy and HOME
+(so no user config or cache leaks in), and reports tickets/sec, links/sec,
+wall time and the requests that reached the server:
+- serial     - one ticket, then one link, at a time (--link-strategy separate)
+- concurrent - --concurrency N, links folded into creates
+- bulk       - --bulk --concurrency N
+- pipelined  - --pipeline --concurrency N --link-strategy separate
+
+Rates are over the whole run's wall time, parse and startup included, so
+strategies compare like for like.
+
+Each run also reports the mean per-request time the script itself measured
+(from --metrics) above the fake's configured latency, and the benchmark
+fails when that overhead exceeds --overhead-budget: a stall in the client
+or the fake (such as Nagle's algorithm holding back keep-alive responses)
+would otherwise show up only as a slower strategy.
+
+Usage:
+    python benchmarks/bench_throughput.py [--sizes 200] [--strategy NAME]
+        [--concurrency 8] [--latency 0.05] [--jitter 0.02] [--rate-limit N]
+        [--error-rate P] [--throttle-rate P] [--overhead-budget 0.01] [--config config.json]
+        [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR))
+
+from fake_jira import FakeJira, FakeJiraServer  # noqa: E402
+from plan_generator import generate_plan  # noqa: E402
+
+
+SCRIPT = SKILL_DIR / 'create_jira_tickets_and_links.py'
+PARENT_KEY = 'PX-9000'
+DEFAULT_SIZES = (200,)
+DEFAULT_CONCURRENCY = 8
+DEFAULT_OVERHEAD_BUDGET = 0.01
+
+# Strategy → script flags; {n} is replaced by --concurrency
+STRATEGIES = {
+    'serial': ['--link-strategy', 'separate'],
+    'concurrent': ['--concurrency', '{n}'],
+    'bulk': ['--bulk', '--concurrency', '{n}'],
+    'pipelined': ['--pipeline', '--concurrency', '{n}', '--link-strategy', 'separate'],
+}
+
+
+def strategy_flags(name: str, concurrency: int) -> List[str]:
+    return [flag.format(n=concurrency) for flag in STRATEGIES[name]]
+
+
+def run_once(server: FakeJiraServer, plan: str, flags: List[str], config: Optional[Path]) -> Dict:
+    """Run the script once against a freshly reset fake tenant and measure it."""
+    server.jira.reset()
+    with tempfile.TemporaryDirectory() as home:
+        if config is not None:
+            os.makedirs(os.path.join(home, '.claude'))
+            shutil.copy(config, os.path.join(home, '.claude', 'config.json'))
+        plan_path = os.path.join(home, 'plan.md')
+        with open(plan_path, 'w', encoding='utf-8') as f:
+            f.write(plan)
+        metrics_path = os.path.join(home, 'metrics.json')
+
+        env = dict(os.environ, HOME=home, JIRA_BASE_URL=server.url,
+                   JIRA_EMAIL='bench@example.com', JIRA_TOKEN='bench')
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, str(SCRIPT), plan_path, '--no-cache',
+                                    '--metrics', metrics_path, *flags],
+                                   cwd=home, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True)
+        wall = time.perf_counter() - start
+        request_seconds = mean_request_seconds(metrics_path)
+
+    stats = server.jira.stats()
+    tickets = stats['issues'] - 1  # minus the seeded Parent
+    links = stats['links']
+    return {
+        'flags': flags,
+        'exit_code': completed.returncode,
+        'wall_seconds': round(wall, 3),
+        'tickets': tickets,
+        'links': links,
+        'tickets_per_second': round(tickets / wall, 2),
+        'links_per_second': round(links / wall, 2),
+        'requests': sum(stats['requests'].values()),
+        'mean_request_seconds': request_seconds,
+        'requests_by_endpoint': stats['requests'],
+        'statuses': stats['statuses'],
+        'faults': stats['faults'],
+        'output_tail': completed.stdout.splitlines()[-15:] if completed.returncode else [],
+    }
+
+
+def mean_request_seconds(metrics_path: str) -> Optional[float]:
+    """Mean latency over every request of a run, from its --metrics file."""
+    try:
+        with open(metrics_path, 'r', encoding='utf-8') as f:
+            endpoints = json.load(f)['endpoints'].values()
+    except (OSError, ValueError, KeyError):
+        return None
+    count = sum(endpoint['count'] for endpoint in endpoints)
+    if not count:
+        return None
+    return sum(endpoint['latency_seconds']['mean'] * endpoint['count'] for endpoint in endpoints) / count
+
+
+def print_table(size: int, results: Dict[str, Dict], expected_latency: float):
+    print(f"\n{size} tickets")
+    print(f"  {'strategy':<12} {'wall s':>8} {'tickets/s':>10} {'links/s':>9} {'requests':>9} "
+          f"{'429/5xx':>8} {'overhead':>9}  flags")
+    for name, result in results.items():
+        pushback = sum(count for status, count in result['statuses'].items() if status == '429' or status[0] == '5')
+        overhead = result['mean_request_seconds']
+        overhead = f"{(overhead - expected_latency) * 1000:.1f} ms" if overhead is not None else '-'
+        print(f"  {name:<12} {result['wall_seconds']:>8.2f} {result['tickets_per_second']:>10.2f} "
+              f"{result['links_per_second']:>9.2f} {result['requests']:>9} {pushback:>8} {overhead:>9}  "
+              f"{' '.join(result['flags'])}")
+        if result['exit_code']:
+            print(f"    ✗ exited with {result['exit_code']}:")
+            for line in result['output_tail']:
+                print(f"      {line}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure full-run throughput per execution strategy "
+                                                 "against an in-process fake Jira.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), metavar='N',
+                        help="Plan sizes in tickets (default: 200)")
+    parser.add_argument('--strategy', action='append', choices=list(STRATEGIES),
+                        help="Run only this strategy; repeatable (default: all)")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, metavar='N',
+                        help=f"Workers for the parallel strategies (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--flags', default='', metavar='"FLAGS"',
+                        help="Extra script flags for every run, e.g. \"--reduce-links\"")
+    parser.add_argument('--latency', type=float, default=0.05, metavar='SECONDS',
+                        help="Fake server latency per request (default: 0.05)")
+    parser.add_argument('--jitter', type=float, default=0.02, metavar='SECONDS',
+                        help="Random extra latency per request (default: 0.02)")
+    parser.add_argument('--rate-limit', type=float, metavar='PER_SECOND',
+                        help="Fake server rate limit (default: unlimited)")
+    parser.add_argument('--error-rate', type=float, default=0.0, metavar='P',
+                        help="Probability of an injected 5xx per request (default: 0)")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, metavar='P',
+                        help="Probability of an injected 429 per request (default: 0)")
+    parser.add_argument('--overhead-budget', type=float, default=DEFAULT_OVERHEAD_BUDGET, metavar='SECONDS',
+                        help="Allowed mean time per request above latency + jitter / 2 "
+                             f"(default: {DEFAULT_OVERHEAD_BUDGET})")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the plan and the fake's faults")
+    parser.add_argument('--config', type=Path,
+                        help="config.json to run with, e.g. to compare jira.http settings")
+    parser.add_argument('--output', type=Path, help="Also write the results as JSON")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    names = args.strategy or list(STRATEGIES)
+    extra = args.flags.split()
+
+    jira = FakeJira(latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit,
+                    error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                    existing=[PARENT_KEY], seed=args.seed)
+    server = FakeJiraServer(jira).start()
+    print(f"Fake Jira at {server.url}: latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms, "
+          f"rate limit {args.rate_limit or 'none'}, 5xx {args.error_rate:.0%}, 429 {args.throttle_rate:.0%}")
+
+    report = {'settings': {key: (str(value) if isinstance(value, Path) else value)
+                           for key, value in vars(args).items()},
+              'results': {}}
+    # Jitter is uniform, so a request takes latency + jitter / 2 on average
+    expected_latency = args.latency + args.jitter / 2
+    failures = []
+    try:
+        for size in args.sizes:
+            plan = generate_plan(size, seed=args.seed, parent=PARENT_KEY)
+            results = {}
+            for name in names:
+                print(f"  running {name} on {size} tickets...", flush=True)
+                results[name] = run_once(server, plan, strategy_flags(name, args.concurrency) + extra,
+                                         args.config)
+                result = results[name]
+                if result['exit_code']:
+                    failures.append(f"{name} on {size} tickets exited with {result['exit_code']}")
+                overhead = (result['mean_request_seconds'] or 0.0) - expected_latency
+                if overhead > args.overhead_budget:
+                    failures.append(f"{name} on {size} tickets: requests took {overhead * 1000:.1f} ms longer "
+                                    f"than the fake's latency on average "
+                                    f"(budget {args.overhead_budget * 1000:.0f} ms)")
+            print_table(size, results, expected_latency)
+            report['results'][str(size)] = results
+    finally:
+        server.stop()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n✓ Results written to {args.output}")
+    if failures:
+        print(f"\n❌ {len(failures)} runs failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Synthetic ticket plans for benchmarks.
+
+Plans follow the format of example-tickets.md: milestones of DB/BL/API/FE/QA
+tickets with metadata, a description section mixing paragraphs, inline
+formatting, checklists, code fences and the occasional table, and Blocks /
+Blocked By fan-out to later tickets. Output depends only on the ticket
+count and seed, so benchmark runs are comparable.
+
+Usage:
+    python plan_generator.py <ticket_count> [--seed N] [--parent PX-9000] > plan.md
+"""
+
+import argparse
+import random
+from typing import List, Optional
+
+
+COMPONENTS = ('DB', 'BL', 'API', 'FE', 'QA')
+LABELS = ('database', 'service', 'api', 'frontend', 'testing', 'security', 'performance', 'observability')
+PRIORITIES = ('Highest', 'High', 'Medium', 'Low')
+STORY_POINTS = ('1', '2', '3', '5', '8')
+TICKETS_PER_MILESTONE = 40
+# Probability of a ticket blocking 0, 1, 2, 3 or 4 later tickets
+FAN_OUT_WEIGHTS = (25, 35, 25, 10, 5)
+
+NOUNS = ('user', 'session', 'token', 'account', 'invoice', 'report', 'webhook', 'queue', 'cache', 'index')
+VERBS = ('Create', 'Implement', 'Validate', 'Expose', 'Migrate', 'Refactor', 'Instrument', 'Harden')
+WORDS = ('the', 'service', 'request', 'response', 'handler', 'schema', 'field', 'endpoint', 'retry',
+         'timeout', 'latency', 'error', 'metric', 'migration', 'column', 'payload', 'client', 'tenant')
+
+
+def _sentence(rng: random.Random, min_words: int = 8, max_words: int = 20) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    if rng.random() < 0.4:
+        position = rng.randrange(len(words))
+        words[position] = f"**{words[position]}**"
+    if rng.random() < 0.4:
+        position = rng.randrange(len(words))
+        words[position] = f"`{rng.choice(NOUNS)}_{rng.choice(WORDS)}`"
+    return ' '.join(words).capitalize() + '.'
+
+
+def _description(rng: random.Random, noun: str) -> List[str]:
+    lines = ['### Description', '', ' '.join(_sentence(rng) for _ in range(rng.randint(1, 3))), '']
+
+    lines += ['#### Acceptance Criteria']
+    lines += [f"- [ ] {_sentence(rng, 4, 12)}" for _ in range(rng.randint(3, 8))]
+    lines.append('')
+
+    lines += ['#### Implementation Details']
+    lines += [f"- {_sentence(rng, 4, 10)}" for _ in range(rng.randint(2, 5))]
+    lines.append('')
+
+    roll = rng.random()
+    if roll < 0.3:
+        lines += [
+            '```python',
+            f"def handle_{noun}(request):",
+            f"    {noun} = repository.get_{noun}(request.id)",
+            f"    return {{'id': {noun}.id, 'status': 'ok'}}",
+            '```',
+            '',
+        ]
+    elif roll < 0.45:
+        lines += [
+            '| Field | Type | Notes |',
+            '| --- | --- | --- |',
+        ]
+        lines += [f"| {rng.choice(WORDS)}_{i} | {rng.choice(('uuid', 'text', 'int', 'timestamp'))} "
+                  f"| {rng.choice(WORDS)} |" for i in range(rng.randint(2, 5))]
+        lines.append('')
+
+    lines += ['#### Related TDD Sections', f"- {noun.capitalize()} section", '']
+    return lines
+
+
+def generate_plan(ticket_count: int, seed: int = 0, parent: str = 'PX-9000',
+                  jira_keys: Optional[int] = None) -> str:
+    """
+    Build a plan of ``ticket_count`` tickets.
+
+    Args:
+        ticket_count: Number of ticket sections
+        seed: Seed for the random choices
+        parent: Jira key every ticket's Parent points at
+        jira_keys: If set, give the first N tickets a ``**Jira Key:**`` line already
+
+    Returns:
+        Markdown text of the whole plan
+    """
+    rng = random.Random(seed)
+    keys = []
+    for position in range(ticket_count):
+        milestone = position // TICKETS_PER_MILESTONE + 1
+        component = COMPONENTS[position % len(COMPONENTS)]
+        keys.append(f"M{milestone}-{component}-{position // len(COMPONENTS) + 1}")
+
+    blocks = [[] for _ in keys]
+    blocked_by = [[] for _ in keys]
+    for position in range(ticket_count):
+        fan_out = rng.choices(range(len(FAN_OUT_WEIGHTS)), FAN_OUT_WEIGHTS)[0]
+        later = range(position + 1, min(position + 1 + TICKETS_PER_MILESTONE, ticket_count))
+        for target in rng.sample(later, min(fan_out, len(later))):
+            # Record the edge on one side only, like hand-written plans mostly do
+            if rng.random() < 0.7:
+                blocks[position].append(keys[target])
+            else:
+                blocked_by[target].append(keys[position])
+
+    lines = []
+    for position, key in enumerate(keys):
+        if position % TICKETS_PER_MILESTONE == 0:
+            lines += [f"# Milestone {position // TICKETS_PER_MILESTONE + 1} - Synthetic Plan", '']
+        noun = rng.choice(NOUNS)
+        lines += [
+            f"## {key}: {rng.choice(VERBS)} {noun} {rng.choice(WORDS)}",
+            '',
+            '**Type:** ' + ('Story' if rng.random() < 0.2 else 'Task'),
+            f"**Parent:** {parent}",
+            f"**Labels:** {', '.join(rng.sample(LABELS, rng.randint(1, 3)))}, milestone-{position // TICKETS_PER_MILESTONE + 1}",
+            f"**Priority:** {rng.choice(PRIORITIES)}",
+            f"**Story Points:** {rng.choice(STORY_POINTS)}",
+            f"**Blocks:** {', '.join(blocks[position]) or '(none)'}",
+            f"**Blocked By:** {', '.join(blocked_by[position]) or '(none)'}",
+        ]
+        if jira_keys is not None and position < jira_keys:
+            lines.append(f"**Jira Key:** PX-{10000 + position}")
+        lines.append('')
+        lines += _description(rng, noun)
+        lines += ['---', '']
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a synthetic ticket plan.")
+    parser.add_argument('ticket_count', type=int)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--parent', default='PX-9000', help="Jira key of every ticket's Parent")
+    args = parser.parse_args()
+    print(generate_plan(args.ticket_count, args.seed, args.parent))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,10 @@ This script handles all three phases of the tdd-to-jira-tickets skill workflow:
 3. Phase 3: Create dependency links in Jira via REST API
 
 Usage:
-    python create_jira_tickets_and_links.py <markdown_file>
+    python create_jira_tickets_and_links.py <markdown_file> [--check] [--concurrency N] [--bulk]
+        [--link-strategy {fold,separate}] [--reduce-links] [--pipeline] [--stream] [--resume]
+        [--sync] [--watch] [--no-validate]
+        [--no-cache] [--metrics PATH] [--metrics-textfile PATH] [--profile DIR]
 
 Requirements:
     - JIRA_BASE_URL environment variable must be set
@@ -17,23 +20,56 @@ Requirements:
     - Markdown file must have structured format with ticket specifications
 """
 
+import argparse
+import copy
+import hashlib
+import heapq
 import json
 import os
 import sys
 import re
-import requests
-from requests.auth import HTTPBasicAuth
-from typing import Dict, List, Optional
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from pathlib import Path
 
-try:
-    import mistletoe
-    from mistletoe import Document
-    from mistletoe.block_token import Heading, Paragraph, List as MList, ThematicBreak
-    from mistletoe.span_token import RawText, Strong, LineBreak
-except ImportError:
-    print("❌ Error: mistletoe library is required. Install it with: pip install mistletoe==1.4.0")
-    sys.exit(1)
+from plan_graph import DependencyGraph
+from plan_ticket import Ticket, TicketLike, as_ticket, intern_keys, split_values
+from run_metrics import RunMetrics
+
+# requests (via jira_client), mistletoe and the parse cache are imported by the code that
+# needs them, so --help and --check don't pay for them at startup
+if TYPE_CHECKING:
+    from jira_client import JiraClient
+    from parse_cache import ParseCache
+
+# mistletoe takes a few hundred milliseconds to import; load_mistletoe()
+# binds these the first time a plan is actually parsed
+mistletoe = None
+Document = None
+Heading = Paragraph = MList = ThematicBreak = BlockCode = CodeFence = Quote = Table = None
+RawText = Strong = Emphasis = InlineCode = Strikethrough = Link = AutoLink = Image = LineBreak = None
+
+
+def load_mistletoe():
+    """Import mistletoe and its token classes into this module on first use."""
+    global mistletoe, Document, Heading, Paragraph, MList, ThematicBreak, BlockCode, CodeFence, Quote, Table
+    global RawText, Strong, Emphasis, InlineCode, Strikethrough, Link, AutoLink, Image, LineBreak
+    if mistletoe is not None:
+        return
+    try:
+        from mistletoe import Document
+        from mistletoe.block_token import (
+            Heading, Paragraph, List as MList, ThematicBreak, BlockCode, CodeFence, Quote, Table
+        )
+        from mistletoe.span_token import (
+            RawText, Strong, Emphasis, InlineCode, Strikethrough, Link, AutoLink, Image, LineBreak
+        )
+        import mistletoe
+    except ImportError:
+        print("❌ Error: mistletoe library is required. Install it with: pip install mistletoe==1.4.0")
+        sys.exit(1)
 
 
 # Jira configuration - uses environment variables for authentication
@@ -54,7 +90,16 @@ def load_config():
             'customFields': {
                 'storyPoints': 'customfield_10115'  # Default value
             },
-            'defaultProjectKey': 'PX'  # Default value
+            'defaultProjectKey': 'PX',  # Default value
+            'http': {
+                'poolSize': 10,
+                'connectTimeout': 10,
+                'readTimeout': 60,
+                'maxRetries': 5,
+                'backoffBase': 1.0,
+                'backoffMax': 60,
+                'maxRequestsPerSecond': 100
+            }
         }
     }
 
@@ -77,10 +122,59 @@ def load_config():
     print("⚠ No config file found, using default values")
     return defaults
 
-# Load configuration
-CONFIG = load_config()
-STORY_POINTS_FIELD = CONFIG['jira']['customFields']['storyPoints']
-DEFAULT_PROJECT_KEY = CONFIG['jira']['defaultProjectKey']
+# Bump whenever parsing or the Ticket record changes, so stale parse cache entries miss
+PARSER_VERSION = '2'
+
+# Jira accepts at most 50 issues per bulk-create request
+BULK_BATCH_SIZE = 50
+
+# Issues per JQL search page, and keys per ``key in (...)`` query
+SEARCH_PAGE_SIZE = 100
+
+# Every ticket a run creates carries the run's label, plus an issue property
+# naming its logical key, so a create whose outcome is unknown can be looked
+# up with one JQL search instead of being sent again blindly
+RUN_LABEL_PREFIX = 'tdd-run-'
+ISSUE_PROPERTY = 'tdd-to-jira-tickets'
+# A create answered with one of these may still have been carried out
+AMBIGUOUS_STATUSES = frozenset({500, 502, 504})
+# Seconds to give Jira's search index before looking for such a create
+RECONCILE_DELAY = 2.0
+# Creates sent for one ticket before it is reported as failed
+MAX_CREATE_ATTEMPTS = 3
+
+# Configuration, loaded on first use by get_config()
+_config: Optional[Dict] = None
+_config_lock = threading.Lock()
+
+# Shared HTTP client, created on first use by get_jira_client()
+_jira_client: Optional['JiraClient'] = None
+_jira_client_lock = threading.Lock()
+
+# Label of this run's creates, chosen on first use by run_label()
+_run_label: Optional[str] = None
+_run_label_lock = threading.Lock()
+
+
+def get_config() -> Dict:
+    """Return the configuration, loading it the first time it is needed."""
+    global _config
+    with _config_lock:
+        if _config is None:
+            _config = load_config()
+        return _config
+
+
+def story_points_field() -> str:
+    return get_config()['jira']['customFields']['storyPoints']
+
+
+def default_project_key() -> str:
+    return get_config()['jira']['defaultProjectKey']
+
+
+def http_config() -> Dict:
+    return get_config()['jira']['http']
 
 
 def verify_environment():
@@ -97,18 +191,124 @@ def verify_environment():
     print("✓ Required environment variables are set")
 
 
-def read_markdown(markdown_file: str) -> List[Dict[str, str]]:
-    """Read markdown file and return list of ticket dictionaries."""
+def get_jira_client(pool_size: Optional[int] = None, metrics: Optional[RunMetrics] = None) -> 'JiraClient':
+    """
+    Return the process-wide JiraClient, creating it on first use.
+
+    Both phases share this client so tickets and links reuse the same pooled
+    keep-alive connections and one rate limiter. ``pool_size`` and
+    ``metrics`` only apply to the first call.
+    """
+    global _jira_client
+    with _jira_client_lock:
+        if _jira_client is None:
+            from jira_client import JiraClient, RateLimiter
+
+            settings = http_config()
+            _jira_client = JiraClient(
+                JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN,
+                pool_size=pool_size or settings.get('poolSize', 10),
+                timeout=(settings.get('connectTimeout', 10), settings.get('readTimeout', 60)),
+                max_retries=settings.get('maxRetries', 5),
+                backoff_base=settings.get('backoffBase', 1.0),
+                backoff_max=settings.get('backoffMax', 60),
+                rate_limiter=RateLimiter(
+                    rate=settings.get('requestsPerSecond'),
+                    max_rate=settings.get('maxRequestsPerSecond', 100),
+                ),
+                metrics=metrics,
+            )
+        return _jira_client
+
+
+def use_jira_client(client):
+    """Make ``client`` the process-wide client, e.g. a DryRunClient for ``--dry-run``."""
+    global _jira_client
+    with _jira_client_lock:
+        _jira_client = client
+
+
+def run_label() -> str:
+    """Return the label added to every ticket this run creates."""
+    global _run_label
+    with _run_label_lock:
+        if _run_label is None:
+            _run_label = RUN_LABEL_PREFIX + os.urandom(5).hex()
+        return _run_label
+
+
+def credentials_available() -> bool:
+    """True if requests can be authenticated, or are only being recorded by a dry run."""
+    return bool(JIRA_EMAIL and JIRA_TOKEN) or getattr(_jira_client, 'dry_run', False)
+
+
+def get_payload_validator() -> Callable[[Ticket, Dict[str, str]], List[str]]:
+    """Return a check of create payloads against the cached project createmeta."""
+    from jira_meta import DEFAULT_TTL, CreateMeta
+
+    client = get_jira_client()
+    # A dry run's simulated metadata must never end up in the on-disk cache
+    meta = CreateMeta(client, story_points_field(),
+                      ttl=get_config()['jira'].get('createmetaTtl', DEFAULT_TTL),
+                      read_only=getattr(client, 'dry_run', False))
+    return lambda ticket, mapping: meta.problems(validated_fields(ticket, mapping))
+
+
+def get_parse_cache() -> 'ParseCache':
+    """
+    Return the parse cache for this parser and mistletoe version.
+
+    The version comes from the package metadata, so a cache hit never has
+    to import mistletoe at all.
+    """
+    from importlib import metadata
+    from parse_cache import ParseCache
+
+    try:
+        mistletoe_version = metadata.version('mistletoe')
+    except metadata.PackageNotFoundError:
+        load_mistletoe()
+        mistletoe_version = mistletoe.__version__
+    return ParseCache(f"{PARSER_VERSION}/mistletoe-{mistletoe_version}")
+
+
+def read_markdown(markdown_file: str, cache: Optional['ParseCache'] = None) -> List[Ticket]:
+    """Read markdown file and return list of Ticket records."""
+    tickets = list(stream_markdown(markdown_file, cache))
+    print(f"✓ Read {len(tickets)} tickets from markdown")
+    return tickets
+
+
+def stream_markdown(markdown_file: str, cache: Optional['ParseCache'] = None) -> Iterator[Ticket]:
+    """
+    Yield Ticket records from a markdown file as it is read.
+
+    The file is never held in memory as a whole: each ticket section is
+    parsed on its own as soon as its closing heading or ``---`` is reached.
+    With a ``cache``, an unchanged file is served from the parse cache
+    instead, and a freshly parsed one is stored once fully read.
+    """
     if not os.path.exists(markdown_file):
         print(f"❌ Error: Markdown file not found: {markdown_file}")
         sys.exit(1)
 
-    with open(markdown_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    cache_key = cache.key(markdown_file) if cache else None
+    if cache_key:
+        cached = cache.load(cache_key)
+        if cached is not None:
+            print(f"✓ Loaded {len(cached)} parsed tickets from cache")
+            yield from cached
+            return
 
-    tickets = parse_markdown_tickets(content)
-    print(f"✓ Read {len(tickets)} tickets from markdown")
-    return tickets
+    parsed = []
+    with open(markdown_file, 'r', encoding='utf-8') as f:
+        for ticket in iter_markdown_tickets(f):
+            if cache_key:
+                # Callers may fill in Jira Keys while the stream is still open
+                parsed.append(copy.copy(ticket))
+            yield ticket
+    if cache_key:
+        cache.store(cache_key, parsed)
 
 
 def extract_text_from_token(token) -> str:
@@ -120,8 +320,31 @@ def extract_text_from_token(token) -> str:
     return ''
 
 
-def parse_markdown_tickets(content: str) -> List[Dict[str, str]]:
-    """Parse markdown content into ticket dictionaries using mistletoe."""
+def apply_metadata_field(ticket: Ticket, field: str, value: str):
+    """Set the ticket attribute behind a ``**Field:** value`` metadata line."""
+    if field == 'Type':
+        ticket.issue_type = value
+    elif field == 'Parent':
+        ticket.parent = sys.intern(value)
+    elif field == 'Labels':
+        ticket.labels = split_values(value, ',')
+    elif field == 'Priority':
+        ticket.priority = value
+    elif field == 'Story Points':
+        ticket.story_points = value
+    elif field == 'Blocks':
+        if value and value.lower() != '(none)':
+            ticket.blocks = intern_keys(split_values(value, ','))
+    elif field == 'Blocked By':
+        if value and value.lower() != '(none)':
+            ticket.blocked_by = intern_keys(split_values(value, ','))
+    elif field == 'Jira Key':
+        ticket.jira_key = value
+
+
+def parse_markdown_tickets(content: str) -> List[Ticket]:
+    """Parse markdown content into Ticket records using mistletoe."""
+    load_mistletoe()
     tickets = []
     doc = Document(content)
 
@@ -141,25 +364,12 @@ def parse_markdown_tickets(content: str) -> List[Dict[str, str]]:
                 key = match.group(1)
                 summary = match.group(2).strip()
 
-                # Initialize ticket dict
-                ticket = {
-                    'Key': key,
-                    'Summary': summary,
-                    'Description': '',
-                    'Issue Type': '',
-                    'Parent': '',
-                    'Labels': '',
-                    'Priority': '',
-                    'Story Points': '',
-                    'Blocks': '',
-                    'Is Blocked By': '',
-                    'Jira Key': ''
-                }
+                ticket = Ticket(key, summary)
 
                 # Parse subsequent paragraphs for metadata
                 i += 1
                 description_started = False
-                description_parts = []
+                description_tokens = []
 
                 while i < len(doc.children):
                     current = doc.children[i]
@@ -182,19 +392,7 @@ def parse_markdown_tickets(content: str) -> List[Dict[str, str]]:
 
                     # If description has started, collect all content
                     if description_started:
-                        # Convert the token back to markdown for description
-                        if isinstance(current, Paragraph):
-                            text = extract_text_from_token(current)
-                            description_parts.append(text)
-                        elif isinstance(current, MList):
-                            # Handle lists in description
-                            for item in current.children:
-                                item_text = extract_text_from_token(item)
-                                description_parts.append(f"- {item_text}")
-                        elif isinstance(current, Heading):
-                            # Sub-headings in description
-                            text = extract_text_from_token(current)
-                            description_parts.append(f"{'#' * current.level} {text}")
+                        description_tokens.append(current)
                         i += 1
                         continue
 
@@ -232,36 +430,13 @@ def parse_markdown_tickets(content: str) -> List[Dict[str, str]]:
 
                             # Split on first colon to get field and value
                             field, _, value = line.partition(':')
-                            field = field.strip()
-                            value = value.strip()
-
-                            if field == 'Type':
-                                ticket['Issue Type'] = value
-                            elif field == 'Parent':
-                                ticket['Parent'] = value
-                            elif field == 'Labels':
-                                # Convert comma-separated to pipe-separated
-                                ticket['Labels'] = '|'.join([l.strip() for l in value.split(',') if l.strip()])
-                            elif field == 'Priority':
-                                ticket['Priority'] = value
-                            elif field == 'Story Points':
-                                ticket['Story Points'] = value
-                            elif field == 'Blocks':
-                                if value and value.lower() != '(none)':
-                                    # Convert comma-separated to pipe-separated
-                                    ticket['Blocks'] = '|'.join([b.strip() for b in value.split(',') if b.strip()])
-                            elif field == 'Blocked By':
-                                if value and value.lower() != '(none)':
-                                    # Convert comma-separated to pipe-separated
-                                    ticket['Is Blocked By'] = '|'.join([b.strip() for b in value.split(',') if b.strip()])
-                            elif field == 'Jira Key':
-                                ticket['Jira Key'] = value
+                            apply_metadata_field(ticket, field.strip(), value.strip())
 
                     i += 1
 
-                # Join description parts
-                if description_parts:
-                    ticket['Description'] = '\n\n'.join(description_parts).strip()
+                # Render ADF from the tokens themselves so inline formatting survives;
+                # the plain-text description is derived from it only when asked for
+                ticket.description_adf = tokens_to_adf(description_tokens)
 
                 tickets.append(ticket)
                 continue
@@ -271,134 +446,223 @@ def parse_markdown_tickets(content: str) -> List[Dict[str, str]]:
     return tickets
 
 
-def markdown_to_adf(markdown_text: str) -> Dict:
-    """
-    Convert markdown text to Atlassian Document Format (ADF).
+# A logical ticket key such as M1-DB-1 or M2-API-3-FE
+TICKET_KEY = r'M\d+-[A-Z]+-\d+(?:-[A-Z]+)?'
+TICKET_KEY_PATTERN = re.compile(rf'^{TICKET_KEY}$')
+
+# Lines that end a ticket section: any level-2 heading, and thematic breaks
+SECTION_HEADING_PATTERN = re.compile(r'^ {0,3}##(?:[ \t]|$)')
+THEMATIC_BREAK_PATTERN = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
 
-    Handles:
-    - Headings (## text)
-    - Task lists (- [ ] item) - consecutive items grouped together
-    - Bullet lists (- item) - consecutive items grouped together
-    - Bold text (**text**)
-    - Inline code (`code`)
-    - Regular paragraphs
+
+def iter_numbered_sections(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
     """
-    content = []
-    lines = markdown_text.split('\n')
-    i = 0
+    Split markdown lines into the chunks parse_markdown_tickets cares about.
 
-    while i < len(lines):
-        line = lines[i]
+    A chunk starts at a level-2 heading and runs until the next level-2
+    heading or thematic break, exactly where the ticket walk stops. Lines
+    inside fenced code blocks never split a chunk. Text outside any chunk
+    (the plan's preamble, anything after a ``---``) is dropped unparsed.
 
-        # Skip empty lines
-        if not line.strip():
-            i += 1
+    Yields:
+        Tuples of (1-based line number of the heading, chunk markdown)
+    """
+    section = None
+    start = 0
+    fence = None
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if fence:
+            if section is not None:
+                section.append(line)
+            closing = line.strip()
+            if closing.startswith(fence) and not closing.strip(fence[0]):
+                fence = None
             continue
 
-        # Handle headings (## text)
-        heading_match = re.match(r'^(#{2,6})\s+(.+)$', line)
-        if heading_match:
-            level = len(heading_match.group(1))
-            text = heading_match.group(2)
-            content.append({
-                "type": "heading",
-                "attrs": {"level": level},
-                "content": [{"type": "text", "text": text}]
-            })
-            i += 1
+        if SECTION_HEADING_PATTERN.match(line):
+            if section:
+                yield start, '\n'.join(section)
+            section = [line]
+            start = line_number
+            continue
+        if THEMATIC_BREAK_PATTERN.match(line):
+            if section:
+                yield start, '\n'.join(section)
+            section = None
             continue
 
-        # Handle consecutive task list items (- [ ] text or - [x] text)
-        # Convert to bullet list since Jira doesn't support taskList in child issues under epics
-        task_match = re.match(r'^-\s+\[([x ])\]\s+(.+)$', line)
-        if task_match:
-            # Collect all consecutive task items as bullet list items
-            list_items = []
-            while i < len(lines):
-                task_match = re.match(r'^-\s+\[([x ])\]\s+(.+)$', lines[i])
-                if not task_match:
-                    break
+        match = FENCE_PATTERN.match(line)
+        if match:
+            fence = match.group(1)
+        if section is not None:
+            section.append(line)
 
-                # checked = task_match.group(1).lower() == 'x'  # Not used since we can't render checkboxes
-                text = task_match.group(2)
-                text_content = parse_inline_formatting(text)
-
-                list_items.append({
-                    "type": "listItem",
-                    "content": [{
-                        "type": "paragraph",
-                        "content": text_content
-                    }]
-                })
-                i += 1
+    if section:
+        yield start, '\n'.join(section)
 
-            # Add as bulletList (Jira doesn't support taskList in subtasks/child issues)
-            content.append({
-                "type": "bulletList",
-                "content": list_items
-            })
-            continue
 
-        # Handle consecutive bullet list items (- text, not task lists)
-        bullet_match = re.match(r'^-\s+([^\[].*)$', line)  # Not starting with [
-        if bullet_match:
-            # Collect all consecutive bullet items
-            list_items = []
-            while i < len(lines):
-                bullet_match = re.match(r'^-\s+([^\[].*)$', lines[i])
-                if not bullet_match:
-                    break
+def iter_ticket_sections(lines: Iterable[str]) -> Iterator[str]:
+    """Like ``iter_numbered_sections``, without the line numbers."""
+    for _, section in iter_numbered_sections(lines):
+        yield section
 
-                text = bullet_match.group(1)
-                text_content = parse_inline_formatting(text)
 
-                list_items.append({
-                    "type": "listItem",
-                    "content": [{
-                        "type": "paragraph",
-                        "content": text_content
-                    }]
-                })
-                i += 1
+def iter_markdown_tickets(lines: Iterable[str]) -> Iterator[Ticket]:
+    """
+    Parse tickets one section at a time, yielding each as soon as it is complete.
 
-            # Add the bulletList with all collected items
-            content.append({
-                "type": "bulletList",
-                "content": list_items
-            })
-            continue
+    Produces the same tickets as ``parse_markdown_tickets`` over the whole
+    content, but only ever builds a mistletoe Document for a single ticket,
+    so memory stays flat and callers can start work on the first ticket
+    before the rest of the file has been read.
+    """
+    for section in iter_ticket_sections(lines):
+        yield from parse_markdown_tickets(section)
+
+
+# Task list marker left at the start of a list item ("[ ] item", "[x] item")
+TASK_MARKER_PATTERN = re.compile(r'^\[[ xX]\]\s+')
+
+# Inline bold (**text**) and code (`code`) spans
+INLINE_FORMATTING_PATTERN = re.compile(r'(\*\*(.+?)\*\*|`(.+?)`)')
+
+
+def _append_adf_text(content: List[Dict], text: str, marks: Tuple[Dict, ...]):
+    """Append a text node, merging it into the previous one when the marks match."""
+    if not text:
+        return
+    previous = content[-1] if content else None
+    if previous and previous.get("type") == "text" and previous.get("marks", []) == list(marks):
+        previous["text"] += text
+        return
+    node = {"type": "text", "text": text}
+    if marks:
+        node["marks"] = list(marks)
+    content.append(node)
+
+
+def render_adf_inline(tokens, marks: Tuple[Dict, ...] = (), content: Optional[List[Dict]] = None) -> List[Dict]:
+    """Render mistletoe span tokens as ADF inline nodes, carrying marks down the tree."""
+    if content is None:
+        content = []
+    for token in tokens:
+        if isinstance(token, RawText):
+            _append_adf_text(content, token.content, marks)
+        elif isinstance(token, LineBreak):
+            if token.soft:
+                _append_adf_text(content, ' ', marks)
+            else:
+                content.append({"type": "hardBreak"})
+        elif isinstance(token, Strong):
+            render_adf_inline(token.children, marks + ({"type": "strong"},), content)
+        elif isinstance(token, Emphasis):
+            render_adf_inline(token.children, marks + ({"type": "em"},), content)
+        elif isinstance(token, Strikethrough):
+            render_adf_inline(token.children, marks + ({"type": "strike"},), content)
+        elif isinstance(token, InlineCode):
+            # ADF only allows the code mark alongside a link
+            code_marks = tuple(mark for mark in marks if mark["type"] == "link") + ({"type": "code"},)
+            render_adf_inline(token.children, code_marks, content)
+        elif isinstance(token, (Link, AutoLink)):
+            render_adf_inline(token.children, marks + ({"type": "link", "attrs": {"href": token.target}},), content)
+        elif isinstance(token, Image):
+            render_adf_inline(token.children, marks, content)
+        elif getattr(token, 'children', None) is not None:
+            render_adf_inline(token.children, marks, content)
+        elif getattr(token, 'content', None):
+            _append_adf_text(content, token.content, marks)
+    return content
 
-        # Handle regular paragraphs (everything else)
-        paragraph_lines = []
-        while i < len(lines) and lines[i].strip() and not re.match(r'^(#{2,6}|-)\s+', lines[i]):
-            paragraph_lines.append(lines[i])
-            i += 1
 
-        if paragraph_lines:
-            paragraph_text = ' '.join(paragraph_lines)
-            text_content = parse_inline_formatting(paragraph_text)
+def _render_adf_list_item(item) -> List[Dict]:
+    """Render a list item, dropping the task-list checkbox Jira can't show in child issues."""
+    content = render_adf_blocks(item.children)
+    first = content[0] if content else None
+    if first and first["type"] == "paragraph" and first.get("content"):
+        lead = first["content"][0]
+        if lead["type"] == "text":
+            lead["text"] = TASK_MARKER_PATTERN.sub('', lead["text"], count=1)
+            if not lead["text"]:
+                first["content"].pop(0)
+    return content or [{"type": "paragraph", "content": []}]
+
+
+def _render_adf_table_row(row, cell_type: str) -> Dict:
+    return {
+        "type": "tableRow",
+        "content": [
+            {"type": cell_type, "content": [{"type": "paragraph", "content": render_adf_inline(cell.children)}]}
+            for cell in row.children
+        ]
+    }
+
+
+def render_adf_blocks(tokens) -> List[Dict]:
+    """Render mistletoe block tokens as ADF block nodes."""
+    content = []
+    for token in tokens:
+        if isinstance(token, Heading):
+            inline = render_adf_inline(token.children)
+            if inline:
+                content.append({"type": "heading", "attrs": {"level": token.level}, "content": inline})
+        elif isinstance(token, Paragraph):
+            inline = render_adf_inline(token.children)
+            if inline:
+                content.append({"type": "paragraph", "content": inline})
+        elif isinstance(token, MList):
+            # Task lists become bullet lists: Jira doesn't support taskList in child issues under epics
+            items = [{"type": "listItem", "content": _render_adf_list_item(item)} for item in token.children]
+            if token.start is None:
+                content.append({"type": "bulletList", "content": items})
+            else:
+                content.append({"type": "orderedList", "attrs": {"order": token.start}, "content": items})
+        elif isinstance(token, (CodeFence, BlockCode)):
+            code = token.children[0].content.rstrip('\n') if token.children else ''
+            block = {"type": "codeBlock", "content": [{"type": "text", "text": code}] if code else []}
+            if getattr(token, 'language', ''):
+                block["attrs"] = {"language": token.language}
+            content.append(block)
+        elif isinstance(token, Quote):
+            content.append({"type": "blockquote", "content": render_adf_blocks(token.children)})
+        elif isinstance(token, ThematicBreak):
+            content.append({"type": "rule"})
+        elif isinstance(token, Table):
+            rows = [_render_adf_table_row(token.header, "tableHeader")] if getattr(token, 'header', None) else []
+            rows.extend(_render_adf_table_row(row, "tableCell") for row in token.children)
+            content.append({"type": "table", "content": rows})
+    return content
 
-            content.append({
-                "type": "paragraph",
-                "content": text_content
-            })
 
+def tokens_to_adf(tokens) -> Dict:
+    """Render a sequence of mistletoe block tokens as an ADF document."""
     return {
         "type": "doc",
         "version": 1,
-        "content": content
+        "content": render_adf_blocks(tokens)
     }
 
 
+def markdown_to_adf(markdown_text: str) -> Dict:
+    """
+    Convert markdown text to Atlassian Document Format (ADF).
+
+    Parses the text with mistletoe and renders the AST with the same
+    renderer used for descriptions captured by ``parse_markdown_tickets``:
+    headings, bullet/ordered/task lists, bold, italic, strikethrough,
+    inline code, links, code blocks, quotes, rules and tables.
+    """
+    load_mistletoe()
+    return tokens_to_adf(Document(markdown_text).children)
+
+
 def parse_inline_formatting(text: str) -> List[Dict]:
     """Parse inline markdown formatting (bold, code) in text."""
     content = []
     current_pos = 0
 
-    # Pattern matches: **bold**, `code`
-    pattern = r'(\*\*(.+?)\*\*|`(.+?)`)'
-
-    for match in re.finditer(pattern, text):
+    for match in INLINE_FORMATTING_PATTERN.finditer(text):
         # Add text before the match
         if match.start() > current_pos:
             plain_text = text[current_pos:match.start()]
@@ -434,40 +698,55 @@ def parse_inline_formatting(text: str) -> List[Dict]:
     return content
 
 
-def create_jira_ticket(row: Dict[str, str]) -> Optional[str]:
+def issue_project_and_parent(row: Ticket, mapping: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
     """
-    Create a single Jira ticket via REST API.
+    Return the project key and Parent Jira key (or '') a ticket is created with.
 
-    Returns:
-        Jira issue key (e.g., "PX-9453") if successful, None otherwise
+    A Parent that names another ticket's logical key is resolved through
+    ``mapping`` so children can hang off an Epic defined in the same plan.
     """
-    if not JIRA_EMAIL or not JIRA_TOKEN:
-        print(f"  ✗ Cannot create ticket: JIRA_EMAIL or JIRA_TOKEN not set")
-        return None
+    parent = row.parent.strip()
+    if mapping and parent in mapping:
+        parent = mapping[parent]
+    # Extract project key from parent or use default
+    return (parent.split('-')[0] if parent else default_project_key()), parent
 
-    logical_key = row['Key']
-    summary = row['Summary']
-    description = row['Description']
-    issue_type = row['Issue Type']
-    parent = row.get('Parent', '').strip()
-    labels_str = row.get('Labels', '').strip()
-    priority = row.get('Priority', 'Medium').strip()
-    story_points = row.get('Story Points', '').strip()
 
-    # Build labels list
-    labels = [l.strip() for l in labels_str.split('|') if l.strip()] if labels_str else []
+def validated_fields(row: TicketLike, mapping: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    The ``fields`` CreateMeta.problems() checks, taken from the ticket.
 
-    # Convert markdown description to ADF
-    description_adf = markdown_to_adf(description)
+    Same values as build_issue_fields() gives for them, without rendering
+    the description or printing its warnings a second time.
+    """
+    row = as_ticket(row)
+    project_key, _ = issue_project_and_parent(row, mapping)
+    fields = {
+        "project": {"key": project_key},
+        "issuetype": {"name": row.issue_type},
+        "priority": {"name": row.priority.strip()}
+    }
+    if row.points is not None:
+        fields[story_points_field()] = row.points
+    return fields
+
+
+def build_issue_fields(row: TicketLike, mapping: Optional[Dict[str, str]] = None) -> Dict:
+    """Build the Jira ``fields`` object for a ticket."""
+    row = as_ticket(row)
+    project_key, parent = issue_project_and_parent(row, mapping)
+
+    # Use the ADF rendered while parsing; fall back to converting the markdown text
+    description_adf = row.description_adf or markdown_to_adf(row.description)
 
     # Build fields object
     fields = {
-        "project": {"key": parent.split('-')[0] if parent else DEFAULT_PROJECT_KEY},  # Extract project key from parent or use default
-        "summary": summary,
+        "project": {"key": project_key},
+        "summary": row.summary,
         "description": description_adf,
-        "issuetype": {"name": issue_type},
-        "labels": labels,
-        "priority": {"name": priority}
+        "issuetype": {"name": row.issue_type},
+        "labels": list(row.labels),
+        "priority": {"name": row.priority.strip()}
     }
 
     # Add parent if specified
@@ -475,37 +754,1059 @@ def create_jira_ticket(row: Dict[str, str]) -> Optional[str]:
         fields["parent"] = {"key": parent}
 
     # Add story points if specified
-    if story_points:
+    if row.points is not None:
+        fields[story_points_field()] = row.points
+    elif row.story_points.strip():
+        print(f"  ⚠ Warning: Invalid story points value '{row.story_points.strip()}', skipping")
+
+    return fields
+
+
+def build_issue_payload(row: TicketLike, mapping: Optional[Dict[str, str]] = None,
+                        blocked_by: Sequence[str] = ()) -> Dict:
+    """
+    Build the create-issue payload for a ticket.
+
+    ``blocked_by`` lists Jira keys of existing blockers; each becomes a Blocks
+    link added in the same request, saving a separate ``/issueLink`` call.
+    The new issue takes the outward side, matching ``create_jira_link``.
+    The run's label and an issue property holding the logical key let
+    find_created() recognise the issue if Jira's answer is lost.
+    """
+    row = as_ticket(row)
+    payload = {
+        "fields": build_issue_fields(row, mapping),
+        "properties": [{"key": ISSUE_PROPERTY, "value": {"run": run_label(), "key": row.key}}],
+    }
+    payload["fields"]["labels"].append(run_label())
+    if blocked_by:
+        payload["update"] = {
+            "issuelinks": [
+                {"add": {"type": {"name": "Blocks"}, "inwardIssue": {"key": blocker}}}
+                for blocker in blocked_by
+            ]
+        }
+    return payload
+
+
+def create_jira_ticket(row: TicketLike, mapping: Optional[Dict[str, str]] = None,
+                       blocked_by: Sequence[str] = ()) -> Optional[str]:
+    """
+    Create a single Jira ticket via REST API.
+
+    Returns:
+        Jira issue key (e.g., "PX-9453") if successful, None otherwise
+    """
+    import requests
+
+    if not credentials_available():
+        print(f"  ✗ Cannot create ticket: JIRA_EMAIL or JIRA_TOKEN not set")
+        return None
+
+    row = as_ticket(row)
+    logical_key = row.key
+    folded = f" (+{len(blocked_by)} links)" if blocked_by else ""
+
+    payload = build_issue_payload(row, mapping, blocked_by)
+
+    for attempt in range(1, MAX_CREATE_ATTEMPTS + 1):
         try:
-            fields[STORY_POINTS_FIELD] = float(story_points)
-        except ValueError:
-            print(f"  ⚠ Warning: Invalid story points value '{story_points}', skipping")
+            response = get_jira_client().post("/rest/api/3/issue", payload)
+
+            if response.status_code == 201:
+                response_json = response.json()
+                jira_key = response_json.get('key')
+                print(f"  ✓ Created {logical_key} → {jira_key}{folded}")
+                return jira_key
+            if response.status_code not in AMBIGUOUS_STATUSES:
+                print(f"  ✗ Failed to create {logical_key}: HTTP {response.status_code}")
+                if response.text:
+                    print(f"    Response: {response.text[:200]}")
+                return None
+            print(f"  ⚠ HTTP {response.status_code} creating {logical_key}; checking whether Jira created it")
+        except requests.ConnectTimeout as e:
+            # The client already retried; nothing reached Jira
+            print(f"  ✗ Request failed for {logical_key}: {str(e)}")
+            return None
+        except requests.RequestException as e:
+            print(f"  ⚠ Request failed for {logical_key} ({str(e)}); checking whether Jira created it")
+        except json.JSONDecodeError:
+            print(f"  ✗ Failed to parse response for {logical_key}")
+            return None
+
+        found = find_created([logical_key])
+        if found is None:
+            return None
+        if logical_key in found:
+            print(f"  ✓ Created {logical_key} → {found[logical_key]}{folded} (found in Jira)")
+            return found[logical_key]
+        if attempt < MAX_CREATE_ATTEMPTS:
+            print(f"  ↻ {logical_key} is not in Jira; creating it again")
 
-    # Create ticket via requests
-    url = f"{JIRA_BASE_URL}/rest/api/3/issue"
-    headers = {"Content-Type": "application/json"}
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
-    payload = {"fields": fields}
+    print(f"  ✗ Failed to create {logical_key} after {MAX_CREATE_ATTEMPTS} attempts")
+    return None
+
+
+def find_created(logical_keys: Sequence[str], label: Optional[str] = None,
+                 delay: float = RECONCILE_DELAY) -> Optional[Dict[str, str]]:
+    """
+    Look up which of ``logical_keys`` a run created without hearing back.
 
+    After a 500/502/504, a read timeout or a dropped connection a create
+    may or may not have gone through. One search for the run's label
+    (``label``, this run's by default), matched on the issue property every
+    create carries, tells which did, so those are adopted and only the rest
+    are sent again. ``delay`` gives Jira's search index time to catch up.
+
+    Returns:
+        Dict of logical Key → Jira Key for the tickets found, or None if
+        the search failed and it is unknown what Jira created
+    """
+    import requests
+
+    label = label or run_label()
+    if delay:
+        time.sleep(delay)
+    wanted = set(logical_keys)
+    found = {}
     try:
-        response = requests.post(url, json=payload, headers=headers, auth=auth)
+        for issue in search_issues(f'labels = "{label}"', ['summary'], properties=[ISSUE_PROPERTY]):
+            tag = (issue.get('properties') or {}).get(ISSUE_PROPERTY) or {}
+            if tag.get('key') in wanted:
+                found[tag['key']] = issue['key']
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        print(f"  ⚠ Could not check Jira for {', '.join(logical_keys)} ({e}). "
+              f"Search for label {label} before rerunning.")
+        return None
+    return found
 
-        if response.status_code == 201:
-            response_json = response.json()
-            jira_key = response_json.get('key')
-            print(f"  ✓ Created {logical_key} → {jira_key}")
-            return jira_key
+
+def create_jira_tickets_bulk(rows: Sequence[TicketLike], mapping: Optional[Dict[str, str]] = None,
+                             blocked_by: Optional[Dict[str, Sequence[str]]] = None) -> Dict[str, Optional[str]]:
+    """
+    Create up to BULK_BATCH_SIZE Jira tickets with one bulk REST API call.
+
+    Jira answers with the created issues in request order plus an error entry
+    (``failedElementNumber``) for each rejected item. Only the items Jira
+    rejected, or the whole batch if Jira refused it (429/503) or it never
+    reached Jira, are retried one at a time with ``create_jira_ticket``.
+    After a 500/502/504, a read timeout or a dropped connection any part of
+    the batch may exist, so find_created() looks the batch up, the tickets
+    Jira has are kept and only the missing ones are resubmitted.
+    ``blocked_by`` maps logical keys to blocker Jira keys folded into each item.
+
+    Returns:
+        Dict of logical Key → Jira issue key (None for tickets that could not be created)
+    """
+    import requests
+
+    rows = [as_ticket(row) for row in rows]
+    if not credentials_available():
+        print(f"  ✗ Cannot create tickets: JIRA_EMAIL or JIRA_TOKEN not set")
+        return {row.key: None for row in rows}
+
+    blocked_by = blocked_by or {}
+    results = {row.key: None for row in rows}
+    retry = []
+    remaining = rows
+    for attempt in range(1, MAX_CREATE_ATTEMPTS + 1):
+        payload = {"issueUpdates": [
+            build_issue_payload(row, mapping, blocked_by.get(row.key, ())) for row in remaining
+        ]}
+        unsure = []
+        try:
+            response = get_jira_client().post("/rest/api/3/issue/bulk", payload)
+
+            # 201 means every item was created; 400 may still carry partial successes
+            if response.status_code in (201, 400):
+                response_json = response.json()
+                failed = {error.get('failedElementNumber') for error in response_json.get('errors', [])}
+                created = iter(response_json.get('issues', []))
+                for index, row in enumerate(remaining):
+                    if index in failed:
+                        retry.append(row)
+                        continue
+                    issue = next(created, None)
+                    if issue and issue.get('key'):
+                        results[row.key] = issue['key']
+                        print(f"  ✓ Created {row.key} → {issue['key']}")
+            elif response.status_code in (429, 503):
+                print(f"  ✗ Bulk create refused for {len(remaining)} tickets: HTTP {response.status_code}")
+                retry.extend(remaining)
+            elif response.status_code in AMBIGUOUS_STATUSES:
+                print(f"  ⚠ HTTP {response.status_code} creating {len(remaining)} tickets; "
+                      f"checking which ones Jira created")
+                unsure = remaining
+            else:
+                print(f"  ✗ Bulk create failed for {len(remaining)} tickets: HTTP {response.status_code}")
+                if response.text:
+                    print(f"    Response: {response.text[:200]}")
+        except requests.ConnectTimeout as e:
+            print(f"  ✗ Bulk request could not connect for {len(remaining)} tickets: {str(e)}")
+            retry.extend(remaining)
+        except requests.RequestException as e:
+            print(f"  ⚠ Bulk request failed for {len(remaining)} tickets ({str(e)}); "
+                  f"checking which ones Jira created")
+            unsure = remaining
+        except json.JSONDecodeError:
+            print(f"  ⚠ Failed to parse bulk response for {len(remaining)} tickets; "
+                  f"checking which ones Jira created")
+            unsure = remaining
+
+        if not unsure:
+            break
+        found = find_created([row.key for row in unsure])
+        if found is None:
+            break
+        for row in unsure:
+            if row.key in found:
+                results[row.key] = found[row.key]
+                print(f"  ✓ Created {row.key} → {found[row.key]} (found in Jira)")
+        remaining = [row for row in unsure if row.key not in found]
+        if not remaining:
+            break
+        if attempt < MAX_CREATE_ATTEMPTS:
+            print(f"  ↻ Resubmitting {len(remaining)} tickets Jira did not create")
         else:
-            print(f"  ✗ Failed to create {logical_key}: HTTP {response.status_code}")
-            if response.text:
-                print(f"    Response: {response.text[:200]}")
-            return None
+            print(f"  ✗ Failed to create {', '.join(row.key for row in remaining)} "
+                  f"after {MAX_CREATE_ATTEMPTS} attempts")
+
+    for row in retry:
+        print(f"  ↻ Retrying {row.key} individually")
+        results[row.key] = create_jira_ticket(row, mapping, blocked_by.get(row.key, ()))
+
+    return results
+
+
+def build_update_fields(row: TicketLike, mapping: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    Build the ``fields`` an edit of an existing ticket may set.
+
+    Same as ``build_issue_fields`` minus project and issue type, which Jira
+    does not change through an edit, and minus an empty priority.
+    """
+    fields = build_issue_fields(row, mapping)
+    fields.pop('project', None)
+    fields.pop('issuetype', None)
+    if not fields['priority']['name']:
+        del fields['priority']
+    return fields
+
+
+def update_jira_ticket(row: TicketLike, jira_key: str, mapping: Optional[Dict[str, str]] = None,
+                       fields: Optional[Dict] = None) -> bool:
+    """
+    Update an existing Jira ticket in place via REST API.
+
+    Sends ``fields`` if given, otherwise every field the plan controls.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    import requests
+
+    row = as_ticket(row)
+    if fields is None:
+        fields = build_update_fields(row, mapping)
+
+    try:
+        response = get_jira_client().put(f"/rest/api/3/issue/{jira_key}", {"fields": fields})
+
+        if response.status_code == 204:
+            print(f"  ✓ Updated {row.key} ({jira_key}): {', '.join(sorted(fields))}")
+            return True
+        print(f"  ✗ Failed to update {row.key} ({jira_key}): HTTP {response.status_code}")
+        if response.text:
+            print(f"    Response: {response.text[:200]}")
+        return False
     except requests.RequestException as e:
-        print(f"  ✗ Request failed for {logical_key}: {str(e)}")
-        return None
-    except json.JSONDecodeError:
-        print(f"  ✗ Failed to parse response for {logical_key}")
-        return None
+        print(f"  ✗ Request failed for {row.key}: {str(e)}")
+        return False
+
+
+def search_issues(jql: str, fields: Sequence[str], properties: Sequence[str] = ()) -> Iterator[Dict]:
+    """
+    Yield every issue matching ``jql`` with the requested fields and issue properties.
+
+    Uses the enhanced JQL search endpoint, following ``nextPageToken`` until
+    the last page.
+    """
+    import requests
+
+    body = {"jql": jql, "fields": list(fields), "maxResults": SEARCH_PAGE_SIZE}
+    if properties:
+        body["properties"] = list(properties)
+    while True:
+        response = get_jira_client().post("/rest/api/3/search/jql", body)
+        if response.status_code != 200:
+            raise requests.HTTPError(f"JQL search failed: HTTP {response.status_code} {response.text[:200]}",
+                                     response=response)
+        page = response.json()
+        yield from page.get('issues', [])
+        token = page.get('nextPageToken')
+        if not token or page.get('isLast'):
+            return
+        body["nextPageToken"] = token
+
+
+def fetch_issue_fields(jira_keys: Sequence[str], fields: Sequence[str]) -> Dict[str, Dict]:
+    """
+    Fetch current field values for many issues with as few searches as possible.
+
+    Keys go SEARCH_PAGE_SIZE at a time into ``key in (...)`` JQL queries.
+    Jira rejects such a query outright (HTTP 400) if any key does not
+    exist, so a rejected chunk is split in half until the missing keys are
+    isolated; with no missing keys this costs nothing extra.
+
+    Returns:
+        Dict of Jira Key → fields object as returned by Jira; missing keys are absent
+    """
+    import requests
+
+    found = {}
+    chunks = [list(jira_keys[start:start + SEARCH_PAGE_SIZE])
+              for start in range(0, len(jira_keys), SEARCH_PAGE_SIZE)]
+    while chunks:
+        chunk = chunks.pop()
+        try:
+            issues = list(search_issues(f"key in ({', '.join(chunk)})", fields))
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+            if len(chunk) > 1:
+                middle = len(chunk) // 2
+                chunks.extend((chunk[:middle], chunk[middle:]))
+            continue
+        for issue in issues:
+            found[issue['key']] = issue.get('fields', {})
+    return found
+
+
+# Attribute values Jira fills in on nodes stored without them
+ADF_DEFAULT_ATTRS = {
+    'orderedList': {'order': 1},
+    'table': {'isNumberColumnEnabled': False, 'layout': 'default'},
+}
+
+
+def normalize_adf(node):
+    """
+    Canonical form of an ADF node, for comparing what we render with what
+    Jira stored.
+
+    Jira adds ``localId`` attributes and default attribute values, drops
+    empty text and marks, and may split or merge text runs, so those
+    differences are removed: attributes that are ids or defaults go, empty
+    text nodes go, marks are sorted, and adjacent text nodes with the same
+    marks are merged.
+    """
+    if isinstance(node, list):
+        merged = []
+        for child in (normalize_adf(child) for child in node):
+            if child.get('type') == 'text':
+                if not child.get('text'):
+                    continue
+                previous = merged[-1] if merged else None
+                if previous and previous.get('type') == 'text' and previous.get('marks') == child.get('marks'):
+                    previous['text'] += child['text']
+                    continue
+            merged.append(child)
+        return merged
+    if not isinstance(node, dict):
+        return node
+
+    normalized = {}
+    defaults = ADF_DEFAULT_ATTRS.get(node.get('type'), {})
+    for key, value in node.items():
+        if key == 'attrs':
+            value = {name: attr for name, attr in (value or {}).items()
+                     if name != 'localId' and attr is not None and defaults.get(name, object()) != attr}
+        elif key == 'marks':
+            value = sorted((normalize_adf(mark) for mark in value or []),
+                           key=lambda mark: json.dumps(mark, sort_keys=True))
+        elif key == 'content':
+            value = normalize_adf(value or [])
+        if value or key in ('text', 'type'):
+            normalized[key] = value
+    return normalized
+
+
+def changed_fields(desired: Dict, current: Dict) -> Dict:
+    """Return the subset of ``desired`` fields whose value differs from Jira's ``current`` one."""
+    changed = {}
+    for field, value in desired.items():
+        have = current.get(field)
+        if field == 'labels':
+            # The run label is added on create and is not part of the plan
+            have = [label for label in have or [] if not label.startswith(RUN_LABEL_PREFIX)]
+            same = sorted(value) == sorted(have)
+        elif field == 'priority':
+            same = (have or {}).get('name') == value.get('name')
+        elif field == 'parent':
+            same = (have or {}).get('key') == value.get('key')
+        elif field == story_points_field():
+            same = have is not None and float(have) == float(value)
+        elif field == 'description':
+            same = have is not None and normalize_adf(have) == normalize_adf(value)
+        else:
+            same = have == value
+        if not same:
+            changed[field] = value
+    return changed
+
+
+def preflight_links(links: List[Dict[str, str]], created_keys: Set[str]
+                    ) -> Tuple[List[Dict[str, str]], int, int]:
+    """
+    Drop links that would fail or are already in Jira, before sending any.
+
+    Tickets created in this run are known to exist and have no links besides
+    the ones folded or already sent, so only the other tickets are looked up,
+    in a few batched JQL searches for their ``issuelinks``. Links touching a
+    ticket Jira does not have, and Blocks links Jira already has, are dropped.
+
+    Returns:
+        Tuple of (links still to create, count pointing at missing tickets,
+        count already in Jira)
+    """
+    import requests
+
+    keys = sorted({link[side] for link in links for side in ('blocker_jira', 'blocked_jira')} - created_keys)
+    if not keys:
+        return links, 0, 0
+
+    print(f"Checking {len(keys)} existing tickets for their current links")
+    try:
+        issues = fetch_issue_fields(keys, ['issuelinks'])
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        print(f"  ⚠ Pre-flight check failed ({e}); sending every link")
+        return links, 0, 0
+
+    existing = set()  # (blocker_jira, blocked_jira), oriented like create_jira_link
+    for jira_key, fields in issues.items():
+        for issue_link in fields.get('issuelinks') or []:
+            if (issue_link.get('type') or {}).get('name') != 'Blocks':
+                continue
+            if 'inwardIssue' in issue_link:
+                existing.add((issue_link['inwardIssue']['key'], jira_key))
+            if 'outwardIssue' in issue_link:
+                existing.add((jira_key, issue_link['outwardIssue']['key']))
+
+    kept = []
+    missing_count = 0
+    existing_count = 0
+    for link in links:
+        pair = (link['blocker_jira'], link['blocked_jira'])
+        absent = [key for key in pair if key not in created_keys and key not in issues]
+        if absent:
+            print(f"  ⚠ Skipped (not in Jira: {', '.join(absent)}): "
+                  f"{link['blocker_logical']} → {link['blocked_logical']}")
+            missing_count += 1
+        elif pair in existing:
+            existing_count += 1
+        else:
+            kept.append(link)
+    return kept, missing_count, existing_count
+
+
+class SyncState:
+    """
+    Content fingerprints of tickets as last pushed to Jira by ``--sync``.
+
+    Kept in ``<markdown_file>.sync.json`` next to the plan. A ticket whose
+    fingerprint still matches is known to be in sync and costs no request.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.fingerprints = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.fingerprints = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"⚠ Warning: Could not read sync state from {self.path}: {e}")
+
+    def matches(self, ticket: Ticket, fingerprint: str) -> bool:
+        entry = self.fingerprints.get(ticket.key)
+        return bool(entry) and entry == {'jira_key': ticket.jira_key, 'fingerprint': fingerprint}
+
+    def record(self, ticket: Ticket, jira_key: str, fingerprint: str):
+        self.fingerprints[ticket.key] = {'jira_key': jira_key, 'fingerprint': fingerprint}
+
+    def save(self):
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.fingerprints, f, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def sync_tickets(tickets: Sequence[Ticket], mapping: Dict[str, str], state: SyncState,
+                 concurrency: int = 1, baseline: Optional[Dict[str, Ticket]] = None
+                 ) -> Tuple[int, int, int]:
+    """
+    Bring existing Jira tickets in line with the plan using minimal edits.
+
+    Tickets whose fingerprint matches ``state`` are skipped outright. The
+    current fields of the rest are fetched with batched JQL searches, and
+    each ticket gets one PUT carrying only the fields that differ - or none
+    at all if Jira already matches.
+
+    ``baseline`` maps logical Keys to the plan's previous version of a
+    ticket. Only the fields that changed since that version are compared
+    and sent, so edits made in Jira to fields the plan left alone survive.
+
+    Returns:
+        Tuple of (updated count, unchanged count, error count)
+    """
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+
+    candidates = []
+    unchanged = 0
+    for ticket in tickets:
+        if not ticket.jira_key:
+            continue
+        desired = build_update_fields(ticket, mapping)
+        fingerprint = payload_hash(desired)
+        if state.matches(ticket, fingerprint):
+            unchanged += 1
+            continue
+        if baseline and ticket.key in baseline:
+            previous = build_update_fields(baseline[ticket.key], mapping)
+            desired = {field: value for field, value in desired.items() if previous.get(field) != value}
+            if not desired:
+                state.record(ticket, ticket.jira_key, fingerprint)
+                unchanged += 1
+                continue
+        candidates.append((ticket, desired, fingerprint))
+    if not candidates:
+        print(f"✓ All {unchanged} existing tickets match their last sync")
+        return 0, unchanged, 0
+
+    field_names = sorted({field for _, desired, _ in candidates for field in desired})
+    print(f"Fetching {len(candidates)} changed tickets ({unchanged} unchanged since last sync)")
+    try:
+        current = fetch_issue_fields([ticket.jira_key for ticket, _, _ in candidates], field_names)
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        print(f"  ✗ Could not fetch current ticket fields: {e}")
+        return 0, unchanged, len(candidates)
+
+    updates = []
+    errors = 0
+    for ticket, desired, fingerprint in candidates:
+        if ticket.jira_key not in current:
+            print(f"  ✗ {ticket.key}: {ticket.jira_key} not found in Jira")
+            errors += 1
+            continue
+        diff = changed_fields(desired, current[ticket.jira_key])
+        if diff:
+            updates.append((ticket, diff, fingerprint))
+        else:
+            state.record(ticket, ticket.jira_key, fingerprint)
+            unchanged += 1
+
+    def update_one(update: Tuple[Ticket, Dict, str]) -> bool:
+        ticket, diff, _ = update
+        return update_jira_ticket(ticket, ticket.jira_key, mapping, diff)
+
+    updated = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for update, success in zip(updates, executor.map(update_one, updates)):
+            if success:
+                state.record(update[0], update[0].jira_key, update[2])
+                updated += 1
+            else:
+                errors += 1
+    return updated, unchanged, errors
+
+
+def payload_hash(payload: Dict) -> str:
+    """Stable SHA-256 of a JSON-serialisable payload."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def ticket_payload_hash(ticket: TicketLike) -> str:
+    """Hash of a ticket's specification, ignoring its Jira Key."""
+    return payload_hash({field: value for field, value in ticket.items() if field != 'Jira Key'})
+
+
+class RunJournal:
+    """
+    Append-only JSONL record of every ticket and link created in a run.
+
+    Before a create is sent, an intent naming the ticket, its payload hash
+    and the run's label is written; each success is written when Jira
+    answers. Every entry is fsync'd immediately. Replaying the journal
+    rebuilds the logical Key → Jira Key mapping and the set of links
+    already created without touching the network, and leaves the intents a
+    crash cut off for confirm_intents() to look up in Jira. The journal is
+    removed once a run completes; its presence therefore marks an
+    unfinished run.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.file = None
+
+    def exists(self) -> bool:
+        """Return True if a non-empty journal is on disk."""
+        return self.path.exists() and self.path.stat().st_size > 0
+
+    def replay(self) -> Tuple[Dict[str, Dict[str, str]], Set[Tuple[str, str]], Dict[str, Dict[str, str]]]:
+        """
+        Read the journal in one pass.
+
+        Returns:
+            Tuple of (logical Key → ticket entry, set of (blocker_jira, blocked_jira) links,
+            logical Key → intent entry for creates sent but never confirmed)
+        """
+        tickets = {}
+        links = set()
+        intents = {}
+        if not self.path.exists():
+            return tickets, links, intents
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only the final line can be torn by a crash mid-write
+                    print(f"  ⚠ Ignoring unreadable journal line {line_number}")
+                    continue
+                if entry.get('type') == 'ticket':
+                    tickets[entry['key']] = entry
+                    intents.pop(entry['key'], None)
+                elif entry.get('type') == 'intent':
+                    intents[entry['key']] = entry
+                elif entry.get('type') == 'link':
+                    links.add((entry['blocker_jira'], entry['blocked_jira']))
+        return tickets, links, intents
+
+    def open(self):
+        """Open the journal for appending."""
+        self.file = open(self.path, 'a', encoding='utf-8')
+
+    def _append(self, *entries: Dict):
+        timestamp = datetime.now(timezone.utc).isoformat()
+        lines = ''.join(json.dumps(dict(entry, timestamp=timestamp), ensure_ascii=False) + '\n'
+                        for entry in entries)
+        with self.lock:
+            self.file.write(lines)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def record_intents(self, tickets: Sequence[Ticket]):
+        """Record that creates for ``tickets`` are about to be sent, with one fsync."""
+        self._append(*({
+            'type': 'intent',
+            'key': ticket.key,
+            'payload_hash': ticket_payload_hash(ticket),
+            'run': run_label(),
+        } for ticket in tickets))
+
+    def record_ticket(self, ticket: Ticket, jira_key: str):
+        """Record a created ticket."""
+        self._append({
+            'type': 'ticket',
+            'key': ticket.key,
+            'jira_key': jira_key,
+            'payload_hash': ticket_payload_hash(ticket),
+        })
+
+    def record_confirmed(self, intent: Dict[str, str], jira_key: str) -> Dict[str, str]:
+        """Record a ticket an unconfirmed intent turned out to create; returns its entry."""
+        entry = {'type': 'ticket', 'key': intent['key'], 'jira_key': jira_key,
+                 'payload_hash': intent['payload_hash']}
+        self._append(entry)
+        return entry
+
+    def record_link(self, link: Dict[str, str]):
+        """Record a created dependency link."""
+        self._append({
+            'type': 'link',
+            'key': f"{link['blocker_logical']}->{link['blocked_logical']}",
+            'blocker_jira': link['blocker_jira'],
+            'blocked_jira': link['blocked_jira'],
+            'payload_hash': payload_hash(link),
+        })
+
+    def close(self):
+        """Close the journal file."""
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def remove(self):
+        """Close and delete the journal after a completed run."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+
+class DryRunJournal(RunJournal):
+    """A journal that can be replayed but is never written, for ``--dry-run``."""
+
+    def open(self):
+        pass
+
+    def _append(self, *entries: Dict):
+        pass
+
+    def remove(self):
+        pass
+
+
+def resume_from_journal(journal: RunJournal, tickets: List[Ticket]) -> Set[Tuple[str, str]]:
+    """
+    Apply a journal replay to freshly parsed tickets.
+
+    Tickets the journal says were created, or that confirm_intents() finds
+    in Jira, get their Jira Key filled in, so Phase 2 skips them exactly
+    like tickets already annotated in the markdown.
+
+    Returns:
+        Set of (blocker_jira, blocked_jira) links that were already created
+    """
+    journaled_tickets, journaled_links, intents = journal.replay()
+    journaled_tickets.update(confirm_intents(journal, intents))
+    resumed = sum(apply_journal_entry(ticket, journaled_tickets) for ticket in tickets)
+    print(f"✓ Resumed {resumed} tickets and {len(journaled_links)} links from {journal.path}")
+    return journaled_links
+
+
+def confirm_intents(journal: RunJournal, intents: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """
+    Check creates an interrupted run sent but never heard back about.
+
+    Each was sent with its run's label, so one search per label tells which
+    exist; those are journaled as created and the rest are created again.
+    Exits if Jira can't be searched, since recreating them blindly could
+    duplicate every one.
+
+    Returns:
+        Dict of logical Key → ticket entry for the intents found in Jira
+    """
+    if not intents:
+        return {}
+    print(f"Checking {len(intents)} creates that were in flight when the last run stopped")
+    by_label = {}
+    for intent in intents.values():
+        by_label.setdefault(intent['run'], []).append(intent['key'])
+    confirmed = {}
+    for label, keys in by_label.items():
+        found = find_created(keys, label, delay=0)
+        if found is None:
+            print("❌ Error: could not tell which of them Jira created; rerun --resume once Jira can be reached")
+            sys.exit(1)
+        for logical_key, jira_key in found.items():
+            confirmed[logical_key] = journal.record_confirmed(intents[logical_key], jira_key)
+    print(f"✓ {len(confirmed)} of them exist in Jira; the other {len(intents) - len(confirmed)} will be created")
+    return confirmed
+
+
+def apply_journal_entry(ticket: Ticket, journaled_tickets: Dict[str, Dict]) -> bool:
+    """Fill in one ticket's Jira Key from a journal replay; True if it was resumed."""
+    entry = journaled_tickets.get(ticket.key)
+    if not entry or ticket.jira_key.strip():
+        return False
+    if entry.get('payload_hash') != ticket_payload_hash(ticket):
+        print(f"  ⚠ {ticket.key} changed since it was created as {entry['jira_key']}; not recreating it")
+    ticket.jira_key = entry['jira_key']
+    return True
+
+
+def create_tickets(tickets: Iterable[TicketLike], concurrency: int = 1, bulk: bool = False,
+                   journal: Optional[RunJournal] = None, fold_links: bool = True,
+                   on_created: Optional[Callable[[str, str, List[str]], None]] = None,
+                   graph: Optional[DependencyGraph] = None,
+                   known: Optional[Dict[str, str]] = None,
+                   validate: Optional[Callable[[Ticket, Dict[str, str]], List[str]]] = None
+                   ) -> Tuple[Dict[str, str], int, int, Set[Tuple[str, str]]]:
+    """
+    Create all tickets that do not yet have a Jira Key.
+
+    Up to ``concurrency`` requests run at once. With ``bulk``, each request
+    carries up to BULK_BATCH_SIZE ready tickets via the bulk endpoint.
+
+    A ticket whose Parent is another ticket in the plan is only submitted
+    after that parent has been created; if the parent fails, the child is
+    counted as an error without sending a request. Ready tickets are
+    submitted in file order, so ``concurrency=1`` behaves exactly like the
+    original serial loop. Each create is recorded in ``journal`` as an
+    intent before it is sent, and as a ticket as soon as its response
+    arrives.
+
+    With ``fold_links``, tickets are also created in topological order of the
+    Blocks graph and every blocker that already exists is linked in the
+    create payload itself. Blockers are only a soft ordering constraint: a
+    failed blocker is simply not linked, and when a cycle stalls the queue
+    the earliest stalled ticket is released and its remaining edges are left
+    for Phase 3.
+
+    ``tickets`` may also be a lazy iterator such as ``stream_markdown()``.
+    Tickets are then pulled only when there is free capacity, so the first
+    requests go out while the rest of the plan is still being parsed. A
+    Parent or blocker that has not been read yet is waited for until it
+    shows up or the stream ends; a Blocks edge to a ticket that was already
+    submitted cannot be folded and is left for Phase 3.
+
+    ``on_created`` is called from the scheduling thread with the logical key,
+    Jira key and folded blocker Jira keys of every ticket as it is created.
+
+    ``known`` maps logical keys of tickets outside ``tickets`` that already
+    exist in Jira, so new tickets can use them as parents and blockers.
+
+    ``validate`` is called with each ticket and the current mapping right
+    before it would be sent; a ticket it reports problems for is counted as
+    an error without a request, exactly like one Jira rejected.
+
+    Returns:
+        Tuple of (logical Key → Jira Key mapping for ``tickets`` in file order,
+        success count, error count, set of (blocker_jira, blocked_jira) links
+        already created)
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    mapping = dict(known or {})  # logical Key → Jira Key
+    success_count = 0
+    error_count = 0
+    folded_links = set()
+
+    # A whole list is scheduled up front; anything else is consumed as a stream
+    streaming = not isinstance(tickets, list)
+    if not streaming:
+        tickets = [as_ticket(ticket) for ticket in tickets]
+    source = iter(tickets)
+    if not streaming and fold_links:
+        graph = graph or DependencyGraph.from_tickets(tickets)
+    upcoming = None if streaming else {ticket.key for ticket in tickets if not ticket.jira_key.strip()}
+
+    position = {}
+    pending = {}
+    failed = set()
+    blockers = {}
+    declared_blockers = {}  # streaming: blocked key → earlier tickets that say they block it
+
+    # A ticket waits on its Parent (hard) and, when folding, its blockers (soft),
+    # but only on those created in this run
+    parent_of = {}
+    waiting_on = {}
+    dependents = {}
+    ready = []
+
+    def outstanding(logical_key: str) -> bool:
+        """Whether ``logical_key`` may still be created by this run."""
+        if logical_key in mapping or logical_key in failed:
+            return False
+        if logical_key in pending:
+            return True
+        if upcoming is not None:
+            return logical_key in upcoming
+        return logical_key not in position and bool(TICKET_KEY_PATTERN.match(logical_key))
+
+    def register(ticket: TicketLike) -> int:
+        """Queue one ticket, returning how many tickets failed without a request."""
+        ticket = as_ticket(ticket)
+        logical_key = ticket.key
+        if logical_key in position:
+            print(f"  ⚠ Skipping duplicate {logical_key}")
+            return 0
+        position[logical_key] = len(position)
+
+        # Check if Jira Key already exists
+        existing_jira_key = ticket.jira_key.strip()
+        if existing_jira_key:
+            print(f"  ⚠ Skipping {logical_key} (already has Jira Key: {existing_jira_key})")
+            mapping[logical_key] = existing_jira_key
+            return resolve(logical_key, True)
+
+        pending[logical_key] = ticket
+        if fold_links and graph is not None:
+            blockers[logical_key] = graph.blockers(logical_key)
+        elif fold_links:
+            own = list(ticket.blocked_by)
+            own.extend(declared_blockers.pop(logical_key, []))
+            blockers[logical_key] = [key for key in dict.fromkeys(own) if key != logical_key]
+            for blocked in ticket.blocks:
+                if blocked not in position:
+                    declared_blockers.setdefault(blocked, []).append(logical_key)
+
+        parent = ticket.parent.strip()
+        if parent in failed:
+            print(f"  ✗ Not creating {logical_key}: parent {parent} was not created")
+            failed.add(logical_key)
+            return 1 + resolve(logical_key, False)
+
+        prerequisites = set(key for key in blockers.get(logical_key, []) if outstanding(key))
+        if parent != logical_key and outstanding(parent):
+            parent_of[logical_key] = parent
+            prerequisites.add(parent)
+        if prerequisites:
+            waiting_on[logical_key] = prerequisites
+            for prerequisite in prerequisites:
+                dependents.setdefault(prerequisite, []).append(logical_key)
+        else:
+            heapq.heappush(ready, (position[logical_key], logical_key))
+        return 0
+
+    def release_unread():
+        """At the end of a stream, stop waiting on keys that never appeared."""
+        for logical_key in list(waiting_on):
+            unread = {key for key in waiting_on[logical_key] if key not in position}
+            if not unread:
+                continue
+            waiting_on[logical_key] -= unread
+            if parent_of.get(logical_key) in unread:
+                # Not in the plan after all; send it to Jira as written
+                del parent_of[logical_key]
+            if not waiting_on[logical_key]:
+                del waiting_on[logical_key]
+                heapq.heappush(ready, (position[logical_key], logical_key))
+
+    def resolve(logical_key: str, created: bool) -> int:
+        """Release tickets waiting on ``logical_key``, returning how many failed with it."""
+        dropped = 0
+        stack = [(logical_key, created)]
+        while stack:
+            prerequisite, ok = stack.pop()
+            for child in dependents.get(prerequisite, []):
+                if child not in waiting_on:
+                    continue
+                if not ok and parent_of.get(child) == prerequisite:
+                    del waiting_on[child]
+                    failed.add(child)
+                    print(f"  ✗ Not creating {child}: parent {prerequisite} was not created")
+                    dropped += 1
+                    stack.append((child, False))
+                    continue
+                waiting_on[child].discard(prerequisite)
+                if not waiting_on[child]:
+                    del waiting_on[child]
+                    heapq.heappush(ready, (position[child], child))
+        return dropped
+
+    def release_stalled() -> bool:
+        """Break a Blocks cycle by releasing the earliest ticket whose parent exists."""
+        stalled = [key for key in waiting_on if parent_of.get(key) not in waiting_on[key]]
+        if not stalled:
+            return False
+        logical_key = min(stalled, key=position.__getitem__)
+        del waiting_on[logical_key]
+        heapq.heappush(ready, (position[logical_key], logical_key))
+        return True
+
+    def linked_blockers(logical_key: str) -> List[str]:
+        return [mapping[key] for key in blockers.get(logical_key, []) if key in mapping]
+
+    def rejected(ticket: Ticket) -> int:
+        """Fail a ticket that does not pass ``validate``, returning how many tickets failed."""
+        problems = validate(ticket, mapping) if validate else []
+        if not problems:
+            return 0
+        for problem in problems:
+            print(f"  ✗ Not creating {ticket.key}: {problem}")
+        failed.add(ticket.key)
+        return 1 + resolve(ticket.key, False)
+
+    def create_one(ticket: Ticket, blocked_by: List[str]) -> Dict[str, Optional[str]]:
+        return {ticket.key: create_jira_ticket(ticket, mapping, blocked_by)}
+
+    if not streaming:
+        for ticket in source:
+            error_count += register(ticket)
+    exhausted = not streaming
+    per_request = BULK_BATCH_SIZE if bulk else 1
+
+    submitted_links = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight = set()
+        while True:
+            # Read just enough of the stream to keep every free worker busy
+            while not exhausted and len(ready) < (concurrency - len(in_flight)) * per_request:
+                ticket = next(source, None)
+                if ticket is None:
+                    exhausted = True
+                    release_unread()
+                else:
+                    error_count += register(ticket)
+
+            while ready and len(in_flight) < concurrency:
+                # A short batch waits while others are in flight: their results
+                # release more tickets, so one dependency level goes out as full
+                # batches instead of fragments
+                if bulk and in_flight and len(ready) < BULK_BATCH_SIZE:
+                    break
+                if bulk:
+                    batch = []
+                    while ready and len(batch) < BULK_BATCH_SIZE:
+                        ticket = pending[heapq.heappop(ready)[1]]
+                        dropped = rejected(ticket)
+                        if dropped:
+                            error_count += dropped
+                        else:
+                            batch.append(ticket)
+                    if not batch:
+                        continue
+                    blocked_by = {ticket.key: linked_blockers(ticket.key) for ticket in batch}
+                    submitted_links.update(blocked_by)
+                    if journal:
+                        journal.record_intents(batch)
+                    print(f"Creating batch of {len(batch)}: {batch[0].key} .. {batch[-1].key}")
+                    in_flight.add(executor.submit(create_jira_tickets_bulk, batch, mapping, blocked_by))
+                else:
+                    ticket = pending[heapq.heappop(ready)[1]]
+                    dropped = rejected(ticket)
+                    if dropped:
+                        error_count += dropped
+                        continue
+                    submitted_links[ticket.key] = linked_blockers(ticket.key)
+                    if journal:
+                        journal.record_intents([ticket])
+                    print(f"Creating {ticket.key}: {ticket.summary}")
+                    in_flight.add(executor.submit(create_one, ticket, submitted_links[ticket.key]))
+
+            if not in_flight:
+                if not exhausted or (waiting_on and release_stalled()):
+                    continue
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                for logical_key, jira_key in future.result().items():
+                    if jira_key:
+                        mapping[logical_key] = jira_key
+                        success_count += 1
+                        if journal:
+                            journal.record_ticket(pending[logical_key], jira_key)
+                        for blocker_jira in submitted_links.get(logical_key, []):
+                            folded_links.add((blocker_jira, jira_key))
+                            if journal:
+                                blocker_logical = next(key for key in blockers[logical_key]
+                                                       if mapping.get(key) == blocker_jira)
+                                journal.record_link({
+                                    'blocker_logical': blocker_logical,
+                                    'blocker_jira': blocker_jira,
+                                    'blocked_logical': logical_key,
+                                    'blocked_jira': jira_key,
+                                })
+                        if on_created:
+                            on_created(logical_key, jira_key, submitted_links.get(logical_key, []))
+                        resolve(logical_key, True)
+                    else:
+                        failed.add(logical_key)
+                        error_count += 1
+                        error_count += resolve(logical_key, False)
+
+    # Anything still waiting is part of a Parent cycle and can never be created
+    for logical_key in waiting_on:
+        print(f"  ✗ Not creating {logical_key}: Parent cycle through {parent_of[logical_key]}")
+        error_count += 1
+
+    ordered = {key: mapping[key] for key in sorted(position, key=position.__getitem__) if key in mapping}
+    return ordered, success_count, error_count, folded_links
 
 
 def update_markdown_with_jira_keys(markdown_file: str, mapping: Dict[str, str]):
@@ -583,58 +1884,175 @@ def update_markdown_with_jira_keys(markdown_file: str, mapping: Dict[str, str]):
     print(f"✓ Updated markdown with Jira Keys")
 
 
-def extract_dependencies(rows: List[Dict[str, str]], mapping: Dict[str, str]) -> List[Dict[str, str]]:
+def extract_dependencies(rows: Sequence[TicketLike], mapping: Dict[str, str],
+                         graph: Optional[DependencyGraph] = None) -> List[Dict[str, str]]:
     """
-    Extract dependency links from CSV rows.
+    Extract dependency links between tickets that have Jira keys.
 
     Returns:
         List of link dictionaries with blocker and blocked keys
     """
-    links_to_create = []
+    graph = graph or DependencyGraph.from_tickets(rows)
+    links = []
+    for blocker_logical, blocked_logical in graph.edges():
+        blocker_jira = mapping.get(blocker_logical)
+        blocked_jira = mapping.get(blocked_logical)
+        if blocker_jira and blocked_jira:
+            links.append({
+                'blocker_logical': blocker_logical,
+                'blocker_jira': blocker_jira,
+                'blocked_logical': blocked_logical,
+                'blocked_jira': blocked_jira
+            })
+    return links
 
-    for row in rows:
-        logical_key = row['Key']
-        jira_key = mapping.get(logical_key)
 
-        if not jira_key:
-            continue
+def report_dependency_graph(graph: DependencyGraph, tickets: Sequence[Ticket]):
+    """Print the shape of the dependency graph and any problems in it."""
+    points = {ticket.key: ticket.points or 0.0 for ticket in tickets}
+
+    levels = graph.topological_levels()
+    path, path_points = graph.critical_path(points)
+    print(f"✓ Dependency graph: {len(graph)} tickets, {graph.edge_count} links, {len(levels)} levels")
+    if path:
+        shown = path if len(path) <= 12 else path[:6] + ['…'] + path[-5:]
+        print(f"  Critical path ({len(path)} tickets, {path_points:g} points): {' → '.join(shown)}")
+    for cycle in graph.cycles():
+        print(f"  ⚠ Dependency cycle: {' → '.join(cycle)}")
+    for owner, field, missing in graph.dangling:
+        print(f"  ⚠ {owner} {field} {missing}, which is not in this plan")
+
+
+# A Jira issue key such as PX-123
+JIRA_KEY_PATTERN = re.compile(r'^([A-Z][A-Z0-9_]*)-\d+$')
+
+
+# "## KEY: Summary", "**Field:** value" and "### Description" lines, read without mistletoe.
+# The colon may sit inside or after the bold ("**Field**: value"); parse_markdown_tickets
+# joins the bold text and the rest of the line before splitting, so it takes either.
+TICKET_HEADING_PATTERN = re.compile(rf'^ {{0,3}}##[ \t]+({TICKET_KEY}): (.+?)(?:[ \t]+#+)?[ \t]*$')
+METADATA_LINE_PATTERN = re.compile(r'^ {0,3}\*\*([^*:\n]+?)(?::\*\*|\*\*[ \t]*:)[ \t]*(.*?)[ \t\\]*$')
+DESCRIPTION_HEADING_PATTERN = re.compile(r'^ {0,3}###[ \t]+(?:Description|Summary)[ \t]*#*[ \t]*$')
+
+
+def read_ticket_metadata(section: str, start: int) -> Optional[Tuple[Ticket, Dict[str, int]]]:
+    """
+    Read a section's key, summary and metadata fields line by line.
 
-        # Process "Blocks" column (this ticket blocks others)
-        blocks = row.get('Blocks', '').strip()
-        if blocks:
-            blocked_keys = [k.strip() for k in blocks.split('|') if k.strip()]
-            for blocked_logical in blocked_keys:
-                blocked_jira = mapping.get(blocked_logical)
-                if blocked_jira:
-                    links_to_create.append({
-                        'blocker_logical': logical_key,
-                        'blocker_jira': jira_key,
-                        'blocked_logical': blocked_logical,
-                        'blocked_jira': blocked_jira
-                    })
-
-        # Process "Is Blocked By" column (this ticket is blocked by others)
-        is_blocked_by = row.get('Is Blocked By', '').strip()
-        if is_blocked_by:
-            blocker_keys = [k.strip() for k in is_blocked_by.split('|') if k.strip()]
-            for blocker_logical in blocker_keys:
-                blocker_jira = mapping.get(blocker_logical)
-                if blocker_jira:
-                    links_to_create.append({
-                        'blocker_logical': blocker_logical,
-                        'blocker_jira': blocker_jira,
-                        'blocked_logical': logical_key,
-                        'blocked_jira': jira_key
-                    })
-
-    # Deduplicate links
-    unique_links = {}
-    for link in links_to_create:
-        key = (link['blocker_jira'], link['blocked_jira'])
-        if key not in unique_links:
-            unique_links[key] = link
-
-    return list(unique_links.values())
+    A cheap stand-in for ``parse_markdown_tickets`` where only the
+    ``**Field:**`` (or ``**Field**:``) lines matter: no mistletoe, and no
+    description. Lines from the ``### Description`` heading on are not read.
+
+    Returns:
+        Tuple of (Ticket without description, field → line number), or None
+        if the section's heading is not a ticket heading
+    """
+    lines = section.split('\n')
+    match = TICKET_HEADING_PATTERN.match(lines[0])
+    if not match:
+        return None
+    ticket = Ticket(match.group(1), match.group(2).strip())
+    field_lines = {}
+    for offset, line in enumerate(lines[1:], 1):
+        if DESCRIPTION_HEADING_PATTERN.match(line) or FENCE_PATTERN.match(line):
+            break
+        match = METADATA_LINE_PATTERN.match(line)
+        if match:
+            field = match.group(1).strip()
+            apply_metadata_field(ticket, field, match.group(2).strip())
+            field_lines[field] = start + offset
+    return ticket, field_lines
+
+
+def lint_plan(lines: Iterable[str]) -> Tuple[int, List[Tuple[int, str]]]:
+    """
+    Find problems that would otherwise surface halfway through a run.
+
+    One pass over the plan's headings and metadata lines, no network
+    access and no markdown parsing:
+    - Story Points that are not a number
+    - Parent, Blocks and Blocked By references to keys not in the plan
+    - logical keys defined more than once
+    - a Parent Jira key that is malformed or outside jira.defaultProjectKey
+
+    Returns:
+        Tuple of (tickets checked, (line number, message) problems in line order)
+    """
+    project_key = default_project_key()
+    problems = []
+    defined = {}  # logical Key → line of its heading
+    references = []  # (line, logical Key, field, referenced key)
+    ticket_count = 0
+
+    for start, section in iter_numbered_sections(lines):
+        metadata = read_ticket_metadata(section, start)
+        if metadata is not None:
+            ticket, field_lines = metadata
+            ticket_count += 1
+            key = ticket.key
+            if key in defined:
+                problems.append((start, f"{key}: duplicate key, first defined on line {defined[key]}"))
+            else:
+                defined[key] = start
+
+            if ticket.story_points.strip() and ticket.points is None:
+                problems.append((field_lines.get('Story Points', start),
+                                 f"{key}: Story Points '{ticket.story_points}' is not a number"))
+
+            parent = ticket.parent.strip()
+            if TICKET_KEY_PATTERN.match(parent):
+                references.append((field_lines.get('Parent', start), key, 'Parent', parent))
+            elif parent:
+                line = field_lines.get('Parent', start)
+                match = JIRA_KEY_PATTERN.match(parent)
+                if not match:
+                    problems.append((line, f"{key}: Parent '{parent}' is not a Jira issue key"))
+                elif match.group(1) != project_key:
+                    problems.append((line, f"{key}: Parent {parent} is in project {match.group(1)}, "
+                                           f"expected {project_key}"))
+
+            for field, targets in (('Blocks', ticket.blocks), ('Blocked By', ticket.blocked_by)):
+                line = field_lines.get(field, start)
+                for target in targets:
+                    references.append((line, key, field, target))
+
+    for line, key, field, target in references:
+        if target == key:
+            problems.append((line, f"{key}: {field} refers to itself"))
+        elif target not in defined:
+            problems.append((line, f"{key}: {field} {target} is not a ticket in this plan"))
+
+    problems.sort()
+    return ticket_count, problems
+
+
+def plan_issue_types(markdown_file: str) -> Set[str]:
+    """Issue types a plan uses, from its metadata lines; empty if the file can't be read."""
+    try:
+        with open(markdown_file, 'r', encoding='utf-8') as f:
+            return {metadata[0].issue_type for metadata in
+                    (read_ticket_metadata(section, start) for start, section in iter_numbered_sections(f))
+                    if metadata is not None}
+    except OSError:
+        return set()
+
+
+def check_plan(markdown_file: str) -> int:
+    """Lint a plan for ``--check``, returning the process exit code."""
+    if not os.path.exists(markdown_file):
+        print(f"❌ Error: Markdown file not found: {markdown_file}")
+        return 1
+
+    with open(markdown_file, 'r', encoding='utf-8') as f:
+        ticket_count, problems = lint_plan(f)
+
+    for line, message in problems:
+        print(f"{markdown_file}:{line}: {message}")
+    if problems:
+        print(f"❌ {len(problems)} problems in {ticket_count} tickets")
+        return 1
+    print(f"✓ {ticket_count} tickets, no problems found")
+    return 0
 
 
 def create_jira_link(link: Dict[str, str]) -> bool:
@@ -644,13 +2062,12 @@ def create_jira_link(link: Dict[str, str]) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if not JIRA_EMAIL or not JIRA_TOKEN:
+    import requests
+
+    if not credentials_available():
         print(f"  ✗ Cannot create link: JIRA_EMAIL or JIRA_TOKEN not set")
         return False
 
-    url = f"{JIRA_BASE_URL}/rest/api/3/issueLink"
-    headers = {"Content-Type": "application/json"}
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
     payload = {
         "type": {"name": "Blocks"},
         "inwardIssue": {"key": link['blocker_jira']},  # The BLOCKER
@@ -658,7 +2075,7 @@ def create_jira_link(link: Dict[str, str]) -> bool:
     }
 
     try:
-        response = requests.post(url, json=payload, headers=headers, auth=auth)
+        response = get_jira_client().post("/rest/api/3/issueLink", payload)
 
         if response.status_code == 201:
             print(f"  ✓ Created link: {link['blocker_logical']} ({link['blocker_jira']}) BLOCKS {link['blocked_logical']} ({link['blocked_jira']})")
@@ -676,73 +2093,557 @@ def create_jira_link(link: Dict[str, str]) -> bool:
         return False
 
 
-def main():
-    """Main execution function."""
-    if len(sys.argv) != 2:
-        print("Usage: python create_jira_tickets_and_links.py <markdown_file>")
-        sys.exit(1)
+class LinkPipeline:
+    """
+    Send dependency links while tickets are still being created.
+
+    Each Blocks edge is queued on a worker pool the moment both of its
+    tickets have Jira keys, so link latency overlaps creation instead of
+    starting after it. Edges folded into a create request, or already
+    recorded in the journal, are never sent. Links between tickets that
+    existed before the run go through preflight_links() first, like the
+    ones Phase 3 sends.
+    """
 
-    markdown_file = sys.argv[1]
+    def __init__(self, tickets: Sequence[Ticket], concurrency: int,
+                 journal: Optional[RunJournal] = None,
+                 done_links: Optional[Set[Tuple[str, str]]] = None,
+                 graph: Optional[DependencyGraph] = None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.journal = journal
+        self.done_links = done_links or set()
+        self.known = {ticket.key: ticket.jira_key.strip()
+                      for ticket in tickets if ticket.jira_key.strip()}
+        self.edges_by_key = {}
+        for edge in (graph or DependencyGraph.from_tickets(tickets)).edges():
+            self.edges_by_key.setdefault(edge[0], []).append(edge)
+            self.edges_by_key.setdefault(edge[1], []).append(edge)
+        self.attempted = set()  # (blocker_jira, blocked_jira)
+        self.missing_count = 0  # links preflight_links() dropped for a ticket Jira doesn't have
+        self.existing_count = 0  # links preflight_links() found already in Jira
+        self.futures = []
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def _send(self, link: Dict[str, str]) -> bool:
+        success = create_jira_link(link)
+        if success and self.journal:
+            self.journal.record_link(link)
+        return success
+
+    def _ready_links(self, logical_key: str, folded: Sequence[str] = ()) -> Iterator[Dict[str, str]]:
+        """Links completed by ``logical_key`` that were not sent yet; marks them attempted."""
+        for blocker, blocked in self.edges_by_key.get(logical_key, []):
+            if blocker not in self.known or blocked not in self.known:
+                continue
+            pair = (self.known[blocker], self.known[blocked])
+            if pair in self.attempted or pair in self.done_links:
+                continue
+            if blocked == logical_key and pair[0] in folded:
+                continue
+            self.attempted.add(pair)
+            yield {
+                'blocker_logical': blocker,
+                'blocker_jira': pair[0],
+                'blocked_logical': blocked,
+                'blocked_jira': pair[1],
+            }
+
+    def start(self):
+        """Queue links between tickets that already had Jira keys before this run."""
+        links = [link for logical_key in list(self.known) for link in self._ready_links(logical_key)]
+        if links:
+            links, self.missing_count, self.existing_count = preflight_links(links, set())
+        for link in links:
+            self.futures.append(self.executor.submit(self._send, link))
+
+    def ticket_created(self, logical_key: str, jira_key: str, folded: Sequence[str] = ()):
+        """Record a new ticket and queue every link it completes."""
+        self.known[logical_key] = jira_key
+        for link in self._ready_links(logical_key, folded):
+            self.futures.append(self.executor.submit(self._send, link))
+
+    def finish(self) -> Tuple[int, int]:
+        """
+        Wait for every queued link.
+
+        Returns:
+            Tuple of (links created, links skipped or failed), where skipped
+            includes those pointing at a ticket Jira doesn't have
+        """
+        self.executor.shutdown(wait=True)
+        succeeded = sum(1 for future in self.futures if future.result())
+        return succeeded, len(self.futures) - succeeded + self.missing_count
+
+
+# Seconds between checks of the plan file in --watch mode
+WATCH_INTERVAL = 1.0
+
+# First line of a ticket section, and the Jira Key line the script writes back
+TICKET_SECTION_PATTERN = re.compile(rf'^ {{0,3}}##[ \t]+({TICKET_KEY}):')
+JIRA_KEY_LINE_PATTERN = re.compile(r'^\s*\*\*Jira Key(?::\*\*|\*\*[ \t]*:)')
+
+
+def section_fingerprints(markdown_file: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Hash every ticket section of a plan without parsing it.
 
-    print("=" * 80)
-    print("Phase 1: Reading Markdown")
-    print("=" * 80)
-    verify_environment()
-    tickets = read_markdown(markdown_file)
+    Jira Key lines are left out of the hash, so writing keys back into the
+    plan does not make a section look edited.
 
-    print("\n" + "=" * 80)
-    print("Phase 2: Creating Jira Tickets")
-    print("=" * 80)
+    Returns:
+        Dict of logical Key → (section hash, section markdown), in plan order
+    """
+    sections = {}
+    with open(markdown_file, 'r', encoding='utf-8') as f:
+        for section in iter_ticket_sections(f):
+            match = TICKET_SECTION_PATTERN.match(section)
+            if not match:
+                continue
+            content = '\n'.join(line for line in section.split('\n') if not JIRA_KEY_LINE_PATTERN.match(line))
+            sections[match.group(1)] = (hashlib.sha256(content.encode('utf-8')).hexdigest(), section)
+    return sections
 
-    mapping = {}  # logical Key → Jira Key
-    success_count = 0
-    error_count = 0
 
-    for ticket in tickets:
-        logical_key = ticket['Key']
+class PlanWatcher:
+    """
+    Keep Jira in step with a plan that is still being edited.
+
+    The plan file is polled after the initial run. When it changes and then
+    stays put for one interval, only the ticket sections whose hash changed
+    are parsed again: new tickets are created (parents and blockers from
+    earlier runs resolve through the in-memory mapping), edited tickets that
+    already exist are updated in place, and Blocks links that appeared are
+    created. Tickets removed from the plan are left alone in Jira.
+
+    Edits go through ``sync_tickets`` with the version of each ticket last
+    pushed as the baseline, so one PUT carries only the fields the edit
+    changed and Jira does not already have. The fingerprints are kept in
+    the same ``<markdown_file>.sync.json`` as ``--sync``'s.
+    """
 
-        # Check if Jira Key already exists
-        existing_jira_key = ticket.get('Jira Key', '').strip()
-        if existing_jira_key:
-            print(f"  ⚠ Skipping {logical_key} (already has Jira Key: {existing_jira_key})")
-            mapping[logical_key] = existing_jira_key
-            continue
+    def __init__(self, markdown_file: str, tickets: Sequence[Ticket], mapping: Dict[str, str],
+                 graph: DependencyGraph, journal: RunJournal, concurrency: int = 1,
+                 bulk: bool = False, fold_links: bool = True, reduce_links: bool = False,
+                 validate: Optional[Callable[[Ticket, Dict[str, str]], List[str]]] = None):
+        self.markdown_file = markdown_file
+        self.validate = validate
+        self.mapping = dict(mapping)
+        self.journal = journal
+        self.concurrency = concurrency
+        self.bulk = bulk
+        self.fold_links = fold_links
+        self.reduce_links = reduce_links
+        self.tickets = {ticket.key: ticket for ticket in tickets}
+        for key, jira_key in self.mapping.items():
+            if key in self.tickets:
+                self.tickets[key].jira_key = jira_key
+        # Version of each ticket Jira was last brought in line with
+        self.synced = dict(self.tickets)
+        self.sync_state = SyncState(f"{markdown_file}.sync.json")
+        # Links of the initial run were all attempted already
+        self.linked = {(self.mapping[blocker], self.mapping[blocked]) for blocker, blocked in graph.edges()
+                       if blocker in self.mapping and blocked in self.mapping}
+        self.hashes = {}
+        for key, (digest, _) in section_fingerprints(markdown_file).items():
+            if key in self.tickets:
+                self.hashes[key] = digest
+        self.last_stat = self._stat()
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.markdown_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
-        print(f"Creating {logical_key}: {ticket['Summary']}")
-        jira_key = create_jira_ticket(ticket)
+    def run(self):
+        """Poll the plan until interrupted with Ctrl-C."""
+        print(f"\nWatching {self.markdown_file} for changes (Ctrl-C to stop)...")
+        # Sections appended while the initial run was in progress
+        self.apply_changes()
+        try:
+            while True:
+                time.sleep(WATCH_INTERVAL)
+                stat = self._stat()
+                if stat is None or stat == self.last_stat:
+                    continue
+                # Let the writer finish before reading a half-written plan
+                while True:
+                    time.sleep(WATCH_INTERVAL)
+                    settled = self._stat()
+                    if settled == stat:
+                        break
+                    stat = settled
+                self.last_stat = stat
+                self.apply_changes()
+        except KeyboardInterrupt:
+            print(f"\n✓ Stopped watching; {len(self.mapping)} tickets mapped to Jira")
+
+    def apply_changes(self):
+        """Re-parse changed sections and push them to Jira."""
+        sections = section_fingerprints(self.markdown_file)
+        changed = [key for key, (digest, _) in sections.items() if self.hashes.get(key) != digest]
+        for key in set(self.hashes) - set(sections):
+            print(f"  ⚠ {key} was removed from the plan; leaving {self.mapping.get(key, 'it')} in Jira")
+            del self.hashes[key]
+        if not changed:
+            return
 
-        if jira_key:
-            mapping[logical_key] = jira_key
-            success_count += 1
-        else:
-            error_count += 1
+        print("\n" + "=" * 80)
+        print(f"Plan changed: {len(changed)} ticket sections")
+        print("=" * 80)
+
+        new_tickets = []
+        edited_tickets = []
+        for key in changed:
+            parsed = parse_markdown_tickets(sections[key][1])
+            if not parsed:
+                continue
+            ticket = parsed[0]
+            if ticket.jira_key:
+                self.mapping.setdefault(key, ticket.jira_key)
+            ticket.jira_key = self.mapping.get(key, '')
+            self.tickets[key] = ticket
+            (edited_tickets if ticket.jira_key else new_tickets).append(ticket)
+
+        graph = DependencyGraph.from_tickets([self.tickets[key] for key in sections if key in self.tickets])
+        if self.reduce_links:
+            graph = graph.transitive_reduction()
+
+        created, success_count, error_count, folded_links = create_tickets(
+            new_tickets, self.concurrency, self.bulk, self.journal, fold_links=self.fold_links,
+            graph=graph, known=self.mapping, validate=self.validate
+        )
+        self.mapping.update(created)
+        self.linked |= folded_links
+        for key, jira_key in created.items():
+            ticket = self.tickets[key]
+            ticket.jira_key = jira_key
+            self.hashes[key] = sections[key][0]
+            self.synced[key] = ticket
+            self.sync_state.record(ticket, jira_key, payload_hash(build_update_fields(ticket, self.mapping)))
+
+        update_count = 0
+        if edited_tickets:
+            update_count, _, _ = sync_tickets(edited_tickets, self.mapping, self.sync_state,
+                                              self.concurrency, baseline=self.synced)
+            # Failed edits keep their old hash and baseline, so the next change retries them
+            for ticket in edited_tickets:
+                if self.sync_state.matches(ticket, payload_hash(build_update_fields(ticket, self.mapping))):
+                    self.hashes[ticket.key] = sections[ticket.key][0]
+                    self.synced[ticket.key] = ticket
+        if created or edited_tickets:
+            self.sync_state.save()
+
+        if created:
+            update_markdown_with_jira_keys(self.markdown_file, created)
+            self.last_stat = self._stat()
+
+        link_count = 0
+        for link in extract_dependencies(list(self.tickets.values()), self.mapping, graph):
+            pair = (link['blocker_jira'], link['blocked_jira'])
+            if pair in self.linked:
+                continue
+            self.linked.add(pair)
+            if create_jira_link(link):
+                link_count += 1
+                self.journal.record_link(link)
+
+        print(f"✓ Created {success_count} tickets ({error_count} errors), updated {update_count}, "
+              f"linked {link_count + len(folded_links)}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Create Jira tickets and dependency links from a markdown plan."
+    )
+    parser.add_argument('markdown_file', help="Markdown file with ticket specifications")
+    parser.add_argument(
+        '--check', action='store_true',
+        help="Only lint the plan (story points, dangling references, duplicate keys, "
+             "Parent project) and exit nonzero on problems; no Jira access"
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help="Do everything but talk to Jira: write the requests a real run would send, "
+             "with estimated counts and batch sizes, to a JSONL file"
+    )
+    parser.add_argument(
+        '--dry-run-output', metavar='PATH',
+        help="Request plan location for --dry-run (default: <markdown_file>.dry-run.jsonl)"
+    )
+    parser.add_argument(
+        '--concurrency', type=int, default=1, metavar='N',
+        help="Number of tickets to create in parallel (default: 1)"
+    )
+    parser.add_argument(
+        '--bulk', action='store_true',
+        help=f"Create tickets in batches of up to {BULK_BATCH_SIZE} via /rest/api/3/issue/bulk"
+    )
+    parser.add_argument(
+        '--link-strategy', choices=('fold', 'separate'), default='fold',
+        help="fold: add Blocks links to the create request when the blocker already exists, "
+             "creating tickets in dependency order; separate: one /issueLink call per link "
+             "after all tickets exist (default: fold)"
+    )
+    parser.add_argument(
+        '--reduce-links', action='store_true',
+        help="Skip Blocks links already implied by other links (transitive reduction)"
+    )
+    parser.add_argument(
+        '--pipeline', action='store_true',
+        help="Create each dependency link as soon as both of its tickets exist, "
+             "overlapping Phase 2 and Phase 3"
+    )
+    parser.add_argument(
+        '--stream', action='store_true',
+        help="Parse the plan one ticket at a time and start creating tickets while "
+             "the rest of the file is still being read"
+    )
+    parser.add_argument(
+        '--sync', action='store_true',
+        help="Update tickets that already have a Jira Key when their plan content "
+             "changed, sending only the fields that differ"
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help="After the run, keep watching the plan and create, update and link "
+             "only the tickets whose sections change"
+    )
+    parser.add_argument(
+        '--no-validate', action='store_true',
+        help="Send payloads without checking issue type, priority and story points "
+             "against the project's cached create metadata"
+    )
+    parser.add_argument(
+        '--metrics', metavar='PATH',
+        help="Write phase wall times and per-endpoint request latency (p50/p95/p99), "
+             "retries and bytes to a JSON file"
+    )
+    parser.add_argument(
+        '--metrics-textfile', metavar='PATH',
+        help="Write the same metrics as a Prometheus textfile (e.g. for node_exporter's textfile collector)"
+    )
+    parser.add_argument(
+        '--profile', metavar='DIR',
+        help="Profile each phase with cProfile and tracemalloc; writes one .pstats file per phase "
+             "and summary.txt to DIR"
+    )
+    parser.add_argument(
+        '--profile-top', type=int, metavar='N',
+        help="Functions and allocation sites listed per phase in the summary (default: 15)"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help="Always parse the plan instead of reusing the parse cache in ~/.claude/cache"
+    )
+    parser.add_argument(
+        '--journal', metavar='PATH',
+        help="Run journal location (default: <markdown_file>.journal.jsonl)"
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help="Replay the journal of an interrupted run and skip work it already finished"
+    )
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.stream and (args.reduce_links or args.pipeline):
+        parser.error("--stream cannot be combined with --reduce-links or --pipeline, "
+                     "which need the whole dependency graph up front")
+    if args.dry_run and args.watch:
+        parser.error("--dry-run cannot be combined with --watch")
+    return args
+
+
+def main():
+    """Main execution function."""
+    args = parse_args()
+    markdown_file = args.markdown_file
+
+    if args.check:
+        sys.exit(check_plan(markdown_file))
+
+    metrics = RunMetrics()
+    profiler = None
+    if args.profile:
+        from phase_profiler import PhaseProfiler
+        profiler = PhaseProfiler(args.profile, args.profile_top)
+
+    dry_run = None
+    if args.dry_run:
+        from dry_run import DryRunClient
+        settings = http_config()
+        dry_run = DryRunClient(args.dry_run_output or f"{markdown_file}.dry-run.jsonl", JIRA_BASE_URL or '',
+                               issue_types=plan_issue_types(markdown_file),
+                               story_points_field=story_points_field(),
+                               requests_per_second=(settings.get('requestsPerSecond')
+                                                    or settings.get('maxRequestsPerSecond', 100)),
+                               max_requests_per_second=settings.get('maxRequestsPerSecond', 100),
+                               metrics=metrics)
+        use_jira_client(dry_run)
+        print(f"Dry run: nothing is sent to Jira; requests are written to {dry_run.path}")
+
+    def begin_phase(phase: Optional[str]):
+        metrics.begin(phase)
+        if profiler:
+            profiler.begin(phase)
+        if dry_run:
+            dry_run.phase = phase
+
+    journal_class = DryRunJournal if dry_run else RunJournal
+    journal = journal_class(args.journal or f"{markdown_file}.journal.jsonl")
+    if not args.resume and journal.exists():
+        print(f"❌ Error: {journal.path} is left over from an interrupted run")
+        print("  Rerun with --resume to continue it, or delete the journal to start over")
+        sys.exit(1)
+
+    elided_link_count = 0
+    pipeline = None
+    cache = None if args.no_cache else get_parse_cache()
+    if args.stream:
+        print("=" * 80)
+        print("Phase 1-2: Streaming Markdown into Jira Tickets")
+        print("=" * 80)
+        begin_phase('stream')
+        if not dry_run:
+            verify_environment()
+        journaled_tickets, done_links, intents = journal.replay() if args.resume else ({}, set(), {})
+        journal.open()
+        client = get_jira_client(pool_size=max(args.concurrency, http_config().get('poolSize', 10)),
+                                 metrics=metrics)
+        if args.resume:
+            journaled_tickets.update(confirm_intents(journal, intents))
+            print(f"✓ Resuming from {journal.path}: {len(journaled_tickets)} tickets "
+                  f"and {len(done_links)} links already created")
+        validate = None if args.no_validate else get_payload_validator()
+
+        tickets = []
+
+        def streamed_tickets():
+            for ticket in stream_markdown(markdown_file, cache):
+                apply_journal_entry(ticket, journaled_tickets)
+                tickets.append(ticket)
+                yield ticket
+
+        mapping, success_count, error_count, folded_links = create_tickets(
+            streamed_tickets(), args.concurrency, args.bulk, journal,
+            fold_links=args.link_strategy == 'fold', validate=validate
+        )
+        print(f"\n✓ Read {len(tickets)} tickets from markdown")
+        graph = DependencyGraph.from_tickets(tickets)
+        report_dependency_graph(graph, tickets)
+        pipelined_success_count, pipelined_skip_count = 0, 0
+    else:
+        print("=" * 80)
+        print("Phase 1: Reading Markdown")
+        print("=" * 80)
+        begin_phase('parse')
+        if not dry_run:
+            verify_environment()
+        tickets = read_markdown(markdown_file, cache)
+        graph = DependencyGraph.from_tickets(tickets)
+        report_dependency_graph(graph, tickets)
+        if args.reduce_links:
+            reduced = graph.transitive_reduction()
+            elided_link_count = graph.edge_count - reduced.edge_count
+            graph = reduced
+            print(f"✓ Transitive reduction: {elided_link_count} redundant links will not be created")
+
+        journal.open()
+
+        # The link pipeline runs its own workers alongside ticket creation
+        workers = args.concurrency * 2 if args.pipeline else args.concurrency
+        client = get_jira_client(pool_size=max(workers, http_config().get('poolSize', 10)), metrics=metrics)
+        done_links = resume_from_journal(journal, tickets) if args.resume else set()
+        validate = None if args.no_validate else get_payload_validator()
+
+        print("\n" + "=" * 80)
+        print("Phase 2: Creating Jira Tickets" + (" and Dependency Links" if args.pipeline else ""))
+        print("=" * 80)
+        begin_phase('create')
+
+        if args.pipeline:
+            pipeline = LinkPipeline(tickets, args.concurrency, journal, done_links, graph)
+            pipeline.start()
+
+        mapping, success_count, error_count, folded_links = create_tickets(
+            tickets, args.concurrency, args.bulk, journal, fold_links=args.link_strategy == 'fold',
+            on_created=pipeline.ticket_created if pipeline else None, graph=graph, validate=validate
+        )
+
+        pipelined_success_count, pipelined_skip_count = pipeline.finish() if pipeline else (0, 0)
 
     print(f"\nTicket Creation Summary:")
     print(f"  Success: {success_count}")
     print(f"  Errors: {error_count}")
     print(f"  Total: {len(tickets)}")
 
+    if args.sync:
+        print("\n" + "=" * 80)
+        print("Syncing Existing Tickets")
+        print("=" * 80)
+        begin_phase('sync')
+        sync_state = SyncState(f"{markdown_file}.sync.json")
+        updated_count, unchanged_count, sync_error_count = sync_tickets(
+            tickets, mapping, sync_state, args.concurrency
+        )
+        # Tickets created in this run are in sync by definition
+        for ticket in tickets:
+            if not ticket.jira_key and ticket.key in mapping:
+                sync_state.record(ticket, mapping[ticket.key],
+                                  payload_hash(build_update_fields(ticket, mapping)))
+        if not dry_run:
+            sync_state.save()
+        print(f"\nSync Summary:")
+        print(f"  Updated: {updated_count}")
+        print(f"  Unchanged: {unchanged_count}")
+        print(f"  Errors: {sync_error_count}")
+
     if mapping:
         print("\n" + "=" * 80)
         print("Updating Markdown with Jira Keys")
         print("=" * 80)
-        update_markdown_with_jira_keys(markdown_file, mapping)
+        begin_phase('write_back')
+        if dry_run:
+            print(f"Dry run: leaving {markdown_file} unchanged")
+        else:
+            update_markdown_with_jira_keys(markdown_file, mapping)
 
     print("\n" + "=" * 80)
     print("Phase 3: Creating Dependency Links")
     print("=" * 80)
-
-    links = extract_dependencies(tickets, mapping)
+    begin_phase('links')
+
+    links = extract_dependencies(tickets, mapping, graph)
+    if folded_links:
+        links = [link for link in links if (link['blocker_jira'], link['blocked_jira']) not in folded_links]
+        print(f"{len(folded_links)} links were created together with their tickets")
+    if done_links:
+        links = [link for link in links if (link['blocker_jira'], link['blocked_jira']) not in done_links]
+        print(f"Skipping {len(done_links)} links already created according to the journal")
+    if pipeline:
+        links = [link for link in links if (link['blocker_jira'], link['blocked_jira']) not in pipeline.attempted]
+        print(f"{len(pipeline.futures)} links were sent while tickets were being created")
+    created_keys = {mapping[ticket.key] for ticket in tickets if not ticket.jira_key and ticket.key in mapping}
+    links, missing_link_count, existing_link_count = preflight_links(links, created_keys)
+    if pipeline:
+        existing_link_count += pipeline.existing_count
+    if existing_link_count:
+        print(f"{existing_link_count} links already exist in Jira")
     print(f"Found {len(links)} unique dependency links to create\n")
 
-    link_success_count = 0
-    link_skip_count = 0
+    link_success_count = pipelined_success_count
+    link_skip_count = pipelined_skip_count + missing_link_count
     link_error_count = 0
 
     for link in links:
         success = create_jira_link(link)
         if success:
             link_success_count += 1
+            journal.record_link(link)
         else:
             link_skip_count += 1
 
@@ -750,7 +2651,58 @@ def main():
     print(f"  Success: {link_success_count}")
     print(f"  Skipped: {link_skip_count}")
     print(f"  Errors: {link_error_count}")
-    print(f"  Total: {len(links)}")
+    print(f"  Already in Jira: {existing_link_count}")
+    print(f"  Total: {len(links) + missing_link_count + existing_link_count + pipelined_success_count + pipelined_skip_count}")
+    if args.reduce_links:
+        print(f"  Elided (redundant): {elided_link_count}")
+    begin_phase(None)
+
+    stats = client.connection_stats()
+    print(f"\nHTTP Connection Summary:")
+    print(f"  Requests: {stats['requests']}")
+    print(f"  Connections opened: {stats['connections']}")
+    print(f"  Reused: {stats['reused']}")
+    print(f"  Retries: {stats['retries']}")
+    print(f"  Throttled: {stats['throttled']}")
+
+    if args.watch:
+        begin_phase('watch')
+        PlanWatcher(
+            markdown_file, tickets, mapping, graph, journal, args.concurrency, args.bulk,
+            fold_links=args.link_strategy == 'fold', reduce_links=args.reduce_links, validate=validate
+        ).run()
+
+    client.close()
+    journal.remove()
+
+    if dry_run:
+        summary = dry_run.summary()
+        print(f"\nDry Run Request Plan:")
+        for endpoint, count in summary['endpoints'].items():
+            sizes = summary['batch_sizes'].get(endpoint)
+            batches = f" ({sum(sizes)} items, {min(sizes)}-{max(sizes)} per request)" if sizes else ""
+            print(f"  {endpoint}: {count}{batches}")
+        print(f"  Total: {summary['requests']} requests, about {summary['estimated_seconds']:g}s at "
+              f"{summary['requests_per_second']:g} requests/s (retries and throttling not included)")
+        print(f"✓ Wrote the request plan to {dry_run.path}")
+
+    for name, value in (('tickets_total', len(tickets)), ('tickets_created', success_count),
+                        ('ticket_errors', error_count), ('links_folded', len(folded_links)),
+                        ('links_created', link_success_count), ('links_skipped', link_skip_count),
+                        ('links_existing', existing_link_count), ('links_elided', elided_link_count)):
+        metrics.count(name, value)
+    if args.metrics:
+        metrics.write_json(args.metrics)
+        print(f"\n✓ Wrote metrics to {args.metrics}")
+    if args.metrics_textfile:
+        metrics.write_prometheus(args.metrics_textfile)
+        print(f"✓ Wrote Prometheus metrics to {args.metrics_textfile}")
+    if profiler:
+        summary_path = profiler.finish()
+        print(f"\nPhase Profile:")
+        for result in profiler.results:
+            print(f"  {result.line()}")
+        print(f"✓ Wrote profiles and {summary_path}")
 
     print("\n" + "=" * 80)
     print("Complete!")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Stand-in Jira client for ``--dry-run``.
+
+DryRunClient takes the place of JiraClient, so parsing, ADF conversion,
+dependency extraction, validation and scheduling all run exactly as in a
+real run, but nothing is sent. Every request is written, in the order
+the run issued it, to a JSONL file together with the response the run
+was given, and answered locally:
+- created issues get placeholder keys such as ``PX-DRY1``, which later
+  payloads (Parent, folded links) refer to like real keys
+- JQL searches for ``key in (...)`` find every key, with no fields and
+  no links, so existing tickets are assumed to exist and a sync sends
+  every field it controls
+- edits and links succeed
+- create metadata requests are answered as if nothing were cached, with
+  every issue type the plan uses (one listing page per project, one
+  fields request per issue type) and no restriction on priorities, so
+  the createmeta requests match a cold-cache run; fresh on-disk metadata
+  is still used, and never overwritten
+- anything else answers 503
+
+The last line of the file is a summary with the request count per
+endpoint, the bulk and search batch sizes, and how long the requests
+would take at the configured request rate. Retries, throttling and
+failed requests are not simulated, so real runs can only cost more.
+"""
+
+import json
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from run_metrics import RunMetrics, endpoint_name
+
+
+PLACEHOLDER_MARKER = 'DRY'
+UNSIMULATED_STATUS = 503
+
+CREATEMETA_PATTERN = re.compile(r'^/rest/api/3/issue/createmeta/[^/]+/issuetypes(?:/(\d+))?$')
+
+KEY_IN_PATTERN = re.compile(r'\bkey\s+in\s*\(([^)]*)\)', re.IGNORECASE)
+KEY_EQUALS_PATTERN = re.compile(r'\bkey\s*=\s*"?([A-Za-z][A-Za-z0-9_]*-[A-Za-z0-9]+)"?', re.IGNORECASE)
+
+
+class DryRunResponse:
+    """The parts of requests.Response the script reads."""
+
+    __slots__ = ('status_code', 'body', 'text', 'headers')
+
+    def __init__(self, status_code: int, body: Optional[Dict] = None):
+        self.status_code = status_code
+        self.body = body
+        self.text = json.dumps(body) if body is not None else ''
+        self.headers = {}
+
+    def json(self) -> Dict:
+        return self.body
+
+
+class DryRunClient:
+    """Records requests to ``path`` as JSONL and answers them without any network."""
+
+    dry_run = True
+
+    def __init__(self, path: str, base_url: str = '', issue_types: Iterable[str] = (),
+                 story_points_field: str = '', requests_per_second: float = 100.0,
+                 max_requests_per_second: float = 100.0, metrics: Optional[RunMetrics] = None):
+        self.path = path
+        self.base_url = base_url.rstrip('/')
+        self.issue_types = sorted(issue_types)
+        self.story_points_field = story_points_field
+        self.requests_per_second = requests_per_second
+        self.max_requests_per_second = max_requests_per_second
+        self.metrics = metrics
+        self.phase = None
+        self.requests = 0
+        self.endpoints = {}  # endpoint → request count
+        self.batch_sizes = {}  # endpoint → items per request, for bulk creates and key searches
+        self.issues = 0
+        self.folded_links = 0
+        self.lock = threading.Lock()
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None,
+                params: Optional[Dict] = None) -> DryRunResponse:
+        with self.lock:
+            self.requests += 1
+            seq = self.requests
+            response, batch = self._answer(method, path, payload, params)
+            endpoint = endpoint_name(method, path)
+            self.endpoints[endpoint] = self.endpoints.get(endpoint, 0) + 1
+            if batch is not None:
+                self.batch_sizes.setdefault(endpoint, []).append(batch)
+
+            record = {'type': 'request', 'seq': seq, 'phase': self.phase, 'method': method, 'path': path}
+            if params:
+                record['params'] = params
+            if payload is not None:
+                record['body'] = payload
+            record['response'] = {'status': response.status_code, 'body': response.body}
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        if self.metrics is not None:
+            body = json.dumps(payload) if payload is not None else ''
+            self.metrics.record_request(method, path, 0.0, response.status_code,
+                                        len(body), len(response.text), retry=False)
+        return response
+
+    def _answer(self, method: str, path: str, payload: Optional[Dict], params: Optional[Dict]):
+        """Return (response, batch size or None) for one request; called with the lock held."""
+        match = CREATEMETA_PATTERN.match(path) if method == 'GET' else None
+        if match:
+            return DryRunResponse(200, self._createmeta(match.group(1), params or {})), None
+        if method == 'POST' and path == '/rest/api/3/issue':
+            return DryRunResponse(201, self._create(payload)), None
+        if method == 'POST' and path == '/rest/api/3/issue/bulk':
+            updates = payload.get('issueUpdates', [])
+            return DryRunResponse(201, {'issues': [self._create(update) for update in updates],
+                                        'errors': []}), len(updates)
+        if method == 'PUT' and path.startswith('/rest/api/3/issue/'):
+            return DryRunResponse(204), None
+        if method == 'POST' and path == '/rest/api/3/issueLink':
+            return DryRunResponse(201), None
+        if method == 'POST' and path == '/rest/api/3/search/jql':
+            keys = searched_keys(payload.get('jql', ''))
+            return DryRunResponse(200, {'issues': [{'key': key, 'fields': {}} for key in keys],
+                                        'isLast': True}), len(keys)
+        return DryRunResponse(UNSIMULATED_STATUS, {'errorMessages': ['Not simulated in a dry run']}), None
+
+    def _createmeta(self, issue_type_id: Optional[str], params: Dict) -> Dict:
+        """One page of a project's issue types, or of one issue type's create-screen fields."""
+        if issue_type_id is None:
+            items = [{'id': str(position + 1), 'name': name} for position, name in enumerate(self.issue_types)]
+            list_key = 'issueTypes'
+        else:
+            items = [{'fieldId': 'priority', 'name': 'Priority'}]
+            if self.story_points_field:
+                items.append({'fieldId': self.story_points_field, 'name': 'Story Points'})
+            list_key = 'fields'
+        start = int(params.get('startAt', 0))
+        page_size = int(params.get('maxResults', 50))
+        return {list_key: items[start:start + page_size], 'startAt': start, 'maxResults': page_size,
+                'total': len(items)}
+
+    def _create(self, payload: Dict) -> Dict:
+        self.issues += 1
+        self.folded_links += len(payload.get('update', {}).get('issuelinks', []))
+        project = payload.get('fields', {}).get('project', {}).get('key', 'DRY')
+        key = f"{project}-{PLACEHOLDER_MARKER}{self.issues}"
+        return {'id': str(self.issues), 'key': key, 'self': f"{self.base_url}/rest/api/3/issue/{self.issues}"}
+
+    def post(self, path: str, payload: Dict) -> DryRunResponse:
+        return self.request('POST', path, payload)
+
+    def get(self, path: str, params: Optional[Dict] = None) -> DryRunResponse:
+        return self.request('GET', path, params=params)
+
+    def put(self, path: str, payload: Dict) -> DryRunResponse:
+        return self.request('PUT', path, payload)
+
+    def summary(self) -> Dict:
+        """Estimated request counts, batch sizes and duration of the recorded run."""
+        with self.lock:
+            return {
+                'type': 'summary',
+                'requests': self.requests,
+                'endpoints': dict(sorted(self.endpoints.items())),
+                'batch_sizes': {endpoint: sizes for endpoint, sizes in sorted(self.batch_sizes.items())},
+                'issues_created': self.issues,
+                'links_folded': self.folded_links,
+                'links_created': self.endpoints.get('POST /rest/api/3/issueLink', 0),
+                'requests_per_second': self.requests_per_second,
+                'estimated_seconds': round(self.requests / self.requests_per_second, 1),
+                'estimated_seconds_at_max_rate': round(self.requests / self.max_requests_per_second, 1),
+            }
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Same shape as JiraClient.connection_stats(); no connections are ever opened."""
+        return {'requests': self.requests, 'connections': 0, 'reused': 0, 'retries': 0, 'throttled': 0}
+
+    def close(self):
+        """Append the summary line and close the file."""
+        if self.file is None:
+            return
+        summary = self.summary()
+        with self.lock:
+            self.file.write(json.dumps(summary) + '\n')
+            self.file.close()
+            self.file = None
+
+
+def searched_keys(jql: str) -> List[str]:
+    """Issue keys a ``key in (...)`` or ``key = X`` JQL query asks for."""
+    match = KEY_IN_PATTERN.search(jql)
+    if match:
+        return [key.strip().strip('"') for key in match.group(1).split(',') if key.strip()]
+    match = KEY_EQUALS_PATTERN.search(jql)
+    return [match.group(1)] if match else []
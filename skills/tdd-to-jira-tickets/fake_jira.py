@@ -0,0 +1,683 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Jira Cloud REST API.
+
+Serves the endpoints the ticket creator talks to from in-memory state, so
+throughput and retry behaviour can be exercised on a laptop without a
+real tenant:
+- POST /rest/api/3/issue and /rest/api/3/issue/bulk
+- GET / PUT /rest/api/3/issue/{key}
+- POST /rest/api/3/issueLink
+- GET / POST /rest/api/3/search and POST /rest/api/3/search/jql
+- GET /rest/api/3/issue/createmeta/{project}/issuetypes[/{id}]
+
+Every request can be slowed down (fixed latency plus random jitter),
+throttled by a token bucket that answers 429 with the Retry-After and
+X-RateLimit-* headers Jira Cloud sends, or failed at random with a 429 or
+5xx. An injected 502 or 504 is a gateway giving up after Jira did the
+work, so the request still takes effect, as real ones sometimes do.
+Faults come from a seeded generator, so a run can be replayed.
+
+Usage:
+    python fake_jira.py [--port 8765] [--latency 0.05] [--rate-limit 20]
+        [--error-rate 0.02] [--existing PX-9000]
+
+    JIRA_BASE_URL=http://127.0.0.1:8765 JIRA_EMAIL=me JIRA_TOKEN=x \\
+        python create_jira_tickets_and_links.py plan.md
+
+GET /_fake/stats reports requests per endpoint, statuses and injected
+faults; POST /_fake/reset clears issues, links and counters.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+DEFAULT_PORT = 8765
+DEFAULT_PROJECTS = ('PX',)
+DEFAULT_STORY_POINTS_FIELD = 'customfield_10115'
+ISSUE_TYPES = ('Epic', 'Story', 'Task', 'Sub-task', 'Bug')
+PRIORITIES = ('Highest', 'High', 'Medium', 'Low', 'Lowest')
+LINK_TYPES = ('Blocks', 'Relates', 'Duplicate', 'Cloners')
+BULK_LIMIT = 50
+SEARCH_PAGE_SIZE = 100
+INJECTED_ERROR_STATUSES = (500, 502, 503, 504)
+# Injected after the request was carried out, like a gateway timing out on Jira
+LATE_ERROR_STATUSES = frozenset({502, 504})
+
+ISSUE_KEY_PATTERN = re.compile(r'^([A-Z][A-Z0-9_]*)-(\d+)$')
+JQL_KEY_IN_PATTERN = re.compile(r'^\s*(?:key|issuekey)\s+in\s*\(([^)]*)\)\s*$', re.IGNORECASE)
+JQL_KEY_EQUALS_PATTERN = re.compile(r'^\s*(?:key|issuekey)\s*=\s*"?([A-Z][A-Z0-9_]*-\d+)"?\s*$', re.IGNORECASE)
+JQL_PROJECT_PATTERN = re.compile(r'^\s*project\s*=\s*"?([A-Za-z][A-Za-z0-9_]*)"?\s*$', re.IGNORECASE)
+JQL_LABELS_PATTERN = re.compile(r'^\s*labels\s*=\s*"?([^"\s]+)"?\s*$', re.IGNORECASE)
+
+# (status, headers, JSON body or None)
+Response = Tuple[int, Dict[str, str], Optional[object]]
+
+
+def error(status: int, *messages: str, **field_errors: str) -> Response:
+    """A Jira-shaped error response."""
+    return status, {}, {'errorMessages': list(messages), 'errors': field_errors}
+
+
+class TokenBucket:
+    """Server-side rate limit: ``rate`` requests per second with a burst of ``burst``."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> Tuple[bool, float]:
+        """
+        Spend a token if one is available.
+
+        Returns:
+            Tuple of (allowed, seconds until the next token)
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True, 0.0
+        return False, (1.0 - self.tokens) / self.rate
+
+
+class FakeJira:
+    """
+    In-memory Jira: issues, links and create metadata, plus fault injection.
+
+    ``handle()`` is independent of the HTTP layer, so the same state can sit
+    behind FakeJiraServer or be driven directly.
+    """
+
+    def __init__(self, projects: Iterable[str] = DEFAULT_PROJECTS,
+                 story_points_field: str = DEFAULT_STORY_POINTS_FIELD,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit: Optional[float] = None, burst: Optional[float] = None,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 existing: Iterable[str] = (), seed: Optional[int] = None):
+        self.projects = tuple(projects)
+        self.story_points_field = story_points_field
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.existing = tuple(existing)
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop all issues, links and counters, then re-seed ``existing`` issues."""
+        with self.lock:
+            self.random = random.Random(self.seed)
+            self.bucket = TokenBucket(self.rate_limit, self.burst) if self.rate_limit else None
+            self.issues = {}  # key → {'id', 'key', 'fields'}
+            self.links = set()  # (link type, inward key, outward key)
+            self.counters = {project: 0 for project in self.projects}
+            self.next_id = 10000
+            self.requests = Counter()  # "METHOD /endpoint" → count
+            self.statuses = Counter()
+            self.faults = Counter()  # 'throttled' / 'injected_429' / 'injected_5xx'
+            self.bytes_received = 0
+            self.bytes_sent = 0
+        for key in self.existing:
+            self.seed_issue(key)
+
+    def seed_issue(self, key: str, issue_type: str = 'Epic', summary: Optional[str] = None):
+        """Create an issue with a fixed key, e.g. the Epic a plan's tickets hang off."""
+        match = ISSUE_KEY_PATTERN.match(key)
+        if not match:
+            raise ValueError(f"not an issue key: {key}")
+        project, number = match.group(1), int(match.group(2))
+        with self.lock:
+            self.counters[project] = max(self.counters.get(project, 0), number)
+            self._store(key, {
+                'project': {'key': project},
+                'issuetype': {'name': issue_type},
+                'summary': summary or key,
+            })
+
+    def _store(self, key: str, fields: Dict) -> Dict:
+        self.next_id += 1
+        fields = dict(fields)
+        fields['issuelinks'] = []
+        issue = {'id': str(self.next_id), 'key': key, 'fields': fields}
+        self.issues[key] = issue
+        return issue
+
+    # Request handling
+
+    def handle(self, method: str, path: str, query: Dict[str, List[str]],
+               body: Optional[object]) -> Response:
+        """Answer one API request, applying latency and faults first."""
+        endpoint = self.endpoint(method, path)
+        rate_headers = {}
+        if not path.startswith('/_fake/'):
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay > 0:
+                time.sleep(delay)
+            fault, rate_headers = self.fault()
+            if fault is not None and fault[0] not in LATE_ERROR_STATUSES:
+                return self._count(endpoint, fault)
+        else:
+            fault = None
+
+        try:
+            status, headers, result = self.route(method, path, query, body)
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            status, headers, result = error(400, f"Malformed request: {e}")
+        if fault is not None:
+            return self._count(endpoint, fault)
+        return self._count(endpoint, (status, dict(rate_headers, **headers), result))
+
+    def _count(self, endpoint: str, response: Response) -> Response:
+        with self.lock:
+            self.requests[endpoint] += 1
+            self.statuses[str(response[0])] += 1
+        return response
+
+    def fault(self) -> Tuple[Optional[Response], Dict[str, str]]:
+        """
+        Rate-limit or randomly fail a request.
+
+        Returns:
+            Tuple of (fault response or None to let the request through,
+            rate-limit headers to add to the real response)
+        """
+        with self.lock:
+            headers = {}
+            if self.bucket is not None:
+                allowed, wait = self.bucket.take()
+                if not allowed:
+                    self.faults['throttled'] += 1
+                    return self._throttle_response(wait), headers
+                # Advertise the remaining budget like Jira Cloud does
+                remaining = int(self.bucket.tokens)
+                headers = {'X-RateLimit-Limit': str(int(self.bucket.capacity)),
+                           'X-RateLimit-Remaining': str(remaining)}
+                if remaining < self.bucket.capacity * 0.2:
+                    headers['X-RateLimit-NearLimit'] = 'true'
+
+            roll = self.random.random()
+            if roll < self.throttle_rate:
+                self.faults['injected_429'] += 1
+                return self._throttle_response(1.0), headers
+            if roll < self.throttle_rate + self.error_rate:
+                self.faults['injected_5xx'] += 1
+                return error(self.random.choice(INJECTED_ERROR_STATUSES), 'Injected failure'), headers
+        return None, headers
+
+    def _throttle_response(self, wait: float) -> Response:
+        retry_after = max(1, math.ceil(wait))
+        reset = datetime.now(timezone.utc) + timedelta(seconds=wait)
+        headers = {
+            'Retry-After': str(retry_after),
+            'X-RateLimit-Limit': str(int(self.bucket.capacity)) if self.bucket else '0',
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Reset': reset.isoformat(timespec='seconds').replace('+00:00', 'Z'),
+        }
+        return 429, headers, {'errorMessages': ['Rate limit exceeded']}
+
+    @staticmethod
+    def endpoint(method: str, path: str) -> str:
+        """Group a request under its endpoint, with issue keys and ids replaced."""
+        parts = path.rstrip('/').split('/')
+        for i in range(4, len(parts)):
+            if ISSUE_KEY_PATTERN.match(parts[i]) or parts[i].isdigit():
+                parts[i] = '{key}'
+        if len(parts) > 6 and parts[4:6] == ['issue', 'createmeta']:
+            parts[6] = '{project}'
+        return f"{method} {'/'.join(parts)}"
+
+    def route(self, method: str, path: str, query: Dict[str, List[str]],
+              body: Optional[object]) -> Response:
+        parts = path.rstrip('/').split('/')
+        if path == '/_fake/stats' and method == 'GET':
+            return 200, {}, self.stats()
+        if path == '/_fake/reset' and method == 'POST':
+            self.reset()
+            return 204, {}, None
+        if parts[:4] != ['', 'rest', 'api', '3'] or len(parts) < 5:
+            return error(404, 'Not found')
+
+        resource = parts[4:]
+        if resource == ['issue'] and method == 'POST':
+            return self.create_issue(body)
+        if resource == ['issue', 'bulk'] and method == 'POST':
+            return self.create_issues_bulk(body)
+        if resource[:2] == ['issue', 'createmeta'] and method == 'GET':
+            return self.createmeta(resource[2:], query)
+        if len(resource) == 2 and resource[0] == 'issue':
+            if method == 'GET':
+                return self.get_issue(resource[1], query)
+            if method == 'PUT':
+                return self.update_issue(resource[1], body)
+        if resource == ['issueLink'] and method == 'POST':
+            return self.create_link(body)
+        if resource == ['search'] and method in ('GET', 'POST'):
+            return self.search(body if method == 'POST' else self._query_body(query), legacy=True)
+        if resource == ['search', 'jql'] and method in ('GET', 'POST'):
+            return self.search(body if method == 'POST' else self._query_body(query), legacy=False)
+        return error(404, f"No fake for {method} {path}")
+
+    @staticmethod
+    def _query_body(query: Dict[str, List[str]]) -> Dict:
+        body = {key: values[-1] for key, values in query.items()}
+        if 'fields' in body:
+            body['fields'] = body['fields'].split(',')
+        return body
+
+    # Issues
+
+    def _field_errors(self, fields: Dict) -> Dict[str, str]:
+        """Field errors Jira would report for a create payload."""
+        errors = {}
+        project = (fields.get('project') or {}).get('key')
+        if project not in self.projects:
+            errors['project'] = 'valid project is required'
+        issue_type = (fields.get('issuetype') or {}).get('name')
+        if issue_type not in ISSUE_TYPES:
+            errors['issuetype'] = 'valid issue type is required'
+        if not str(fields.get('summary') or '').strip():
+            errors['summary'] = 'You must specify a summary of the issue.'
+        errors.update(self._update_errors(fields))
+        return errors
+
+    def _update_errors(self, fields: Dict) -> Dict[str, str]:
+        """Errors for the fields that can be set on create and update alike."""
+        errors = {}
+        if 'parent' in fields and (fields['parent'] or {}).get('key') not in self.issues:
+            errors['parent'] = 'Could not find issue by id or key.'
+        priority = fields.get('priority')
+        if priority is not None and priority.get('name') not in PRIORITIES:
+            errors['priority'] = "Specify a valid value for priority"
+        points = fields.get(self.story_points_field)
+        if points is not None and not isinstance(points, (int, float)):
+            errors[self.story_points_field] = 'Operation value must be a number.'
+        if 'labels' in fields and not all(isinstance(label, str) and ' ' not in label
+                                          for label in fields['labels'] or []):
+            errors['labels'] = 'The label must not contain spaces.'
+        return errors
+
+    def _create(self, payload: Dict) -> Tuple[Optional[Dict], Dict[str, str]]:
+        """Create one issue from a create payload; returns (issue, field errors)."""
+        fields = payload['fields']
+        errors = self._field_errors(fields)
+        links = ((payload.get('update') or {}).get('issuelinks') or [])
+        for operation in links:
+            add = operation.get('add') or {}
+            other = (add.get('inwardIssue') or add.get('outwardIssue') or {}).get('key')
+            if other not in self.issues:
+                errors['issuelinks'] = f"Issue {other} does not exist"
+        if errors:
+            return None, errors
+
+        project = fields['project']['key']
+        self.counters[project] += 1
+        issue = self._store(f"{project}-{self.counters[project]}", fields)
+        issue['properties'] = {prop['key']: prop['value'] for prop in payload.get('properties') or []}
+        for operation in links:
+            add = operation['add']
+            link_type = add['type']['name']
+            if 'inwardIssue' in add:
+                self._link(link_type, add['inwardIssue']['key'], issue['key'])
+            else:
+                self._link(link_type, issue['key'], add['outwardIssue']['key'])
+        return issue, {}
+
+    @staticmethod
+    def _created(issue: Dict) -> Dict:
+        return {'id': issue['id'], 'key': issue['key'], 'self': f"/rest/api/3/issue/{issue['id']}"}
+
+    def create_issue(self, body: Dict) -> Response:
+        with self.lock:
+            issue, errors = self._create(body)
+        if errors:
+            return error(400, **errors)
+        return 201, {}, self._created(issue)
+
+    def create_issues_bulk(self, body: Dict) -> Response:
+        updates = body['issueUpdates']
+        if len(updates) > BULK_LIMIT:
+            return error(400, f"The number of issues to create must not exceed {BULK_LIMIT}.")
+        issues = []
+        errors = []
+        with self.lock:
+            for position, payload in enumerate(updates):
+                issue, field_errors = self._create(payload)
+                if issue is None:
+                    errors.append({
+                        'status': 400,
+                        'failedElementNumber': position,
+                        'elementErrors': {'errorMessages': [], 'errors': field_errors},
+                    })
+                else:
+                    issues.append(self._created(issue))
+        return (201 if issues else 400), {}, {'issues': issues, 'errors': errors}
+
+    def get_issue(self, key: str, query: Dict[str, List[str]]) -> Response:
+        with self.lock:
+            issue = self.issues.get(key)
+            if issue is None:
+                return error(404, 'Issue does not exist or you do not have permission to see it.')
+            fields = query.get('fields', ['*all'])[-1].split(',')
+            return 200, {}, self._view(issue, fields)
+
+    def update_issue(self, key: str, body: Dict) -> Response:
+        with self.lock:
+            issue = self.issues.get(key)
+            if issue is None:
+                return error(404, 'Issue does not exist or you do not have permission to see it.')
+            fields = body.get('fields') or {}
+            errors = self._update_errors(fields)
+            for name in ('project', 'issuetype'):
+                if name in fields:
+                    errors[name] = f"Field '{name}' cannot be set. It is not on the appropriate screen, or unknown."
+            if errors:
+                return error(400, **errors)
+            issue['fields'].update(fields)
+        return 204, {}, None
+
+    @staticmethod
+    def _view(issue: Dict, fields: List[str], properties: Iterable[str] = ()) -> Dict:
+        if '*all' in fields or '*navigable' in fields:
+            selected = dict(issue['fields'])
+        else:
+            selected = {name: issue['fields'].get(name) for name in fields if name}
+        view = {'id': issue['id'], 'key': issue['key'], 'fields': selected}
+        if properties:
+            stored = issue.get('properties', {})
+            view['properties'] = {key: stored[key] for key in properties if key in stored}
+        return view
+
+    # Links
+
+    def _link(self, link_type: str, inward: str, outward: str):
+        """Record a link once, mirrored into both issues' ``issuelinks`` like Jira shows it."""
+        link = (link_type, inward, outward)
+        if link in self.links:
+            return
+        self.links.add(link)
+        self.issues[outward]['fields']['issuelinks'].append(
+            {'type': {'name': link_type}, 'inwardIssue': {'key': inward}})
+        self.issues[inward]['fields']['issuelinks'].append(
+            {'type': {'name': link_type}, 'outwardIssue': {'key': outward}})
+
+    def create_link(self, body: Dict) -> Response:
+        link_type = body['type']['name']
+        inward = body['inwardIssue']['key']
+        outward = body['outwardIssue']['key']
+        if link_type not in LINK_TYPES:
+            return error(404, f"No issue link type with name '{link_type}' found.")
+        with self.lock:
+            if inward not in self.issues or outward not in self.issues:
+                return error(404, 'Issue Does Not Exist')
+            self._link(link_type, inward, outward)
+        return 201, {}, None
+
+    # Search
+
+    def _match(self, jql: str) -> Tuple[Optional[List[str]], Optional[Response]]:
+        """Issue keys matching the small JQL subset the script uses."""
+        match = JQL_KEY_IN_PATTERN.match(jql) or JQL_KEY_EQUALS_PATTERN.match(jql)
+        if match:
+            keys = [key.strip().strip('"') for key in match.group(1).split(',') if key.strip()]
+            missing = [key for key in keys if key not in self.issues]
+            if missing:
+                return None, error(400, f"An issue with key '{missing[0]}' does not exist for field 'key'.")
+            return sorted(set(keys), key=lambda key: int(self.issues[key]['id']), reverse=True), None
+        match = JQL_PROJECT_PATTERN.match(jql)
+        if match:
+            project = match.group(1).upper()
+            if project not in self.projects:
+                return None, error(400, f"The value '{project}' does not exist for the field 'project'.")
+            keys = [key for key, issue in self.issues.items()
+                    if issue['fields'].get('project', {}).get('key') == project]
+            return sorted(keys, key=lambda key: int(self.issues[key]['id']), reverse=True), None
+        match = JQL_LABELS_PATTERN.match(jql)
+        if match:
+            keys = [key for key, issue in self.issues.items()
+                    if match.group(1) in (issue['fields'].get('labels') or [])]
+            return sorted(keys, key=lambda key: int(self.issues[key]['id']), reverse=True), None
+        return None, error(400, f"The fake only understands 'key in (...)', 'key = X', "
+                                f"'project = X' and 'labels = X', not: {jql}")
+
+    def search(self, body: Dict, legacy: bool) -> Response:
+        fields = body.get('fields') or (['*navigable'] if legacy else ['id'])
+        page_size = min(int(body.get('maxResults') or SEARCH_PAGE_SIZE), SEARCH_PAGE_SIZE)
+        if legacy:
+            start = int(body.get('startAt') or 0)
+        else:
+            start = int(body.get('nextPageToken') or 0)
+        with self.lock:
+            keys, failure = self._match(body.get('jql', ''))
+            if failure is not None:
+                return failure
+            properties = body.get('properties') or []
+            page = [self._view(self.issues[key], fields, properties) for key in keys[start:start + page_size]]
+        result = {'issues': page}
+        if legacy:
+            result.update({'startAt': start, 'maxResults': page_size, 'total': len(keys)})
+        elif start + page_size < len(keys):
+            result['nextPageToken'] = str(start + page_size)
+            result['isLast'] = False
+        else:
+            result['isLast'] = True
+        return 200, {}, result
+
+    # Create metadata
+
+    def createmeta(self, resource: List[str], query: Dict[str, List[str]]) -> Response:
+        if len(resource) < 2 or resource[1] != 'issuetypes':
+            return error(404, 'Not found')
+        project = resource[0]
+        if project not in self.projects:
+            return error(404, f"No project could be found with key '{project}'.")
+
+        if len(resource) == 2:
+            items = [{'id': str(position + 1), 'name': name, 'subtask': name == 'Sub-task'}
+                     for position, name in enumerate(ISSUE_TYPES)]
+            list_key = 'issueTypes'
+        else:
+            if not resource[2].isdigit() or not 1 <= int(resource[2]) <= len(ISSUE_TYPES):
+                return error(404, 'Issue type not found')
+            items = [
+                {'fieldId': 'summary', 'name': 'Summary', 'required': True},
+                {'fieldId': 'description', 'name': 'Description', 'required': False},
+                {'fieldId': 'parent', 'name': 'Parent', 'required': False},
+                {'fieldId': 'labels', 'name': 'Labels', 'required': False},
+                {'fieldId': 'priority', 'name': 'Priority', 'required': False,
+                 'allowedValues': [{'name': name} for name in PRIORITIES]},
+                {'fieldId': self.story_points_field, 'name': 'Story Points', 'required': False},
+            ]
+            list_key = 'fields'
+
+        start = int(query.get('startAt', ['0'])[-1])
+        page_size = int(query.get('maxResults', ['50'])[-1])
+        return 200, {}, {list_key: items[start:start + page_size], 'startAt': start,
+                         'maxResults': page_size, 'total': len(items)}
+
+    def stats(self) -> Dict:
+        """Counters for GET /_fake/stats."""
+        with self.lock:
+            return {
+                'requests': dict(self.requests),
+                'statuses': dict(self.statuses),
+                'faults': dict(self.faults),
+                'issues': len(self.issues),
+                'links': len(self.links),
+                'bytes_received': self.bytes_received,
+                'bytes_sent': self.bytes_sent,
+            }
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive front end for the FakeJira on the server."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'FakeJira/1.0'
+    # Headers and body go out in separate writes; with Nagle on, a keep-alive
+    # client's delayed ACK holds the body back by ~40 ms on every request
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _handle(self):
+        jira = self.server.jira
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+
+        if not url.path.startswith('/_fake/') and not self.headers.get('Authorization'):
+            status, headers, body = error(401, 'Client must be authenticated to access this resource.')
+        else:
+            try:
+                payload = json.loads(raw) if raw else None
+            except json.JSONDecodeError:
+                status, headers, body = error(400, 'Unexpected character in request body')
+            else:
+                status, headers, body = jira.handle(self.command, url.path, parse_qs(url.query), payload)
+
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        with jira.lock:
+            jira.bytes_received += len(raw)
+            jira.bytes_sent += len(data)
+        try:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if data:
+                self.send_header('Content-Type', 'application/json;charset=UTF-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away (a killed run, a timeout); nothing to answer
+            self.close_connection = True
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class FakeJiraServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server around a FakeJira.
+
+    Can run in the foreground (``serve_forever()``) or in a background
+    thread for in-process benchmarks:
+
+        with FakeJiraServer(FakeJira(latency=0.02)) as server:
+            server.start()
+            os.environ['JIRA_BASE_URL'] = server.url
+    """
+
+    daemon_threads = True
+
+    def __init__(self, jira: FakeJira, host: str = '127.0.0.1', port: int = 0, verbose: bool = False):
+        super().__init__((host, port), FakeJiraHandler)
+        self.jira = jira
+        self.verbose = verbose
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeJiraServer':
+        """Serve from a daemon thread and return immediately."""
+        self.thread = threading.Thread(target=self.serve_forever, name='fake-jira', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop a server started with ``start()`` and release its socket."""
+        self.shutdown()
+        self.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve an in-memory fake of the Jira REST API.")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument('--project', action='append', metavar='KEY',
+                        help="Project key that accepts issues; repeatable (default: PX)")
+    parser.add_argument('--existing', action='append', default=[], metavar='ISSUE_KEY',
+                        help="Issue that exists from the start, e.g. the Parent Epic; repeatable")
+    parser.add_argument('--story-points-field', default=DEFAULT_STORY_POINTS_FIELD,
+                        help=f"Custom field id for story points (default: {DEFAULT_STORY_POINTS_FIELD})")
+    parser.add_argument('--latency', type=float, default=0.0, metavar='SECONDS',
+                        help="Added to every API request (default: 0)")
+    parser.add_argument('--jitter', type=float, default=0.0, metavar='SECONDS',
+                        help="Random extra latency of up to this much (default: 0)")
+    parser.add_argument('--rate-limit', type=float, metavar='PER_SECOND',
+                        help="Answer 429 above this many requests per second (default: unlimited)")
+    parser.add_argument('--burst', type=float, metavar='N',
+                        help="Requests allowed back to back before the rate limit bites "
+                             "(default: one second's worth)")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, metavar='P',
+                        help="Probability of a spurious 429 per request (default: 0)")
+    parser.add_argument('--error-rate', type=float, default=0.0, metavar='P',
+                        help="Probability of a 500/502/503/504 per request (default: 0)")
+    parser.add_argument('--seed', type=int, help="Seed for latency jitter and injected faults")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    projects = args.project or list(DEFAULT_PROJECTS)
+    for key in args.existing:
+        match = ISSUE_KEY_PATTERN.match(key)
+        if not match:
+            sys.exit(f"❌ Error: --existing {key} is not an issue key")
+        if match.group(1) not in projects:
+            projects.append(match.group(1))
+
+    jira = FakeJira(
+        projects=projects,
+        story_points_field=args.story_points_field,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        existing=args.existing,
+        seed=args.seed,
+    )
+    server = FakeJiraServer(jira, args.host, args.port, verbose=args.verbose)
+    print(f"✓ Fake Jira listening on {server.url} (projects: {', '.join(projects)})")
+    print(f"  export JIRA_BASE_URL={server.url} JIRA_EMAIL=fake@example.com JIRA_TOKEN=fake")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping")
+    finally:
+        server.server_close()
+        print(json.dumps(jira.stats(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
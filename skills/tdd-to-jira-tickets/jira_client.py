@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the Jira REST API.
+
+One JiraClient wraps a single requests.Session so every ticket and link
+request reuses pooled keep-alive connections instead of paying for a new
+TCP/TLS handshake. Auth, default headers and timeouts are set once.
+
+Every request also passes through a shared RateLimiter: an adaptive token
+bucket that backs off when Jira answers 429/503 or reports it is near its
+limit, and creeps back up while requests succeed. Responses with a
+retryable status are retried with exponential backoff and jitter, honouring
+``Retry-After`` when Jira sends it.
+
+With a RunMetrics attached, every attempt's latency, status and body
+sizes are recorded per endpoint.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+
+from run_metrics import RunMetrics
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_BACKOFF_MAX = 60.0
+DEFAULT_MAX_REQUESTS_PER_SECOND = 100.0
+# Requests per second the rate regains for every second without throttling
+DEFAULT_RATE_STEP = 5.0
+
+# 429 and 503 mean "slow down"; the other 5xx are treated as transient failures
+THROTTLE_STATUSES = frozenset({429, 503})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Creating issues is not idempotent: after a 500/502/504 the issue may well
+# exist already, so creates are retried here only when Jira refused the
+# request, and the caller looks the issue up before sending it again
+CREATE_PATHS = frozenset({'/rest/api/3/issue', '/rest/api/3/issue/bulk'})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def parse_rate_limit_reset(value: Optional[str]) -> Optional[float]:
+    """Parse X-RateLimit-Reset (ISO 8601 timestamp or epoch seconds) into seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value) - time.time(), 0.0)
+    except ValueError:
+        pass
+    try:
+        reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max((reset_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket shared by every thread talking to Jira.
+
+    Without a starting ``rate`` the bucket opens at ``max_rate``, so the
+    client only slows down once the tenant pushes back. The rate then
+    follows additive-increase/multiplicative-decrease: it regains ``step``
+    requests per second for every second of successful traffic, and each
+    throttle signal halves it. A throttle with a known wait (Retry-After,
+    exhausted X-RateLimit-Remaining) also pauses the whole bucket until that
+    moment, so no thread keeps hammering the tenant.
+    """
+
+    def __init__(self, rate: Optional[float] = None,
+                 max_rate: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+                 min_rate: float = 0.5, step: float = DEFAULT_RATE_STEP):
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = min(max(rate or max_rate, self.min_rate), max_rate)
+        self.step = step
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.increased = self.updated
+        self.paused_until = 0.0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # Capacity of one second's worth of requests bounds the burst size
+        capacity = max(self.rate, 1.0)
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1.0:
+                        self.tokens -= 1.0
+                        return
+                    delay = (1.0 - self.tokens) / self.rate
+            time.sleep(delay)
+
+    def record_success(self):
+        """Additive increase after a request that was not throttled."""
+        with self.lock:
+            now = time.monotonic()
+            self.rate = min(self.max_rate, self.rate + self.step * (now - self.increased))
+            self.increased = now
+
+    def record_throttle(self, wait: Optional[float] = None, factor: float = 0.5):
+        """Multiplicative decrease, optionally pausing everyone for ``wait`` seconds."""
+        with self.lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * factor)
+            self.tokens = min(self.tokens, 0.0)
+            self.increased = time.monotonic()
+            if wait:
+                self.paused_until = max(self.paused_until, time.monotonic() + wait)
+
+    def observe(self, response: requests.Response):
+        """Adjust the bucket from Jira's rate-limit headers on any response."""
+        headers = response.headers
+        if response.status_code in THROTTLE_STATUSES:
+            self.record_throttle(parse_retry_after(headers.get('Retry-After')))
+            return
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.strip().lstrip('-').isdigit() and int(remaining) <= 0:
+            self.record_throttle(parse_rate_limit_reset(headers.get('X-RateLimit-Reset')))
+        elif headers.get('X-RateLimit-NearLimit', '').lower() == 'true':
+            self.record_throttle(factor=0.8)
+        elif response.status_code < 500:
+            self.record_success()
+
+
+class JiraClient:
+    """Pooled, keep-alive session for Jira REST API calls."""
+
+    def __init__(self, base_url: str, email: str, token: str,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: Tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_base: float = DEFAULT_BACKOFF_BASE,
+                 backoff_max: float = DEFAULT_BACKOFF_MAX,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 metrics: Optional[RunMetrics] = None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.metrics = metrics
+        self.retries = 0
+        self.stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.auth = HTTPBasicAuth(email, token)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
+
+        # Block instead of opening throwaway connections when every pooled one is busy
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+
+    def url(self, path: str) -> str:
+        """Return the absolute URL for an API path such as ``/rest/api/3/issue``."""
+        return f"{self.base_url}{path}"
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based), with full jitter."""
+        if retry_after is not None:
+            # Jira told us exactly when to come back; jitter only spreads the herd
+            return retry_after + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None,
+                params: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a request on the pooled session, throttled and retried.
+
+        429 and 5xx responses are retried up to ``max_retries`` times; the last
+        response is returned as-is so callers keep their own error reporting.
+        Issue creates are retried only on 429/503, when Jira did not process
+        them; retrying one after a 500/502/504 could create a duplicate.
+        Connect timeouts are retried too, since nothing reached Jira.
+        """
+        retry_statuses = THROTTLE_STATUSES if method == 'POST' and path in CREATE_PATHS else RETRY_STATUSES
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, self.url(path), json=payload, params=params,
+                                                timeout=self.timeout)
+            except requests.ConnectTimeout:
+                self._record(method, path, started, None, attempt)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+                print(f"    ↻ Connect timeout on {method} {path}, retrying in {delay:.1f}s "
+                      f"(attempt {attempt + 1}/{self.max_retries})")
+            except requests.RequestException:
+                self._record(method, path, started, None, attempt)
+                raise
+            else:
+                self._record(method, path, started, response, attempt)
+                self.rate_limiter.observe(response)
+                if response.status_code not in retry_statuses or attempt >= self.max_retries:
+                    return response
+                delay = self.backoff(attempt, parse_retry_after(response.headers.get('Retry-After')))
+                print(f"    ↻ HTTP {response.status_code} on {method} {path}, retrying in {delay:.1f}s "
+                      f"(attempt {attempt + 1}/{self.max_retries})")
+
+            with self.stats_lock:
+                self.retries += 1
+            attempt += 1
+            time.sleep(delay)
+
+    def _record(self, method: str, path: str, started: float, response: Optional[requests.Response],
+                attempt: int):
+        if self.metrics is None:
+            return
+        elapsed = time.perf_counter() - started
+        if response is None:
+            self.metrics.record_request(method, path, elapsed, None, 0, 0, retry=attempt > 0)
+            return
+        body = response.request.body
+        self.metrics.record_request(method, path, elapsed, response.status_code,
+                                    len(body) if body else 0, len(response.content), retry=attempt > 0)
+
+    def post(self, path: str, payload: Dict) -> requests.Response:
+        """POST a JSON payload."""
+        return self.request('POST', path, payload)
+
+    def get(self, path: str, params: Optional[Dict] = None) -> requests.Response:
+        """GET with query parameters."""
+        return self.request('GET', path, params=params)
+
+    def put(self, path: str, payload: Dict) -> requests.Response:
+        """PUT a JSON payload."""
+        return self.request('PUT', path, payload)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Report how well connections were reused and how often Jira pushed back.
+
+        Returns:
+            Dict with ``requests`` sent, ``connections`` opened, ``reused``
+            requests, ``retries`` sent and ``throttled`` responses
+        """
+        pools = self.adapter.poolmanager.pools
+        total_requests = 0
+        total_connections = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            total_requests += pool.num_requests
+            total_connections += pool.num_connections
+        return {
+            'requests': total_requests,
+            'connections': total_connections,
+            'reused': max(total_requests - total_connections, 0),
+            'retries': self.retries,
+            'throttled': self.rate_limiter.throttled,
+        }
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
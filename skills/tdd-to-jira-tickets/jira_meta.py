@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Cached Jira create metadata for local payload validation.
+
+An unknown issue type, a priority the project does not allow, or a story
+points field missing from the create screen used to surface only as a
+failed POST - once per ticket. CreateMeta keeps each project's create
+metadata on disk under ``~/.claude/cache``, keyed by Jira base URL and
+project key, and checks every payload against it before it is sent.
+
+A project's entry is refreshed only once it is older than the TTL: one
+paginated call for its issue types, plus one call for the fields of each
+issue type the plan actually uses. If the metadata cannot be fetched (for
+example, missing permissions), validation is skipped with a warning and
+Jira stays the judge.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+from jira_client import JiraClient
+from parse_cache import DEFAULT_CACHE_DIR
+
+
+DEFAULT_TTL = 24 * 60 * 60
+PAGE_SIZE = 50
+
+# Markers for projects that could not be described
+MISSING = 'missing'
+UNAVAILABLE = 'unavailable'
+
+
+class CreateMeta:
+    """Per-project issue types and create-screen fields, cached with a TTL."""
+
+    def __init__(self, client: JiraClient, story_points_field: str, ttl: float = DEFAULT_TTL,
+                 directory: Path = DEFAULT_CACHE_DIR, read_only: bool = False):
+        self.client = client
+        self.story_points_field = story_points_field
+        self.ttl = ttl
+        self.directory = Path(directory)
+        self.read_only = read_only  # use the cache but never write it, e.g. for --dry-run
+        self.projects = {}  # project key → metadata dict, MISSING or UNAVAILABLE
+
+    def _path(self, project_key: str) -> Path:
+        digest = hashlib.sha256(f"{self.client.base_url}\0{project_key}".encode('utf-8')).hexdigest()
+        return self.directory / f"createmeta-{digest[:32]}.json"
+
+    def _load(self, project_key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(project_key), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if time.time() - meta.get('fetched_at', 0) > self.ttl:
+            return None
+        return meta
+
+    def _save(self, project_key: str, meta: Dict):
+        if self.read_only:
+            return
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(temp_path, self._path(project_key))
+        except OSError as e:
+            print(f"⚠ Warning: Could not write create metadata cache: {e}")
+
+    def _get_all(self, path: str, *list_keys: str) -> List[Dict]:
+        """Collect every item of a startAt-paginated createmeta listing."""
+        items = []
+        start = 0
+        while True:
+            response = self.client.get(path, {'startAt': start, 'maxResults': PAGE_SIZE})
+            if response.status_code != 200:
+                raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+            page = response.json()
+            values = next((page[key] for key in list_keys if key in page), [])
+            items.extend(values)
+            start += len(values)
+            if not values or start >= page.get('total', start):
+                return items
+
+    def project(self, project_key: str):
+        """Return a project's metadata, fetching its issue types if the cache is stale."""
+        if project_key in self.projects:
+            return self.projects[project_key]
+
+        meta = self._load(project_key)
+        if meta is None:
+            try:
+                issue_types = self._get_all(f"/rest/api/3/issue/createmeta/{project_key}/issuetypes",
+                                            'issueTypes', 'values')
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                response = getattr(e, 'response', None)
+                if response is not None and response.status_code == 404:
+                    self.projects[project_key] = MISSING
+                    return MISSING
+                print(f"⚠ Warning: Could not load create metadata for {project_key} ({e}); "
+                      f"skipping local validation")
+                self.projects[project_key] = UNAVAILABLE
+                return UNAVAILABLE
+            meta = {
+                'fetched_at': time.time(),
+                'issue_types': {issue_type['name']: {'id': issue_type['id'], 'fields': None}
+                                for issue_type in issue_types},
+            }
+            self._save(project_key, meta)
+
+        self.projects[project_key] = meta
+        return meta
+
+    def issue_type_fields(self, project_key: str, issue_type: str) -> Optional[Dict[str, Dict]]:
+        """Return the create-screen fields of one issue type, fetching them on first use."""
+        meta = self.project(project_key)
+        entry = meta['issue_types'][issue_type]
+        if entry['fields'] is None:
+            try:
+                fields = self._get_all(
+                    f"/rest/api/3/issue/createmeta/{project_key}/issuetypes/{entry['id']}",
+                    'fields', 'values'
+                )
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                print(f"⚠ Warning: Could not load {issue_type} fields for {project_key} ({e})")
+                return None
+            entry['fields'] = {
+                field['fieldId']: {
+                    'name': field.get('name', field['fieldId']),
+                    'allowedValues': [value.get('name') for value in field['allowedValues']
+                                      if value.get('name')] if 'allowedValues' in field else None,
+                }
+                for field in fields
+            }
+            self._save(project_key, meta)
+        return entry['fields']
+
+    def problems(self, fields: Dict) -> List[str]:
+        """
+        Check a create payload's ``fields`` against the project's metadata.
+
+        Covers the values a plan typically gets wrong: issue type, priority
+        and the story points field.
+
+        Returns:
+            Human-readable problems; empty if the payload looks valid
+        """
+        project_key = fields['project']['key']
+        meta = self.project(project_key)
+        if meta == MISSING:
+            return [f"project {project_key} does not exist or is not visible"]
+        if meta == UNAVAILABLE:
+            return []
+
+        issue_type = fields['issuetype']['name']
+        if issue_type not in meta['issue_types']:
+            valid = ', '.join(sorted(meta['issue_types']))
+            return [f"issue type '{issue_type}' is not available in {project_key} (valid: {valid})"]
+
+        screen = self.issue_type_fields(project_key, issue_type)
+        if screen is None:
+            return []
+
+        problems = []
+        for field_id in ('priority', self.story_points_field):
+            if field_id not in fields:
+                continue
+            if field_id not in screen:
+                problems.append(f"{field_id} is not on the {issue_type} create screen in {project_key}")
+                continue
+            allowed = screen[field_id]['allowedValues']
+            value = fields[field_id]
+            if allowed and isinstance(value, dict) and value.get('name') not in allowed:
+                problems.append(f"{screen[field_id]['name']} '{value.get('name')}' is not allowed "
+                                f"(valid: {', '.join(allowed)})")
+        return problems
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of parsed plans.
+
+Reruns on an unchanged plan (retries, resumes) skip the mistletoe parse and
+ADF rendering entirely: the parsed Ticket records, ADF included, are
+pickled under ``~/.claude/cache`` keyed by the SHA-256 of the plan file and
+the parser version. Any edit to the file, or a parser change that bumps
+the version, simply misses.
+
+The cache is bounded by total size. Every hit refreshes an entry's mtime
+and the oldest entries are evicted first, so it behaves as an LRU. All
+cache failures are warnings; the plan is then parsed as usual.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from plan_ticket import Ticket
+
+
+DEFAULT_CACHE_DIR = Path.home() / '.claude' / 'cache' / 'tdd-to-jira-tickets'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ENTRY_SUFFIX = '.pickle'
+
+
+class ParseCache:
+    """Content-addressed store of parsed tickets with size-bounded LRU eviction."""
+
+    def __init__(self, version: str, directory: Path = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.version = version
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def key(self, markdown_file: str) -> str:
+        """Cache key for the current content of ``markdown_file``."""
+        digest = hashlib.sha256(self.version.encode('utf-8') + b'\0')
+        with open(markdown_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def load(self, key: str) -> Optional[List[Ticket]]:
+        """Return the cached tickets for ``key``, or None on a miss."""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                tickets = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError) as e:
+            print(f"⚠ Warning: Ignoring unreadable parse cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return tickets
+
+    def store(self, key: str, tickets: List[Ticket]):
+        """Write ``tickets`` under ``key`` atomically, then evict down to the size bound."""
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(tickets, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.path(key))
+            except BaseException:
+                self._remove(Path(temp_path))
+                raise
+        except OSError as e:
+            print(f"⚠ Warning: Could not write parse cache: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+CPU and memory profiling of each phase of a run.
+
+PhaseProfiler wraps every phase (parse, create, sync, write_back, links)
+in its own cProfile profiler and tracemalloc window. For each phase it
+writes a ``NN-<phase>.pstats`` file, loadable with ``pstats`` or
+snakeviz, and records wall and CPU time, peak traced memory and the
+lines that allocated the most memory during the phase. ``summary.txt``
+collects these, with the top functions by cumulative time.
+
+cProfile only sees the main thread: with ``--concurrency`` above one,
+request work done in worker threads appears as waiting in the main
+thread. CPU time is process-wide, so it still covers the workers.
+tracemalloc makes allocation-heavy phases noticeably slower while it is on.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional
+
+
+DEFAULT_TOP = 15
+
+# Allocation bookkeeping that would otherwise top every list
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class PhaseResult:
+    """What was measured for one phase."""
+
+    __slots__ = ('name', 'wall_seconds', 'cpu_seconds', 'peak_bytes', 'pstats_path',
+                 'top_functions', 'top_allocations')
+
+    def __init__(self, name: str, wall_seconds: float, cpu_seconds: float, peak_bytes: int,
+                 pstats_path: Path, top_functions: str, top_allocations: List[str]):
+        self.name = name
+        self.wall_seconds = wall_seconds
+        self.cpu_seconds = cpu_seconds
+        self.peak_bytes = peak_bytes
+        self.pstats_path = pstats_path
+        self.top_functions = top_functions
+        self.top_allocations = top_allocations
+
+    def line(self) -> str:
+        return (f"{self.name:<12} wall {self.wall_seconds:>8.2f}s  cpu {self.cpu_seconds:>8.2f}s  "
+                f"peak {self.peak_bytes / 1024 / 1024:>8.1f} MB  → {self.pstats_path.name}")
+
+
+class PhaseProfiler:
+    """Profile consecutive phases of a run into ``directory``."""
+
+    def __init__(self, directory: str, top: Optional[int] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.top = top or DEFAULT_TOP
+        self.results = []
+        self._phase = None
+        self._profile = None
+        self._snapshot = None
+        self._started = 0.0
+        self._cpu_started = 0.0
+        tracemalloc.start()
+
+    def begin(self, phase: Optional[str]):
+        """Finish the current phase, if any, and start profiling ``phase`` (None just finishes)."""
+        self._end()
+        if phase is None:
+            return
+        self._phase = phase
+        self._snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def _end(self):
+        if self._phase is None:
+            return
+        self._profile.disable()
+        wall = time.perf_counter() - self._started
+        cpu = time.process_time() - self._cpu_started
+        _, peak = tracemalloc.get_traced_memory()
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        growth = [str(difference) for difference in snapshot.compare_to(self._snapshot, 'lineno')[:self.top]]
+
+        path = self.directory / f"{len(self.results) + 1:02d}-{self._phase}.pstats"
+        self._profile.dump_stats(str(path))
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.strip_dirs().sort_stats('cumulative').print_stats(self.top)
+
+        self.results.append(PhaseResult(self._phase, wall, cpu, peak, path, stream.getvalue().strip(), growth))
+        self._phase = None
+        self._profile = None
+        self._snapshot = None
+
+    def finish(self) -> Path:
+        """Stop profiling and write ``summary.txt``; returns its path."""
+        self._end()
+        tracemalloc.stop()
+
+        lines = [f"Per-phase profile (top {self.top})", "=" * 80]
+        lines += [result.line() for result in self.results]
+        for result in self.results:
+            lines += ["", "-" * 80, f"{result.name}: top functions by cumulative time", "-" * 80,
+                      result.top_functions, "", f"{result.name}: top allocations (net change during phase)"]
+            lines += [f"  {allocation}" for allocation in result.top_allocations] or ["  (none)"]
+
+        path = self.directory / 'summary.txt'
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        return path
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Dependency graph for a ticket plan.
+
+The Blocks / Blocked By fields are parsed once into an integer-indexed
+graph stored in compressed sparse row form (an offsets array plus a flat
+targets array for each direction). Everything downstream - the creation
+scheduler, the link phase, the run summary - works off this one structure.
+
+All analyses are linear in tickets + edges, so plans with tens of
+thousands of tickets are cheap:
+- cycle detection (Tarjan's strongly connected components)
+- dangling references to keys that are not in the plan
+- topological levels (tickets that can be worked on in parallel)
+- critical path (longest chain, weighted by story points)
+
+Transitive reduction (drop A → C when A → B → C already implies it) uses
+per-component reachability bitsets; it is not linear but stays well under a
+second at 10k tickets.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from plan_ticket import TicketLike, as_ticket
+
+
+class DependencyGraph:
+    """Blocks graph over the logical keys of a plan; an edge runs blocker → blocked."""
+
+    def __init__(self, keys: Sequence[str], edges: Sequence[Tuple[int, int]],
+                 dangling: Optional[List[Tuple[str, str, str]]] = None):
+        self.keys = list(keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        # (ticket key, field, missing key) for references outside the plan
+        self.dangling = dangling or []
+        self.edge_count = len(edges)
+        self._edges = array('l')
+        for blocker, blocked in edges:
+            self._edges.append(blocker)
+            self._edges.append(blocked)
+        self._succ_offsets, self._succ = self._compress(edges, 0)
+        self._pred_offsets, self._pred = self._compress(edges, 1)
+        self._components = None
+
+    @classmethod
+    def from_tickets(cls, tickets: Sequence[TicketLike]) -> 'DependencyGraph':
+        """
+        Build the graph from parsed tickets.
+
+        Edges keep the order extract_dependencies has always produced: per
+        ticket, its Blocks entries and then its Blocked By entries, with
+        duplicates and self-references dropped.
+        """
+        tickets = [as_ticket(ticket) for ticket in tickets]
+        keys = [ticket.key for ticket in tickets]
+        index = {key: i for i, key in enumerate(keys)}
+        edges = []
+        seen = set()
+        dangling = []
+
+        def add(blocker: str, blocked: str, owner: str, field: str, other: str):
+            if other not in index:
+                dangling.append((owner, field, other))
+                return
+            edge = (index[blocker], index[blocked])
+            if edge[0] != edge[1] and edge not in seen:
+                seen.add(edge)
+                edges.append(edge)
+
+        for ticket in tickets:
+            key = ticket.key
+            for blocked in ticket.blocks:
+                add(key, blocked, key, 'Blocks', blocked)
+            for blocker in ticket.blocked_by:
+                add(blocker, key, key, 'Blocked By', blocker)
+
+        return cls(keys, edges, dangling)
+
+    def _compress(self, edges: Sequence[Tuple[int, int]], side: int) -> Tuple[array, array]:
+        """Counting-sort edges by one endpoint into CSR offsets/targets arrays."""
+        node_count = len(self.keys)
+        offsets = array('l', [0] * (node_count + 1))
+        for edge in edges:
+            offsets[edge[side] + 1] += 1
+        for i in range(node_count):
+            offsets[i + 1] += offsets[i]
+        targets = array('l', [0] * len(edges))
+        cursor = array('l', offsets[:-1])
+        for edge in edges:
+            source = edge[side]
+            targets[cursor[source]] = edge[1 - side]
+            cursor[source] += 1
+        return offsets, targets
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def successor_ids(self, i: int) -> array:
+        """Indices of tickets blocked by ticket ``i``."""
+        return self._succ[self._succ_offsets[i]:self._succ_offsets[i + 1]]
+
+    def predecessor_ids(self, i: int) -> array:
+        """Indices of tickets blocking ticket ``i``."""
+        return self._pred[self._pred_offsets[i]:self._pred_offsets[i + 1]]
+
+    def blocks(self, key: str) -> List[str]:
+        """Logical keys that ``key`` blocks."""
+        if key not in self.index:
+            return []
+        return [self.keys[j] for j in self.successor_ids(self.index[key])]
+
+    def blockers(self, key: str) -> List[str]:
+        """Logical keys that block ``key``."""
+        if key not in self.index:
+            return []
+        return [self.keys[j] for j in self.predecessor_ids(self.index[key])]
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        """Yield (blocker, blocked) logical key pairs in plan order."""
+        keys = self.keys
+        for i in range(0, len(self._edges), 2):
+            yield keys[self._edges[i]], keys[self._edges[i + 1]]
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Tarjan's algorithm, iterative so deep chains can't hit the recursion limit.
+
+        Returns:
+            Components as lists of ticket indices, in reverse topological order
+        """
+        if self._components is not None:
+            return self._components
+
+        node_count = len(self.keys)
+        order = [-1] * node_count
+        low = [0] * node_count
+        on_stack = [False] * node_count
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(node_count):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, self._succ_offsets[root])]
+            while work:
+                v, position = work[-1]
+                if position < self._succ_offsets[v + 1]:
+                    work[-1] = (v, position + 1)
+                    w = self._succ[position]
+                    if order[w] == -1:
+                        order[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, self._succ_offsets[w]))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], order[w])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == order[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+
+        self._components = components
+        return components
+
+    def cycles(self) -> List[List[str]]:
+        """Groups of tickets that block each other, each in plan order."""
+        return [
+            [self.keys[i] for i in sorted(component)]
+            for component in self.strongly_connected_components()
+            if len(component) > 1
+        ]
+
+    def _condensation_order(self) -> Tuple[List[List[int]], List[int]]:
+        """Components in topological order, plus each ticket's component number."""
+        components = list(reversed(self.strongly_connected_components()))
+        component_of = [0] * len(self.keys)
+        for c, component in enumerate(components):
+            for i in component:
+                component_of[i] = c
+        return components, component_of
+
+    def topological_levels(self) -> List[List[str]]:
+        """
+        Group tickets by dependency depth.
+
+        Level 0 has no blockers in the plan; every other ticket sits one level
+        below its deepest blocker. Tickets in a cycle share a level. Within a
+        level, tickets keep plan order.
+        """
+        components, component_of = self._condensation_order()
+        level = [0] * len(components)
+        for c, component in enumerate(components):
+            for i in component:
+                for j in self.successor_ids(i):
+                    d = component_of[j]
+                    if d != c and level[d] < level[c] + 1:
+                        level[d] = level[c] + 1
+
+        levels = [[] for _ in range(max(level) + 1)] if components else []
+        for i, key in enumerate(self.keys):
+            levels[level[component_of[i]]].append(key)
+        return levels
+
+    def critical_path(self, weights: Optional[Dict[str, float]] = None) -> Tuple[List[str], float]:
+        """
+        Longest chain of blocking tickets.
+
+        Args:
+            weights: Optional logical key → weight (e.g. story points); defaults to 1 each
+
+        Returns:
+            Tuple of (logical keys along the path, total weight). A cycle on the
+            path contributes all of its tickets.
+        """
+        if not self.keys:
+            return [], 0.0
+
+        components, component_of = self._condensation_order()
+        weight = [0.0] * len(components)
+        for c, component in enumerate(components):
+            for i in component:
+                weight[c] += weights.get(self.keys[i], 0.0) if weights is not None else 1.0
+
+        best_before = [0.0] * len(components)
+        previous = [-1] * len(components)
+        total = [0.0] * len(components)
+        for c, component in enumerate(components):
+            total[c] = best_before[c] + weight[c]
+            for i in component:
+                for j in self.successor_ids(i):
+                    d = component_of[j]
+                    if d != c and total[c] > best_before[d]:
+                        best_before[d] = total[c]
+                        previous[d] = c
+
+        end = max(range(len(components)), key=total.__getitem__)
+        chain = []
+        c = end
+        while c != -1:
+            chain.append(c)
+            c = previous[c]
+
+        path = []
+        for c in reversed(chain):
+            path.extend(self.keys[i] for i in sorted(components[c]))
+        return path, total[end]
+
+    def transitive_reduction(self) -> 'DependencyGraph':
+        """
+        Drop edges implied by longer paths.
+
+        Works on the condensation so cycles are left intact: an edge between
+        two different components is removed when its target component is
+        reachable from its source through some other successor. Reachability
+        is tracked as one integer bitset per component, visited in reverse
+        topological order; a component's direct successors are checked in
+        topological order, so anything reachable through an earlier
+        successor is already in the set when a later one is considered.
+
+        Returns:
+            A new graph with the same tickets and the minimal set of edges
+        """
+        components, component_of = self._condensation_order()
+        successor_components = [set() for _ in components]
+        for c, component in enumerate(components):
+            for i in component:
+                for j in self.successor_ids(i):
+                    d = component_of[j]
+                    if d != c:
+                        successor_components[c].add(d)
+
+        reachable = [0] * len(components)
+        redundant = set()
+        for c in range(len(components) - 1, -1, -1):
+            seen = 0
+            for d in sorted(successor_components[c]):
+                if seen >> d & 1:
+                    redundant.add((c, d))
+                else:
+                    seen |= reachable[d] | (1 << d)
+            reachable[c] = seen
+
+        kept = []
+        for i in range(0, len(self._edges), 2):
+            blocker, blocked = self._edges[i], self._edges[i + 1]
+            if (component_of[blocker], component_of[blocked]) not in redundant:
+                kept.append((blocker, blocked))
+        return DependencyGraph(self.keys, kept, self.dangling)
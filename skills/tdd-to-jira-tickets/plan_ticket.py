@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Compact record for one ticket of a plan.
+
+Parsing used to produce an 11-key dict of strings per ticket, with Labels,
+Blocks and Is Blocked By pipe-joined and split again by every stage that
+needed them. A Ticket parses each field once: logical keys are interned,
+multi-valued fields are tuples and story points are converted to a float
+up front.
+
+Tickets still answer the old dict interface (``ticket['Labels']``,
+``ticket.get('Jira Key', '')``, ``ticket.items()``) with the same
+pipe-joined strings, so callers written against the dicts keep working,
+and ``as_ticket()`` turns such a dict into a Ticket.
+
+Parsed tickets keep only the description's ADF; the plain-text
+``description`` is derived from it the first time something asks.
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+
+# Dict field name → attribute, in the order the dicts always had
+FIELD_ATTRIBUTES = {
+    'Key': 'key',
+    'Summary': 'summary',
+    'Description': 'description',
+    'Issue Type': 'issue_type',
+    'Parent': 'parent',
+    'Labels': 'labels',
+    'Priority': 'priority',
+    'Story Points': 'story_points',
+    'Blocks': 'blocks',
+    'Is Blocked By': 'blocked_by',
+    'Jira Key': 'jira_key',
+    'Description ADF': 'description_adf',
+}
+
+# Fields held as tuples but presented pipe-joined through the dict view
+LIST_FIELDS = frozenset({'Labels', 'Blocks', 'Is Blocked By'})
+
+
+def split_values(value: str, separator: str = '|') -> Tuple[str, ...]:
+    """Split a joined field into stripped, non-empty values."""
+    return tuple(part.strip() for part in value.split(separator) if part.strip())
+
+
+def intern_keys(keys: Iterable[str]) -> Tuple[str, ...]:
+    """Intern ticket keys so the many references to one key share a string."""
+    return tuple(sys.intern(key) for key in keys)
+
+
+class Ticket:
+    """One ticket of the plan, as parsed from its markdown section."""
+
+    __slots__ = (
+        'key', 'summary', '_description', 'issue_type', 'parent', 'labels', 'priority',
+        '_story_points', 'points', 'blocks', 'blocked_by', 'jira_key', 'description_adf',
+    )
+
+    def __init__(self, key: str, summary: str = '', description: str = '', issue_type: str = '',
+                 parent: str = '', labels: Iterable[str] = (), priority: str = '',
+                 story_points: str = '', blocks: Iterable[str] = (), blocked_by: Iterable[str] = (),
+                 jira_key: str = '', description_adf: Optional[Dict] = None):
+        self.key = sys.intern(key)
+        self.summary = summary
+        self._description = description
+        self.issue_type = issue_type
+        self.parent = sys.intern(parent)
+        self.labels = tuple(labels)
+        self.priority = priority
+        self.story_points = story_points
+        self.blocks = intern_keys(blocks)
+        self.blocked_by = intern_keys(blocked_by)
+        self.jira_key = jira_key
+        self.description_adf = description_adf
+
+    @property
+    def description(self) -> str:
+        """Description as plain text, derived from ``description_adf`` when not given."""
+        if not self._description and self.description_adf:
+            self._description = adf_text(self.description_adf)
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+
+    @property
+    def story_points(self) -> str:
+        """Story points as written in the plan; ``points`` holds the parsed float."""
+        return self._story_points
+
+    @story_points.setter
+    def story_points(self, value: str):
+        self._story_points = value
+        try:
+            self.points = float(value) if value.strip() else None
+        except ValueError:
+            self.points = None
+
+    @classmethod
+    def from_dict(cls, row: Mapping[str, object]) -> 'Ticket':
+        """Build a Ticket from the dict form, splitting pipe-joined fields."""
+        ticket = cls(row.get('Key', ''))
+        for field, value in row.items():
+            if field in FIELD_ATTRIBUTES and field != 'Key':
+                ticket[field] = value
+        return ticket
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the ticket in its dict form."""
+        return dict(self.items())
+
+    # Dict-compatible view
+
+    def __getitem__(self, field: str):
+        attribute = FIELD_ATTRIBUTES.get(field)
+        if attribute is None:
+            raise KeyError(field)
+        value = getattr(self, attribute)
+        return '|'.join(value) if field in LIST_FIELDS else value
+
+    def __setitem__(self, field: str, value):
+        attribute = FIELD_ATTRIBUTES.get(field)
+        if attribute is None:
+            raise KeyError(field)
+        if field == 'Labels':
+            value = split_values(value)
+        elif field in LIST_FIELDS:
+            value = intern_keys(split_values(value))
+        elif field in ('Key', 'Parent'):
+            value = sys.intern(value)
+        setattr(self, attribute, value)
+
+    def get(self, field: str, default=None):
+        return self[field] if field in FIELD_ATTRIBUTES else default
+
+    def __contains__(self, field: object) -> bool:
+        return field in FIELD_ATTRIBUTES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELD_ATTRIBUTES)
+
+    def __len__(self) -> int:
+        return len(FIELD_ATTRIBUTES)
+
+    def keys(self) -> Iterable[str]:
+        return FIELD_ATTRIBUTES.keys()
+
+    def values(self) -> Iterator:
+        return (self[field] for field in FIELD_ATTRIBUTES)
+
+    def items(self) -> Iterator[Tuple[str, object]]:
+        return ((field, self[field]) for field in FIELD_ATTRIBUTES)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Ticket):
+            return all(getattr(self, attribute) == getattr(other, attribute)
+                       for attribute in FIELD_ATTRIBUTES.values())
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return tuple(getattr(self, attribute) for attribute in self.__slots__)
+
+    def __setstate__(self, state):
+        for attribute, value in zip(self.__slots__, state):
+            setattr(self, attribute, value)
+
+    def __repr__(self) -> str:
+        return f"Ticket({self.key!r}, {self.summary!r})"
+
+
+def adf_text(node: Dict) -> str:
+    """
+    Plain text of an ADF document: blocks separated by blank lines, list
+    items as ``- item`` and headings with their ``#`` marks.
+    """
+    return '\n\n'.join(_adf_blocks(node)).strip()
+
+
+def _adf_blocks(node: Dict) -> Iterator[str]:
+    kind = node.get('type')
+    if kind == 'heading':
+        yield f"{'#' * node.get('attrs', {}).get('level', 1)} {_adf_inline(node)}"
+    elif kind in ('paragraph', 'codeBlock'):
+        yield _adf_inline(node)
+    elif kind == 'listItem':
+        yield '- ' + ' '.join(_adf_blocks({'content': node.get('content', [])}))
+    elif kind == 'tableRow':
+        yield ' | '.join(' '.join(_adf_blocks(cell)) for cell in node.get('content', []))
+    else:
+        for child in node.get('content', []):
+            yield from _adf_blocks(child)
+
+
+def _adf_inline(node: Dict) -> str:
+    parts = []
+    for child in node.get('content', []):
+        if child.get('type') == 'text':
+            parts.append(child.get('text', ''))
+        elif child.get('type') == 'hardBreak':
+            parts.append('\n')
+        else:
+            parts.append(_adf_inline(child))
+    return ''.join(parts)
+
+
+TicketLike = Union[Ticket, Mapping[str, object]]
+
+
+def as_ticket(row: TicketLike) -> Ticket:
+    """Return ``row`` as a Ticket, converting the dict form if needed."""
+    return row if isinstance(row, Ticket) else Ticket.from_dict(row)
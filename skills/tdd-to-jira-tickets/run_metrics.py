@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Timing and request metrics for one run.
+
+RunMetrics records how long each phase took (parsing, ticket creation,
+sync, markdown write-back, linking) and, through JiraClient, every HTTP
+attempt: latency, status, retries and body bytes in each direction,
+grouped by endpoint (``POST /rest/api/3/issue``, ``PUT
+/rest/api/3/issue/{key}``, ...).
+
+The result can be written as JSON with p50/p95/p99 latencies per
+endpoint, or as a Prometheus textfile (for node_exporter's textfile
+collector) with the latencies as histograms.
+"""
+
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PROMETHEUS_PREFIX = 'jira_tickets'
+
+ISSUE_KEY_SEGMENT = re.compile(r'^(?:[A-Z][A-Z0-9_]*-\d+|\d+)$')
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Group a request path under its endpoint, with issue keys and ids replaced."""
+    parts = path.split('?', 1)[0].rstrip('/').split('/')
+    for i in range(4, len(parts)):
+        if ISSUE_KEY_SEGMENT.match(parts[i]):
+            parts[i] = '{key}'
+    if len(parts) > 6 and parts[4:6] == ['issue', 'createmeta']:
+        parts[6] = '{project}'
+    return f"{method} {'/'.join(parts)}"
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+class EndpointStats:
+    """Every attempt made against one endpoint."""
+
+    __slots__ = ('latencies', 'statuses', 'retries', 'bytes_sent', 'bytes_received')
+
+    def __init__(self):
+        self.latencies = []
+        self.statuses = {}  # status code, or 'error' for no response → count
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def histogram(self) -> Dict[str, int]:
+        """Cumulative bucket counts keyed by upper bound, Prometheus style."""
+        counts = {}
+        for bound in LATENCY_BUCKETS:
+            counts[f"{bound:g}"] = sum(1 for latency in self.latencies if latency <= bound)
+        counts['+Inf'] = len(self.latencies)
+        return counts
+
+    def to_dict(self) -> Dict:
+        ordered = sorted(self.latencies)
+        return {
+            'count': len(ordered),
+            'retries': self.retries,
+            'errors': sum(count for status, count in self.statuses.items()
+                          if status == 'error' or int(status) >= 400),
+            'statuses': dict(sorted(self.statuses.items())),
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'latency_seconds': {
+                'p50': round(percentile(ordered, 50), 6),
+                'p95': round(percentile(ordered, 95), 6),
+                'p99': round(percentile(ordered, 99), 6),
+                'max': round(ordered[-1], 6) if ordered else 0.0,
+                'mean': round(sum(ordered) / len(ordered), 6) if ordered else 0.0,
+            },
+            'histogram': self.histogram(),
+        }
+
+
+class RunMetrics:
+    """Phase wall times, outcome counts and per-endpoint request stats for one run."""
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.phases = {}  # phase → seconds, in the order phases began
+        self.counts = {}  # e.g. tickets_created → count
+        self.endpoints = {}  # endpoint → EndpointStats
+        self._phase = None
+        self._phase_started = 0.0
+        self.lock = threading.Lock()
+
+    def begin(self, phase: Optional[str]):
+        """End the current phase, if any, and start timing ``phase`` (None just ends it)."""
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.phases[self._phase] = self.phases.get(self._phase, 0.0) + now - self._phase_started
+        self._phase = phase
+        self._phase_started = now
+
+    def count(self, name: str, value: int):
+        self.counts[name] = value
+
+    def record_request(self, method: str, path: str, seconds: float, status: Optional[int],
+                       bytes_sent: int, bytes_received: int, retry: bool):
+        """Record one HTTP attempt; ``status`` is None when no response came back."""
+        endpoint = endpoint_name(method, path)
+        key = str(status) if status is not None else 'error'
+        with self.lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = EndpointStats()
+            stats.latencies.append(seconds)
+            stats.statuses[key] = stats.statuses.get(key, 0) + 1
+            stats.retries += retry
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+
+    def to_dict(self) -> Dict:
+        self.begin(None)
+        with self.lock:
+            endpoints = {name: stats.to_dict() for name, stats in sorted(self.endpoints.items())}
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'wall_seconds': round(time.perf_counter() - self.started, 6),
+            'phases': {phase: round(seconds, 6) for phase, seconds in self.phases.items()},
+            'counts': dict(self.counts),
+            'requests': {
+                'total': sum(endpoint['count'] for endpoint in endpoints.values()),
+                'retries': sum(endpoint['retries'] for endpoint in endpoints.values()),
+                'errors': sum(endpoint['errors'] for endpoint in endpoints.values()),
+                'bytes_sent': sum(endpoint['bytes_sent'] for endpoint in endpoints.values()),
+                'bytes_received': sum(endpoint['bytes_received'] for endpoint in endpoints.values()),
+            },
+            'endpoints': endpoints,
+        }
+
+    def write_json(self, path: str):
+        _write_atomically(path, json.dumps(self.to_dict(), indent=2) + '\n')
+
+    def write_prometheus(self, path: str):
+        """Write the metrics in the Prometheus text exposition format."""
+        data = self.to_dict()
+        p = PROMETHEUS_PREFIX
+        lines = [
+            f"# HELP {p}_run_seconds Wall time of the whole run.",
+            f"# TYPE {p}_run_seconds gauge",
+            f"{p}_run_seconds {data['wall_seconds']}",
+            f"# HELP {p}_run_timestamp_seconds When the run started.",
+            f"# TYPE {p}_run_timestamp_seconds gauge",
+            f"{p}_run_timestamp_seconds {self.started_at.timestamp():.0f}",
+            f"# HELP {p}_phase_seconds Wall time per phase.",
+            f"# TYPE {p}_phase_seconds gauge",
+        ]
+        lines += [f"{p}_phase_seconds{_labels(phase=phase)} {seconds}" for phase, seconds in data['phases'].items()]
+        lines += [f"# HELP {p}_outcome Tickets and links by outcome.", f"# TYPE {p}_outcome gauge"]
+        lines += [f"{p}_outcome{_labels(outcome=name)} {value}" for name, value in data['counts'].items()]
+
+        endpoints = data['endpoints']
+        lines += [f"# HELP {p}_requests_total HTTP attempts by endpoint and status.",
+                  f"# TYPE {p}_requests_total counter"]
+        for endpoint, stats in endpoints.items():
+            for status, count in stats['statuses'].items():
+                lines.append(f"{p}_requests_total{_labels(endpoint=endpoint, status=status)} {count}")
+        for metric, key, help_text in (
+            ('request_retries_total', 'retries', 'Attempts that were retries of an earlier one.'),
+            ('request_sent_bytes_total', 'bytes_sent', 'Request body bytes sent.'),
+            ('request_received_bytes_total', 'bytes_received', 'Response body bytes received.'),
+        ):
+            lines += [f"# HELP {p}_{metric} {help_text}", f"# TYPE {p}_{metric} counter"]
+            lines += [f"{p}_{metric}{_labels(endpoint=endpoint)} {stats[key]}"
+                      for endpoint, stats in endpoints.items()]
+
+        lines += [f"# HELP {p}_request_duration_seconds Latency of HTTP attempts.",
+                  f"# TYPE {p}_request_duration_seconds histogram"]
+        with self.lock:
+            for endpoint, stats in sorted(self.endpoints.items()):
+                for bound, count in stats.histogram().items():
+                    lines.append(f"{p}_request_duration_seconds_bucket{_labels(endpoint=endpoint, le=bound)} {count}")
+                lines.append(f"{p}_request_duration_seconds_sum{_labels(endpoint=endpoint)} "
+                             f"{round(sum(stats.latencies), 6)}")
+                lines.append(f"{p}_request_duration_seconds_count{_labels(endpoint=endpoint)} "
+                             f"{len(stats.latencies)}")
+        _write_atomically(path, '\n'.join(lines) + '\n')
+
+
+def _escape(value: object) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: object) -> str:
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _write_atomically(path: str, text: str):
+    """Replace ``path`` in one step so collectors never read a half-written file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
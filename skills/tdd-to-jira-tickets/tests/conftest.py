@@ -0,0 +1,8 @@
+"""Make the skill's modules and benchmark helpers importable from the tests."""
+
+import sys
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR))
+sys.path.insert(0, str(SKILL_DIR / 'benchmarks'))
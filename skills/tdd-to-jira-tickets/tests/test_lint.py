@@ -0,0 +1,66 @@
+"""
+--check reads metadata lines with regular expressions instead of mistletoe,
+so it must see the same fields the full parse does, whichever side of the
+closing ``**`` the colon is written on.
+"""
+
+import pytest
+
+import create_jira_tickets_and_links as tool
+
+FIELDS = ('key', 'summary', 'issue_type', 'parent', 'labels', 'priority', 'story_points',
+          'blocks', 'blocked_by', 'jira_key')
+
+PLAN = """\
+# Plan
+
+## M1-DB-1: Create the schema
+**Type**: Task
+**Parent**: PX-100
+**Labels**: backend, database
+**Priority**: High
+**Story Points**: 3
+**Blocks**: M1-API-1, M1-API-2
+**Jira Key**: PX-101
+
+### Description
+Tables for users and sessions.
+
+## M1-API-1: Users endpoint
+**Type:** Story
+**Story Points** : 5
+**Blocked By:** M1-DB-1
+
+### Description
+**Note**: not metadata, this is the description.
+
+## M1-API-2: Sessions endpoint
+**Type**:Story
+**Story Points**: lots
+**Blocked By**: M1-DB-1, M1-DB-9
+"""
+
+
+def fields(ticket):
+    return {name: getattr(ticket, name) for name in FIELDS}
+
+
+def test_metadata_matches_full_parse():
+    parsed = tool.parse_markdown_tickets(PLAN)
+    linted = [tool.read_ticket_metadata(section, start)[0]
+              for start, section in tool.iter_numbered_sections(PLAN.splitlines())]
+    assert [fields(ticket) for ticket in linted] == [fields(ticket) for ticket in parsed]
+    assert parsed[0].story_points == '3'
+    assert parsed[1].blocked_by == ('M1-DB-1',)
+
+
+@pytest.mark.parametrize('line', ['**Story Points:** many', '**Story Points**: many',
+                                  '**Story Points** : many'])
+def test_lint_reads_either_colon_placement(monkeypatch, line):
+    monkeypatch.setattr(tool, 'default_project_key', lambda: 'PX')
+    plan = f"## M1-DB-1: Create the schema\n{line}\n**Blocks**: M1-DB-2\n"
+    count, problems = tool.lint_plan(plan.splitlines())
+    assert count == 1
+    assert [line for line, _ in problems] == [2, 3]
+    assert "Story Points 'many' is not a number" in problems[0][1]
+    assert 'M1-DB-2' in problems[1][1]
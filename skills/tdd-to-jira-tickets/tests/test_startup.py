@@ -0,0 +1,30 @@
+"""
+Lazy-import guard: the paths that never talk to Jira must not import
+requests, mistletoe, the Jira client, the profilers or the config before
+they need them. benchmarks/bench_startup.py runs the same probe and adds
+timings.
+"""
+
+import os
+
+import pytest
+
+from bench_startup import SCENARIOS, probe, scenario_args
+from plan_generator import generate_plan
+
+
+@pytest.fixture
+def home(tmp_path):
+    """An empty HOME with a small plan; no user config, no Jira credentials."""
+    (tmp_path / 'plan.md').write_text(generate_plan(20), encoding='utf-8')
+    env = {key: value for key, value in os.environ.items() if not key.startswith('JIRA_')}
+    env['HOME'] = str(tmp_path)
+    return tmp_path, env
+
+
+@pytest.mark.parametrize('scenario', list(SCENARIOS))
+def test_nothing_heavy_imported_after_parsing_args(home, scenario):
+    path, env = home
+    result = probe(scenario_args(scenario, str(path / 'plan.md')), 1, env, str(path))
+    assert result['loaded'] == []
+    assert not result['config_loaded']